@@ -11,18 +11,47 @@ Copyright (c) 2025
 """
 
 # Global version number - increment after every change
-SCRIPT_VERSION = "10.6.7"
+SCRIPT_VERSION = "10.6.117"
 
 import obspython as obs
 import ctypes
 import platform
+import sys
 import time
 import math
+import json
+import re
 import traceback
+import threading
+import functools
+import contextlib
+import gc
+
+# Host platform, resolved once at import
+PLATFORM_NAME = platform.system()
+IS_WINDOWS = PLATFORM_NAME == "Windows"
+IS_LINUX = PLATFORM_NAME == "Linux"
+IS_MACOS = PLATFORM_NAME == "Darwin"
 
 # Special value for scene dimensions option
 USE_SCENE_DIMENSIONS = "::USE_SCENE_DIMENSIONS::"
 
+# Loose match for stored variants of the option: contains "::", "scene" and "dimension" in any order
+USE_SCENE_DIMENSIONS_MARKERS_RE = re.compile(r"(?=.*::)(?=.*scene)(?=.*dimension)", re.IGNORECASE | re.DOTALL)
+
+# OBS alignment/bounds constants, resolved once (fallbacks are the typical libobs values)
+ALIGN_CENTER = getattr(obs, "OBS_ALIGN_CENTER", 0x0010)
+ALIGN_TOP_LEFT = getattr(obs, "OBS_ALIGN_LEFT", 0x0001) | getattr(obs, "OBS_ALIGN_TOP", 0x0004)
+BOUNDS_NONE = getattr(obs, "OBS_BOUNDS_NONE", 0)
+
+# Direct UUID lookup (OBS 29+), None on older versions where sources must be enumerated
+OBS_GET_SOURCE_BY_UUID = getattr(obs, "obs_get_source_by_uuid", None)
+
+# Source UUID accessors (OBS 31+), resolved once; sources fall back to "name:id" identifiers without them
+OBS_SOURCE_GET_UUID = getattr(obs, "obs_source_get_uuid", None)
+OBS_SOURCE_GET_UUID_STR = getattr(obs, "obs_source_get_uuid_str", None)
+HAS_SOURCE_UUID = OBS_SOURCE_GET_UUID is not None and OBS_SOURCE_GET_UUID_STR is not None
+
 # Try to import wintypes separately to avoid attribute error
 try:
     from ctypes import wintypes
@@ -30,116 +59,353 @@ try:
 except ImportError:
     WINTYPES_AVAILABLE = False
 
+# Win32 cursor query resolved once at import so the per-frame mouse read is a single
+# foreign call (private WinDLL handle so argtypes don't leak into other scripts)
+g_get_cursor_pos = None
+g_cursor_point = None
+g_cursor_point_ref = None
+if IS_WINDOWS:
+    try:
+        if WINTYPES_AVAILABLE:
+            POINT = wintypes.POINT
+        else:
+            class POINT(ctypes.Structure):
+                _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
+        g_get_cursor_pos = ctypes.WinDLL("user32").GetCursorPos
+        g_get_cursor_pos.argtypes = [ctypes.POINTER(POINT)]
+        g_get_cursor_pos.restype = ctypes.c_int
+        g_cursor_point = POINT()
+        g_cursor_point_ref = ctypes.byref(g_cursor_point)
+    except Exception as e:
+        g_get_cursor_pos = None
+        print(f"[Mouse Pan & Zoom] Error resolving GetCursorPos: {e}")
+
+# Win32 monitor enumeration structures and callback, built once at import
+# (Structure subclassing and WINFUNCTYPE trampolines are expensive to recreate per call)
+g_enum_monitors_proc = None
+g_enumerated_monitors = []
+if IS_WINDOWS:
+    try:
+        class RECT(ctypes.Structure):
+            _fields_ = [
+                ('left', ctypes.c_long),
+                ('top', ctypes.c_long),
+                ('right', ctypes.c_long),
+                ('bottom', ctypes.c_long)
+            ]
+        
+        class MONITORINFO(ctypes.Structure):
+            _fields_ = [
+                ('cbSize', ctypes.c_ulong),
+                ('rcMonitor', RECT),
+                ('rcWork', RECT),
+                ('dwFlags', ctypes.c_ulong)
+            ]
+        
+        # Define callback function type
+        MONITORENUMPROC = ctypes.WINFUNCTYPE(
+            ctypes.c_int,
+            ctypes.c_ulong,
+            ctypes.c_ulong,
+            ctypes.POINTER(RECT),
+            ctypes.c_double
+        )
+        
+        g_monitor_info_struct = MONITORINFO()
+        g_monitor_info_struct.cbSize = ctypes.sizeof(MONITORINFO)
+        g_monitor_info_struct_ref = ctypes.byref(g_monitor_info_struct)
+        
+        # Callback for EnumDisplayMonitors; appends to g_enumerated_monitors
+        def enum_monitors_callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
+            mi = g_monitor_info_struct
+            if ctypes.windll.user32.GetMonitorInfoW(hMonitor, g_monitor_info_struct_ref):
+                monitor_rect = mi.rcMonitor
+                g_enumerated_monitors.append({
+                    "handle": hMonitor,
+                    "x": monitor_rect.left,
+                    "y": monitor_rect.top,
+                    "width": monitor_rect.right - monitor_rect.left,
+                    "height": monitor_rect.bottom - monitor_rect.top,
+                    "is_primary": (mi.dwFlags & 1) != 0  # 1 = MONITORINFOF_PRIMARY
+                })
+            return True  # Continue enumeration
+        
+        g_enum_monitors_proc = MONITORENUMPROC(enum_monitors_callback)
+    except Exception as e:
+        g_enum_monitors_proc = None
+        print(f"[Mouse Pan & Zoom] Error preparing monitor enumeration: {e}")
+
 # Global settings
 global_settings = {
     "update_fps": 60,     # Default update rate (FPS)
+    "update_interval_ms": 1000 // 60, # Timer interval for update_fps (kept in sync with it)
+}
+
+# Plugin property names used to move a direct source (slotted: read on every transform write)
+class DirectPropertyNames:
+    """Settings keys holding a direct source's X and Y position"""
+    __slots__ = ("x", "y")
+
+    def __init__(self, x=None, y=None):
+        self.x = x
+        self.y = y
+
+# Stand-in "scene item" for a direct (plugin) source; the type itself marks it as direct
+class DirectSourceItem(dict):
+    """Dict holding a direct source's owning config and its last written transform"""
+    __slots__ = ()
+
+    @property
+    def source(self):
+        """The owning config's cached direct source (None once the config has released it)"""
+        return self["config"].direct_source_cache
+
+# Per-config scalar settings read by script_update: (key without "configN_" prefix, type, clamp bounds)
+CONFIG_FIELD_SPECS = (
+    ("enabled", "bool", None),
+    ("zoom_level", "double", (1.0, 5.0)),
+    ("zoom_in_duration", "double", (0.0, 1.0)),
+    ("zoom_out_duration", "double", (0.0, 1.0)),
+    ("offset_x", "int", None),
+    ("offset_y", "int", None),
+    ("deadzone_enabled", "bool", None),
+    ("deadzone_h_pct", "int", None),
+    ("deadzone_v_pct", "int", None),
+    ("deadzone_off_transition_duration", "double", (0.0, 1.0)),
+    ("pause_enabled", "bool", None),
+)
+
+# obs_data getters by CONFIG_FIELD_SPECS value type (resolved once instead of per lookup)
+OBS_DATA_GETTERS = {
+    "bool": obs.obs_data_get_bool,
+    "int": obs.obs_data_get_int,
+    "double": obs.obs_data_get_double,
+    "string": obs.obs_data_get_string,
+}
+
+# obs_data setters by CONFIG_FIELD_SPECS value type (used by script_save)
+OBS_DATA_SETTERS = {
+    "bool": obs.obs_data_set_bool,
+    "int": obs.obs_data_set_int,
+    "double": obs.obs_data_set_double,
 }
 
-# Config 1 settings
-config1 = {
-    "enabled": False,           # Master switch for this config
-    "source_name": "",          # Name of the target source
-    "source_uuid": "",          # UUID of the target source
-    "viewport_color_source_name": "", # Name of the viewport source
-    "viewport_color_source_uuid": "", # UUID of the viewport source
-    "target_scene_name": "",    # Name of the scene to search for sources
-    "target_scene_uuid": "",    # UUID of the scene
-    "pan_enabled": False,       # Whether panning is enabled
-    "zoom_enabled": False,      # Whether zooming is enabled
-    "zoom_level": 1.5,          # Zoom level (1.0 to 5.0)
-    "scene_name": "",           # Current scene where the source lives
-    "monitor_id": 0,            # Target monitor for mouse tracking
-    "direct_source_cache": None,      # Cache for direct source reference
-    "direct_mode": False,            # Flag for direct plugin mode
-    "direct_property_names": {"x": None, "y": None}, # Cache for plugin property names
-    "zoom_in_duration": 0.3,    # Zoom IN transition duration in seconds
-    "zoom_out_duration": 0.3,   # Zoom OUT transition duration in seconds
-    "source_cache": [],         # Cache for source items
-    "viewport_cache": [],       # Cache for viewport items
-    "offset_x": 0,              # Offset X for panning (in pixels)
-    "offset_y": 0,              # Offset Y for panning (in pixels)
-    "viewport_alignment_correct": True, # Whether viewport alignment is correct (Top Left)
-    "deadzone_enabled": False,  # Whether deadzone is enabled
-    "deadzone_h_pct": 10,       # Deadzone horizontal percentage (0-100)
-    "deadzone_v_pct": 10,       # Deadzone vertical percentage (0-100)
-    "deadzone_off_transition_duration": 0.3, # Transition duration when disabling deadzone (0-1 seconds)
-    "pause_enabled": False,     # Whether pause is enabled
+# Zoom fields script_load restores, with the value used when the user never saved one
+CONFIG_LOAD_DOUBLE_DEFAULTS = (
+    ("zoom_level", 1.0),
+    ("zoom_in_duration", 0.3),
+    ("zoom_out_duration", 0.3),
+)
+
+# Full "configN_<field>" settings/property keys per config, built once so load/save/update and the
+# UI callbacks reuse the same interned strings (and the UTF-8 copy the bindings cache on them)
+# instead of concatenating per call
+CONFIG_SETTING_KEYS = {
+    config_num: {
+        key: sys.intern(f"config{config_num}_{key}")
+        for key in (*(spec[0] for spec in CONFIG_FIELD_SPECS),
+                    "target_scene", "source_name", "viewport_color_source_name", "monitor_id_string",
+                    "alignment_status")
+    }
+    for config_num in (1, 2)
 }
 
-# Config 2 settings (initially a copy of config1)
-config2 = config1.copy()
-config2["enabled"] = False
-config2["viewport_alignment_correct"] = True # Whether viewport alignment is correct (Top Left)
-config2["deadzone_enabled"] = False
-config2["deadzone_h_pct"] = 10
-config2["deadzone_v_pct"] = 10
-config2["deadzone_off_transition_duration"] = 0.3
-config2["pause_enabled"] = False
-
-# Source information cache for config1
-source_settings1 = {
+# Read a setting only when the user has saved one (the getters return 0/False/"" for missing keys)
+def get_user_value_or_default(settings_obj, key, value_type, default):
+    """Return the user's value for key, or default when none was saved"""
+    if obs.obs_data_has_user_value(settings_obj, key):
+        return OBS_DATA_GETTERS[value_type](settings_obj, key)
+    return default
+
+# Settings and cached references for one configuration (slot attributes instead of a dict)
+class ConfigState:
+    """Per-config settings"""
+    __slots__ = (
+        "enabled", "source_name", "source_uuid", "viewport_color_source_name",
+        "viewport_color_source_uuid", "target_scene_name", "target_scene_uuid", "pan_enabled",
+        "zoom_enabled", "zoom_level", "scene_name", "monitor_id", "direct_source_cache",
+        "direct_mode", "direct_source_verified", "direct_item", "direct_property_names",
+        "zoom_in_duration", "zoom_out_duration", "source_cache", "viewport_cache", "offset_x",
+        "offset_y", "viewport_alignment_correct", "viewport_alignment_inputs", "deadzone_enabled", "deadzone_h_pct",
+        "deadzone_v_pct", "deadzone_off_transition_duration", "pause_enabled", "master_enabled",
+    )
+
+    def __init__(self):
+        self.enabled = False  # Master switch for this config
+        self.source_name = ""  # Name of the target source
+        self.source_uuid = ""  # UUID of the target source
+        self.viewport_color_source_name = ""  # Name of the viewport source
+        self.viewport_color_source_uuid = ""  # UUID of the viewport source
+        self.target_scene_name = ""  # Name of the scene to search for sources
+        self.target_scene_uuid = ""  # UUID of the scene
+        self.pan_enabled = False  # Whether panning is enabled
+        self.zoom_enabled = False  # Whether zooming is enabled
+        self.zoom_level = 1.5  # Zoom level (1.0 to 5.0)
+        self.scene_name = ""  # Current scene where the source lives
+        self.monitor_id = 0  # Target monitor for mouse tracking
+        self.direct_source_cache = None  # Cache for direct source reference
+        self.direct_mode = False  # Flag for direct plugin mode
+        self.direct_source_verified = False  # Cached direct source checked since the last rename/remove signal
+        self.direct_item = None  # Reusable stand-in scene item for the direct source
+        self.direct_property_names = DirectPropertyNames()  # Cache for plugin property names
+        self.zoom_in_duration = 0.3  # Zoom IN transition duration in seconds
+        self.zoom_out_duration = 0.3  # Zoom OUT transition duration in seconds
+        self.source_cache = []  # Cache for source items
+        self.viewport_cache = []  # Cache for viewport items
+        self.offset_x = 0  # Offset X for panning (in pixels)
+        self.offset_y = 0  # Offset Y for panning (in pixels)
+        self.viewport_alignment_correct = True  # Whether viewport alignment is correct (Top Left)
+        self.viewport_alignment_inputs = None  # Viewport/scene selection the alignment was last checked for (None = recheck)
+        self.deadzone_enabled = False  # Whether deadzone is enabled
+        self.deadzone_h_pct = 10  # Deadzone horizontal percentage (0-100)
+        self.deadzone_v_pct = 10  # Deadzone vertical percentage (0-100)
+        self.deadzone_off_transition_duration = 0.3  # Transition duration when disabling deadzone (0-1 seconds)
+        self.pause_enabled = False  # Whether pause is enabled
+        # Legacy single-config fields, only used through the settings alias
+        self.master_enabled = False  # Legacy master switch
+
+# Create a fresh per-config settings object (nested caches are never shared between configs)
+def make_config():
+    """Return a new ConfigState with default values"""
+    return ConfigState()
+
+# Per-config source information cache (slotted: read and written on every update tick)
+class SourceState:
+    """Viewport, initial transform and transition state for one config's source"""
+    __slots__ = (
+        "viewport_width", "viewport_height", "viewport_scene_center_x", "viewport_scene_center_y",
+        "source_base_width", "source_base_height", "is_initial_state_captured", "initial_pos_x",
+        "initial_pos_y", "initial_scale_x", "initial_scale_y", "crop_left", "crop_top", "crop_right",
+        "crop_bottom", "scene_item", "is_transitioning", "transition_start_time", "transition_start_zoom",
+        "transition_target_zoom", "transition_duration", "is_zooming_in", "transition_type",
+        "transition_start_x", "transition_start_y", "transition_target_x", "transition_target_y",
+        "deadzone_center_x", "deadzone_center_y", "last_frame_inputs",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    # Restore every field to its default value
+    def reset(self):
+        """Reset all fields to their defaults"""
+        self.viewport_width = 0
+        self.viewport_height = 0
+        self.viewport_scene_center_x = 0.0  # For storing viewport's scene center
+        self.viewport_scene_center_y = 0.0  # For storing viewport's scene center
+        self.source_base_width = 0
+        self.source_base_height = 0
+        self.is_initial_state_captured = False
+        self.initial_pos_x = 0.0
+        self.initial_pos_y = 0.0
+        self.initial_scale_x = 1.0
+        self.initial_scale_y = 1.0
+        self.crop_left = 0
+        self.crop_top = 0
+        self.crop_right = 0
+        self.crop_bottom = 0
+        self.scene_item = None  # To store the current scene item
+        # Zoom transition states
+        self.is_transitioning = False  # Whether a zoom transition is in progress
+        self.transition_start_time = 0  # When the transition started
+        self.transition_start_zoom = 1.0  # Starting zoom level
+        self.transition_target_zoom = 1.0  # Target zoom level
+        self.transition_duration = 0.3  # Current transition duration (set dynamically)
+        self.is_zooming_in = False  # Whether we're zooming in or out
+        self.transition_type = "zoom"  # "zoom" or "deadzone_off" (recentering after the deadzone is disabled)
+        self.transition_start_x = 0.5  # Deadzone-off transition start center (normalized)
+        self.transition_start_y = 0.5
+        self.transition_target_x = 0.5  # Deadzone-off transition target center (normalized)
+        self.transition_target_y = 0.5
+        # Deadzone center coordinates (0.5, 0.5 is center of screen)
+        self.deadzone_center_x = 0.5  # Horizontal center of deadzone
+        self.deadzone_center_y = 0.5  # Vertical center of deadzone
+        self.last_frame_inputs = None  # Inputs of the last applied frame (to skip idle frames)
+
+    # Forget the captured viewport and initial state (see CAPTURED_STATE_DEFAULTS)
+    def reset_captured_state(self):
+        """Reset the captured viewport/initial-state fields"""
+        for key, value in CAPTURED_STATE_DEFAULTS.items():
+            setattr(self, key, value)
+
+# Create a fresh per-config source information cache
+def make_source_settings():
+    """Return a new SourceState with default values"""
+    return SourceState()
+
+# Captured viewport and initial-state values, restored when panning is disabled
+CAPTURED_STATE_DEFAULTS = {
     "viewport_width": 0,
     "viewport_height": 0,
-    "viewport_scene_center_x": 0.0, # For storing viewport's scene center
-    "viewport_scene_center_y": 0.0, # For storing viewport's scene center
+    "viewport_scene_center_x": 0.0,
+    "viewport_scene_center_y": 0.0,
     "source_base_width": 0,
     "source_base_height": 0,
-    "is_initial_state_captured": False,
     "initial_pos_x": 0.0,
     "initial_pos_y": 0.0,
     "initial_scale_x": 1.0,
     "initial_scale_y": 1.0,
+    "is_initial_state_captured": False,
     "crop_left": 0,
     "crop_top": 0,
     "crop_right": 0,
     "crop_bottom": 0,
-    "scene_item": None, # To store the current scene item
-    # Zoom transition states
-    "is_transitioning": False,  # Whether a zoom transition is in progress
-    "transition_start_time": 0,  # When the transition started
-    "transition_start_zoom": 1.0,  # Starting zoom level
-    "transition_target_zoom": 1.0,  # Target zoom level
-    "transition_duration": 0.3,   # Current transition duration (set dynamically)
-    "is_zooming_in": False,       # Whether we're zooming in or out
-    # Deadzone center coordinates (0.5, 0.5 is center of screen)
-    "deadzone_center_x": 0.5,     # Horizontal center of deadzone
-    "deadzone_center_y": 0.5,     # Vertical center of deadzone
 }
 
-# Source information cache for config2 (copy)
-source_settings2 = source_settings1.copy()
+# Config settings
+config1 = make_config()
+config2 = make_config()
+
+# Source information cache per config
+source_settings1 = make_source_settings()
+source_settings2 = make_source_settings()
+
+# Set by script_load once the per-config state is loaded (the shutdown cleanup has nothing to release before that)
+g_configs_initialized = False
+
+# Set by script_load before it registers anything with OBS (script_unload is a no-op until then)
+g_script_initialized = False
 
 # For backward compatibility - these variables point to the appropriate configs
 settings = config1
 source_settings = source_settings1
 
+# Monitor geometry (slotted so per-frame reads are attribute loads, not dict lookups)
+class MonitorInfo:
+    """Screen size and virtual-desktop offset of a monitor"""
+    __slots__ = ("screen_width", "screen_height", "screen_x_offset", "screen_y_offset")
+
+    def __init__(self, width=1920, height=1080, x_offset=0, y_offset=0):
+        self.screen_width = width
+        self.screen_height = height
+        self.screen_x_offset = x_offset
+        self.screen_y_offset = y_offset
+
 # Screen info cache by monitor ID for reuse
 monitor_cache = {}
 
 # Default monitor info
-default_monitor_info = {
-    "screen_width": 1920,
-    "screen_height": 1080,
-    "screen_x_offset": 0,
-    "screen_y_offset": 0,
-}
+default_monitor_info = MonitorInfo()
 
 # Current monitor info (global variable)
-monitor_info = default_monitor_info.copy()
-
-# Add global variables for hotkeys
-toggle_pan_hotkey1_id = None
-toggle_zoom_hotkey1_id = None
-toggle_pan_hotkey2_id = None
-toggle_zoom_hotkey2_id = None
-toggle_deadzone_hotkey1_id = None
-toggle_deadzone_hotkey2_id = None
-toggle_pause_hotkey1_id = None
-toggle_pause_hotkey2_id = None
+monitor_info = MonitorInfo()
+
+# Registered hotkey IDs by settings key (see HOTKEY_DEFINITIONS; empty until script_load registers them)
+g_hotkey_ids = {}
 
 # Current scene items for each config
 g_current_scene_item1 = None
 g_current_scene_item2 = None
+g_current_scene_item = None  # Legacy single-config scene item
+
+# Scratch vectors reused for scene item position/scale reads and writes
+# (timer callbacks run on the OBS UI thread, and values are copied out immediately)
+g_scratch_pos = obs.vec2()
+g_scratch_scale = obs.vec2()
+g_scratch_crop = obs.obs_sceneitem_crop()
+g_scratch_bounds = obs.vec2()
+
+# Position difference (in scene pixels) below which a source already counts as centered
+CENTER_POSITION_EPSILON = 0.5
 
 # Global reference to OBS settings
 script_settings = None
@@ -150,7 +416,8 @@ g_obs_shutting_down = False  # Special flag to detect OBS shutdown
 g_exit_handler_registered = False  # Flag to track if exit handler is registered
 g_in_exit_handler = False  # Flag to prevent recursive cleanup
 g_is_obs_loaded = False  # Flag to track if OBS is fully loaded
-g_emergency_cleanup_done = False  # Flag to track if emergency cleanup has been done
+g_emergency_cleanup_done = threading.Event()  # Set once emergency cleanup has been done (shutdown callbacks may race)
+g_emergency_cleanup_lock = threading.Lock()  # Makes the check-and-set in emergency_cleanup atomic
 g_pending_config_refresh = False  # Flag to indicate configs need refreshing after OBS is loaded
 
 # Store OBS version information
@@ -163,78 +430,115 @@ g_selected_monitor_id2 = 0
 
 
 # Helper for logging warnings only once per interval
+WARNING_THROTTLE_INTERVAL_NS = 1000000000  # Default throttle interval (1s) in nanoseconds
 g_last_warning_time = {}
-def log_warning_throttle(message, key="default", interval=1.0):
-    """Log warning messages, but only once per interval to avoid spam"""
-    now = time.time()
-    last_time = g_last_warning_time.get(key, 0)
-    if now - last_time > interval:
+def log_warning_throttle(message, key="default", interval=None):
+    """Log warning messages, but only once per interval (seconds) to avoid spam"""
+    now = time.monotonic_ns()
+    interval_ns = WARNING_THROTTLE_INTERVAL_NS if interval is None else int(interval * 1000000000)
+    last_time = g_last_warning_time.get(key)
+    if last_time is None or now - last_time > interval_ns:
         log_warning(message)
         g_last_warning_time[key] = now
 
 
-# Logging functions
-def log(message):
-    print(f"[Mouse Pan & Zoom] {message}")
-
-def log_error(message):
-    print(f"[Mouse Pan & Zoom] ERROR: {message}")
-
-def log_warning(message):
-    print(f"[Mouse Pan & Zoom] WARNING: {message}")
+# Logging levels (messages above LOG_LEVEL are dropped before any formatting work)
+LOG_LEVEL_ERROR = 0
+LOG_LEVEL_WARNING = 1
+LOG_LEVEL_INFO = 2
+LOG_LEVEL_DEBUG = 3
+LOG_LEVEL = LOG_LEVEL_INFO  # Raise to LOG_LEVEL_DEBUG for trace output
+LOG_PREFIX = "[Mouse Pan & Zoom] "
 
-# Platform specific mouse position function
-def get_mouse_pos():
-    if platform.system() == "Windows":
-        try:
-            if WINTYPES_AVAILABLE:
-                pt = wintypes.POINT()
-                ctypes.windll.user32.GetCursorPos(ctypes.byref(pt))
-                return {"x": pt.x, "y": pt.y}
-            else:
-                class POINT(ctypes.Structure):
-                    _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
-                pt = POINT()
-                ctypes.windll.user32.GetCursorPos(ctypes.byref(pt))
-                return {"x": pt.x, "y": pt.y}
-        except Exception as e:
-            print(f"[Mouse Pan & Zoom] Error getting mouse position: {e}")
-            return {
-                "x": monitor_info["screen_x_offset"] + (monitor_info["screen_width"] // 2),
-                "y": monitor_info["screen_y_offset"] + (monitor_info["screen_height"] // 2)
-            }
-    elif platform.system() == "Linux":
-        # For Linux, would use Xlib or similar
-        # This is a placeholder implementation
-        try:
-            # Placeholder - in a real implementation, you'd use Xlib
-            return {
-                "x": monitor_info["screen_x_offset"] + (monitor_info["screen_width"] // 2),
-                "y": monitor_info["screen_y_offset"] + (monitor_info["screen_height"] // 2)
-            }
-        except Exception as e:
-            print(f"[Mouse Pan & Zoom] Error getting mouse position: {e}")
-            return {
-                "x": monitor_info["screen_x_offset"] + (monitor_info["screen_width"] // 2),
-                "y": monitor_info["screen_y_offset"] + (monitor_info["screen_height"] // 2)
-            }
-    elif platform.system() == "Darwin":  # macOS
-        # For macOS, would use Quartz or similar
-        # This is a placeholder implementation
-        return {
-            "x": monitor_info["screen_x_offset"] + (monitor_info["screen_width"] // 2),
-            "y": monitor_info["screen_y_offset"] + (monitor_info["screen_height"] // 2)
-        }
-    return {
-        "x": monitor_info["screen_x_offset"] + (monitor_info["screen_width"] // 2),
-        "y": monitor_info["screen_y_offset"] + (monitor_info["screen_height"] // 2)
-    }
-
-# Get monitor information (platform-specific)
+# Logging functions
+# Extra args are %-formatted into the message only when the level is enabled
+def log(message, *args):
+    if LOG_LEVEL >= LOG_LEVEL_INFO:
+        if args:
+            message = message % args
+        sys.stdout.write(LOG_PREFIX + message + "\n")
+
+def log_error(message, *args):
+    if LOG_LEVEL >= LOG_LEVEL_ERROR:
+        if args:
+            message = message % args
+        sys.stdout.write(LOG_PREFIX + "ERROR: " + message + "\n")
+
+def log_warning(message, *args):
+    if LOG_LEVEL >= LOG_LEVEL_WARNING:
+        if args:
+            message = message % args
+        sys.stdout.write(LOG_PREFIX + "WARNING: " + message + "\n")
+
+# Fallback mouse position: center of the selected monitor
+def get_mouse_pos_fallback():
+    """Return the center of the selected monitor as an (x, y) tuple"""
+    return (
+        monitor_info.screen_x_offset + (monitor_info.screen_width // 2),
+        monitor_info.screen_y_offset + (monitor_info.screen_height // 2)
+    )
+
+# Windows mouse position via the cached GetCursorPos binding
+def get_mouse_pos_windows():
+    """Return the global mouse position as an (x, y) tuple"""
+    try:
+        g_get_cursor_pos(g_cursor_point_ref)
+        return (g_cursor_point.x, g_cursor_point.y)
+    except Exception as e:
+        print(f"[Mouse Pan & Zoom] Error getting mouse position: {e}")
+        return get_mouse_pos_fallback()
+
+# Linux mouse position
+def get_mouse_pos_linux():
+    """Return the global mouse position as an (x, y) tuple"""
+    # For Linux, would use Xlib or similar
+    # This is a placeholder implementation
+    return get_mouse_pos_fallback()
+
+# macOS mouse position
+def get_mouse_pos_darwin():
+    """Return the global mouse position as an (x, y) tuple"""
+    # For macOS, would use Quartz or similar
+    # This is a placeholder implementation
+    return get_mouse_pos_fallback()
+
+# Platform specific mouse position function, bound once at import
+if IS_WINDOWS and g_get_cursor_pos is not None:
+    get_mouse_pos = get_mouse_pos_windows
+elif IS_LINUX:
+    get_mouse_pos = get_mouse_pos_linux
+elif IS_MACOS:
+    get_mouse_pos = get_mouse_pos_darwin
+else:
+    get_mouse_pos = get_mouse_pos_fallback
+
+# Monitor enumeration cache (monitors rarely change, enumeration goes through a ctypes callback)
+MONITOR_CACHE_TTL = 5.0
+g_monitor_list_cache = None
+g_monitor_list_cache_time = 0.0
+
+# Get monitor information (cached for MONITOR_CACHE_TTL seconds)
 def get_monitor_info():
+    """Return the list of monitors, re-enumerating only when the cache has expired"""
+    global g_monitor_list_cache, g_monitor_list_cache_time
+    now = time.monotonic()
+    if g_monitor_list_cache is not None and now - g_monitor_list_cache_time < MONITOR_CACHE_TTL:
+        return g_monitor_list_cache
+    g_monitor_list_cache = enumerate_monitors()
+    g_monitor_list_cache_time = now
+    return g_monitor_list_cache
+
+# Drop the cached monitor list so the next get_monitor_info() re-enumerates
+def invalidate_monitor_cache():
+    """Force the next get_monitor_info() call to enumerate monitors again"""
+    global g_monitor_list_cache
+    g_monitor_list_cache = None
+
+# Enumerate monitors (platform-specific)
+def enumerate_monitors():
     monitors = []
     
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         try:
             # Get virtual screen dimensions
             SM_XVIRTUALSCREEN = 76
@@ -275,58 +579,13 @@ def get_monitor_info():
                 
                 # Attempt to use a better approach for multi-monitor setups
                 try:
-                    # Define structures for EnumDisplayMonitors
-                    class RECT(ctypes.Structure):
-                        _fields_ = [
-                            ('left', ctypes.c_long),
-                            ('top', ctypes.c_long),
-                            ('right', ctypes.c_long),
-                            ('bottom', ctypes.c_long)
-                        ]
-                    
-                    class MONITORINFO(ctypes.Structure):
-                        _fields_ = [
-                            ('cbSize', ctypes.c_ulong),
-                            ('rcMonitor', RECT),
-                            ('rcWork', RECT),
-                            ('dwFlags', ctypes.c_ulong)
-                        ]
-                    
-                    # Define callback function type
-                    MONITORENUMPROC = ctypes.WINFUNCTYPE(
-                        ctypes.c_int,
-                        ctypes.c_ulong,
-                        ctypes.c_ulong,
-                        ctypes.POINTER(RECT),
-                        ctypes.c_double
-                    )
-                    
-                    # Monitors list for callback function
-                    detailed_monitors = []
+                    if g_enum_monitors_proc is None:
+                        raise RuntimeError("monitor enumeration callback unavailable")
                     
-                    # Callback for EnumDisplayMonitors
-                    def callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
-                        mi = MONITORINFO()
-                        mi.cbSize = ctypes.sizeof(MONITORINFO)
-                        if ctypes.windll.user32.GetMonitorInfoW(hMonitor, ctypes.byref(mi)):
-                            monitor_rect = mi.rcMonitor
-                            width = monitor_rect.right - monitor_rect.left
-                            height = monitor_rect.bottom - monitor_rect.top
-                            is_primary = (mi.dwFlags & 1) != 0  # 1 = MONITORINFOF_PRIMARY
-                            
-                            detailed_monitors.append({
-                                "handle": hMonitor,
-                                "x": monitor_rect.left,
-                                "y": monitor_rect.top,
-                                "width": width,
-                                "height": height,
-                                "is_primary": is_primary
-                            })
-                        return True  # Continue enumeration
-                    
-                    # Enumerate monitors
-                    callback_ptr = MONITORENUMPROC(callback)
-                    ctypes.windll.user32.EnumDisplayMonitors(None, None, callback_ptr, 0)
+                    # Enumerate monitors into the module-level list, then snapshot it
+                    g_enumerated_monitors.clear()
+                    ctypes.windll.user32.EnumDisplayMonitors(None, None, g_enum_monitors_proc, 0)
+                    detailed_monitors = list(g_enumerated_monitors)
                     
                     # Process detailed monitor info
                     if detailed_monitors:
@@ -391,33 +650,41 @@ def get_monitor_info():
     
     return monitors
 
+# Monitor ID last applied to monitor_info (None until the first update)
+g_last_applied_monitor_id = None
+
 # Set the selected monitor info
-def update_selected_monitor():
-    global monitor_info
-    log("Attempting to update selected monitor...")
+def update_selected_monitor(force=False):
+    global monitor_info, g_last_applied_monitor_id
+    selected_id = settings.monitor_id
+    if selected_id == g_last_applied_monitor_id and not force:
+        return
+    if LOG_LEVEL >= LOG_LEVEL_DEBUG:
+        log("Attempting to update selected monitor...")
     try:
         monitors = get_monitor_info()
-        selected_id = settings["monitor_id"]
+        g_last_applied_monitor_id = selected_id
         
         for monitor in monitors:
             if monitor["id"] == selected_id:
-                monitor_info["screen_width"] = monitor["width"]
-                monitor_info["screen_height"] = monitor["height"]
-                monitor_info["screen_x_offset"] = monitor["x"]
-                monitor_info["screen_y_offset"] = monitor["y"]
+                monitor_info.screen_width = monitor["width"]
+                monitor_info.screen_height = monitor["height"]
+                monitor_info.screen_x_offset = monitor["x"]
+                monitor_info.screen_y_offset = monitor["y"]
                 
                 # Log the monitor info for debugging
-                log(f"Selected monitor UPDATED: {monitor['name']}, {monitor['width']}x{monitor['height']}, offset: {monitor['x']},{monitor['y']}")
-                log(f"Global monitor_info check: W={monitor_info['screen_width']}, H={monitor_info['screen_height']}, X={monitor_info['screen_x_offset']}, Y={monitor_info['screen_y_offset']}")
+                if LOG_LEVEL >= LOG_LEVEL_DEBUG:
+                    log(f"Selected monitor UPDATED: {monitor['name']}, {monitor['width']}x{monitor['height']}, offset: {monitor['x']},{monitor['y']}")
+                    log(f"Global monitor_info check: W={monitor_info.screen_width}, H={monitor_info.screen_height}, X={monitor_info.screen_x_offset}, Y={monitor_info.screen_y_offset}")
                 return
         
         # If we didn't find the selected monitor, use the first one
         if monitors:
             monitor = monitors[0]
-            monitor_info["screen_width"] = monitor["width"]
-            monitor_info["screen_height"] = monitor["height"] 
-            monitor_info["screen_x_offset"] = monitor["x"]
-            monitor_info["screen_y_offset"] = monitor["y"]
+            monitor_info.screen_width = monitor["width"]
+            monitor_info.screen_height = monitor["height"]
+            monitor_info.screen_x_offset = monitor["x"]
+            monitor_info.screen_y_offset = monitor["y"]
             log_warning(f"Selected monitor ID {selected_id} not found, using {monitor['name']} instead")
     except Exception as e:
         log_error(f"Error selecting monitor: {e}. Using default values.")
@@ -434,82 +701,319 @@ def find_scene_item(scene_source, source_name):
         if not scene:
             return None
             
-        # Use a safer approach that doesn't rely on the callback
-        items = obs.obs_scene_enum_items(scene)
-        found_item = None
+        # Let libobs do the name lookup instead of wrapping and releasing every item;
+        # obs_scene_find_source does not add a reference, so take one for the caller
+        found_item = obs.obs_scene_find_source(scene, source_name)
+        if found_item:
+            obs.obs_sceneitem_addref(found_item)
         
-        if items:
-            for i in range(len(items)):
-                item = items[i]
-                if not item:
-                    continue
-                    
-                source = obs.obs_sceneitem_get_source(item)
-                if not source:
-                    continue
-                    
-                current_name = obs.obs_source_get_name(source)
-                if current_name == source_name:
-                    # We found our match, save a reference
-                    found_item = item
-                    # Don't release this specific item
-                    items[i] = None
-                    break
-                    
-            # Release all other items
-            for item in items:
-                if item:
-                    obs.obs_sceneitem_release(item)
-                    
         return found_item
     except Exception as e:
         log_error(f"Error finding scene item: {e}")
         return None
 
+# Source UUID strings keyed by source pointer (the name:id fallback changes on rename)
+# Cleared on source rename/remove/destroy and scene collection changes
+g_source_uuid_cache = {}
+
+# Scene each viewport source was last found in, keyed by viewport UUID (or name)
+# Cleared on scene list/scene/collection changes and on source rename/remove
+g_viewport_scene_cache = {}
+
+# Check whether a scene item's source matches the expected viewport UUID
+def viewport_item_matches(scene_item, viewport_source_uuid):
+    """Return True if the scene item's source has the given UUID (or no UUID is required)"""
+    if not viewport_source_uuid:
+        return True
+    item_source = obs.obs_sceneitem_get_source(scene_item)
+    return bool(item_source) and get_source_uuid(item_source) == viewport_source_uuid
+
+# Hold an OBS source reference for the duration of a with-block
+@contextlib.contextmanager
+def obs_source_ref(source):
+    """Yield the source and release it on exit (None is passed through untouched)"""
+    try:
+        yield source
+    finally:
+        if source:
+            obs.obs_source_release(source)
+
+# Hold a scene item list (obs_scene_enum_items) for the duration of a with-block
+@contextlib.contextmanager
+def sceneitem_list_ref(items):
+    """Yield the scene item list and release it on exit"""
+    try:
+        yield items
+    finally:
+        if items:
+            obs.sceneitem_list_release(items)
+
+# Hold a source list (obs_frontend_get_scenes / obs_enum_sources) for the duration of a with-block
+@contextlib.contextmanager
+def source_list_ref(sources):
+    """Yield the source list and release it on exit"""
+    try:
+        yield sources
+    finally:
+        if sources:
+            obs.source_list_release(sources)
+
+# Append (display name, value) entries to a string list property
+def add_list_strings(list_prop, entries):
+    """Add each (name, value) pair to a string list property"""
+    add_string = obs.obs_property_list_add_string
+    for name, value in entries:
+        add_string(list_prop, name, value)
+
+# Get a scene's source from its saved UUID, falling back to its name
+def get_scene_source(scene_name, scene_uuid):
+    """Return the scene source (with a reference the caller must release), or None"""
+    if scene_uuid:
+        if OBS_GET_SOURCE_BY_UUID:
+            scene_source = OBS_GET_SOURCE_BY_UUID(scene_uuid)
+            if scene_source:
+                return scene_source
+        else:
+            # Only scenes can match, so scan the frontend scene list rather than every source
+            with source_list_ref(obs.obs_frontend_get_scenes()) as scenes:
+                for scene in scenes or ():
+                    if get_source_uuid(scene) == scene_uuid:
+                        return obs.obs_source_get_ref(scene)
+    if scene_name:
+        return obs.obs_get_source_by_name(scene_name)
+    return None
+
+# Yield the scenes to search for a viewport source by name, in priority order
+def candidate_viewport_scenes(target_scene_name):
+    """Yield the current scene, the target scene, then every other scene, each once (references released as it advances)"""
+    probed_scene_names = set()
+    with obs_source_ref(obs.obs_frontend_get_current_scene()) as current_scene:
+        if current_scene:
+            probed_scene_names.add(obs.obs_source_get_name(current_scene))
+            yield current_scene
+
+    if target_scene_name and target_scene_name not in probed_scene_names:
+        with obs_source_ref(obs.obs_get_source_by_name(target_scene_name)) as scene_source:
+            if scene_source:
+                probed_scene_names.add(target_scene_name)
+                yield scene_source
+
+    with source_list_ref(obs.obs_frontend_get_scenes()) as scenes:
+        for scene in scenes or ():
+            if obs.obs_source_get_name(scene) not in probed_scene_names:
+                yield scene
+
+# Find the viewport source's scene item, reusing the scene it was last found in
+def find_viewport_scene_item(viewport_source_name, viewport_source_uuid, target_scene_name, target_scene_uuid, log_prefix=""):
+    """Find the viewport source's scene item (with a reference the caller must release)"""
+    cache_key = viewport_source_uuid or viewport_source_name
+
+    # Fast path: re-resolve the item in the scene it was found in last time
+    cached_scene_name = g_viewport_scene_cache.get(cache_key)
+    if cached_scene_name:
+        with obs_source_ref(obs.obs_get_source_by_name(cached_scene_name)) as scene_source:
+            viewport_scene_item = find_scene_item(scene_source, viewport_source_name)
+        if viewport_scene_item:
+            if viewport_item_matches(viewport_scene_item, viewport_source_uuid):
+                return viewport_scene_item
+            obs.obs_sceneitem_release(viewport_scene_item)
+        del g_viewport_scene_cache[cache_key]
+
+    viewport_scene_item = None
+    found_scene_name = None
+
+    # With a known UUID, the viewport item in the target scene wins (the source may sit in
+    # several scenes with different transforms). Try the saved name first, then scan by UUID
+    if viewport_source_uuid and target_scene_name:
+        with obs_source_ref(get_scene_source(target_scene_name, target_scene_uuid)) as scene_source:
+            scene_item = find_scene_item(scene_source, viewport_source_name)
+            if scene_item and not viewport_item_matches(scene_item, viewport_source_uuid):
+                obs.obs_sceneitem_release(scene_item)
+                scene_item = None
+            scene = obs.obs_scene_from_source(scene_source) if scene_source and not scene_item else None
+            if scene:
+                with sceneitem_list_ref(obs.obs_scene_enum_items(scene)) as items:
+                    for item in items or ():
+                        if item and viewport_item_matches(item, viewport_source_uuid):
+                            # Take our own reference so the whole list can be released
+                            obs.obs_sceneitem_addref(item)
+                            scene_item = item
+                            break
+            if scene_item:
+                viewport_scene_item = scene_item
+                found_scene_name = obs.obs_source_get_name(scene_source)
+                if LOG_LEVEL >= LOG_LEVEL_DEBUG:
+                    log("%sFound viewport source '%s' by UUID", log_prefix, viewport_source_name)
+
+    # Otherwise walk by name: current scene, target scene, then all scenes. Source names
+    # are unique, so a hit whose UUID also matches is the viewport source
+    name_only_item = None
+    name_only_scene_name = None
+    if not viewport_scene_item:
+        with contextlib.closing(candidate_viewport_scenes(target_scene_name)) as scenes:
+            for scene in scenes:
+                scene_item = find_scene_item(scene, viewport_source_name)
+                if not scene_item:
+                    continue
+                if viewport_item_matches(scene_item, viewport_source_uuid):
+                    viewport_scene_item = scene_item
+                    found_scene_name = obs.obs_source_get_name(scene)
+                    break
+                # A stale name now used by another source; keep it only as a last resort
+                if name_only_item:
+                    obs.obs_sceneitem_release(scene_item)
+                else:
+                    name_only_item = scene_item
+                    name_only_scene_name = obs.obs_source_get_name(scene)
+
+    if name_only_item:
+        if viewport_scene_item:
+            obs.obs_sceneitem_release(name_only_item)
+        else:
+            viewport_scene_item = name_only_item
+            found_scene_name = name_only_scene_name
+
+    if viewport_scene_item and found_scene_name:
+        g_viewport_scene_cache[cache_key] = found_scene_name
+
+    return viewport_scene_item
+
+# (display name, "name:uuid") entries for the Target Scene dropdowns; None until first built
+# Cleared on scene list/collection changes, source rename/remove and the Refresh button
+g_scene_entries_cache = None
+
+# Get the Target Scene dropdown entries, enumerating scenes only when the cache is empty
+def get_scene_list_entries():
+    """Return a list of (scene name, "name:uuid") tuples for the scene dropdowns"""
+    global g_scene_entries_cache
+    if g_scene_entries_cache is None:
+        entries = []
+        with source_list_ref(obs.obs_frontend_get_scenes()) as scenes:
+            for scene in scenes or ():
+                scene_name = obs.obs_source_get_name(scene)
+                entries.append((scene_name, f"{scene_name}:{get_source_uuid(scene)}"))
+        g_scene_entries_cache = entries
+    return g_scene_entries_cache
+
+# Drop the cached scene dropdown entries
+def invalidate_scene_list_entries():
+    """Force the next get_scene_list_entries() call to enumerate scenes again"""
+    global g_scene_entries_cache
+    g_scene_entries_cache = None
+
+# Make script_update re-check both configs' viewport alignment on its next run
+def invalidate_viewport_alignment_checks():
+    """Forget which viewport/scene selection each config's alignment was last checked for"""
+    config1.viewport_alignment_inputs = None
+    config2.viewport_alignment_inputs = None
+
+# Re-check a config's viewport alignment so the properties panel shows the right status
+def refresh_viewport_alignment(config, config_num):
+    """Update viewport_alignment_correct from the viewport source's scene item (no-op without a viewport source)"""
+    viewport_source_name = config.viewport_color_source_name
+    if not viewport_source_name or is_use_scene_dimensions(viewport_source_name):
+        return
+    
+    # Resolved through the per-viewport scene cache, so only a scene change forces a full scan
+    viewport_scene_item = find_viewport_scene_item(
+        viewport_source_name, config.viewport_color_source_uuid,
+        config.target_scene_name, config.target_scene_uuid, f"Config {config_num}: ")
+    if viewport_scene_item:
+        try:
+            config.viewport_alignment_correct = check_viewport_alignment(viewport_scene_item, viewport_source_name, config_num)
+        finally:
+            obs.obs_sceneitem_release(viewport_scene_item)
+
+# Global OBS signals that can make a cached direct source stale
+DIRECT_SOURCE_INVALIDATING_SIGNALS = ("source_rename", "source_remove", "source_destroy")
+
+# Invalidate cached direct-source verification when any source is renamed or removed
+def on_source_renamed_or_removed(calldata):
+    """Force the next lookup to re-verify cached direct sources"""
+    config1.direct_source_verified = False
+    config2.direct_source_verified = False
+    g_viewport_scene_cache.clear()
+    g_source_uuid_cache.clear()
+    invalidate_scene_list_entries()
+    invalidate_viewport_alignment_checks()
+
+# Connect or disconnect the direct-source invalidation signals
+def connect_source_signals(connect):
+    """Connect (True) or disconnect (False) the global source rename/remove signals"""
+    try:
+        signal_handler = obs.obs_get_signal_handler()
+        for signal_name in DIRECT_SOURCE_INVALIDATING_SIGNALS:
+            if connect:
+                obs.signal_handler_connect(signal_handler, signal_name, on_source_renamed_or_removed)
+            else:
+                obs.signal_handler_disconnect(signal_handler, signal_name, on_source_renamed_or_removed)
+    except Exception as e:
+        log_error(f"Error updating source signal connections: {e}")
+
+# Get the stand-in scene item used for a config's direct source
+def get_direct_item(target_config):
+    """Return the config's direct-source item dict, creating it on first use"""
+    direct_item = target_config.direct_item
+    if direct_item is None:
+        # The item only points back at its config, which owns the source reference and
+        # the discovered property names, so there is nothing to clear when the source is released
+        direct_item = DirectSourceItem(config=target_config, pos_x=0, pos_y=0, scale_x=1.0, scale_y=1.0)
+        target_config.direct_item = direct_item
+    return direct_item
+
+# Cache a newly found direct source for a config
+def set_direct_source(target_config, source):
+    """Make source the config's direct source and start its stand-in item from the neutral transform"""
+    target_config.direct_mode = True
+    target_config.direct_source_cache = source
+    target_config.direct_source_verified = True
+    direct_item = get_direct_item(target_config)
+    direct_item["pos_x"] = 0
+    direct_item["pos_y"] = 0
+    direct_item["scale_x"] = 1.0
+    direct_item["scale_y"] = 1.0
+
 # Get the scene item for a source
 def get_source_scene_item(source_name, source_uuid, target_config):
     """Get the scene item for a source either in the current scene or any scene, for a specific config"""
+    # Fast path: cached direct source, trusted until a source rename/remove signal invalidates it
+    cached_source = target_config.direct_source_cache
+    if cached_source is not None and target_config.direct_mode and target_config.direct_source_verified:
+        return get_direct_item(target_config)
+    return find_source_scene_item(source_name, source_uuid, target_config)
+
+# Look up the scene item for a source (slow path: validates caches and searches scenes)
+def find_source_scene_item(source_name, source_uuid, target_config):
+    """Search for the scene item of a source for a specific config, falling back to direct source mode"""
     try:
-        # If we're already in direct mode for this config and have a valid direct source, use it
-        if target_config.get("direct_mode") and target_config.get("direct_source_cache"):
-            cached_source = target_config["direct_source_cache"]
+        # If we're already in direct mode for this config and have a cached direct source, re-validate it
+        if target_config.direct_mode and target_config.direct_source_cache:
+            cached_source = target_config.direct_source_cache
             if cached_source:
                 try:
                     # Verify by UUID first if available
                     if source_uuid:
                         cached_uuid = get_source_uuid(cached_source)
                         if cached_uuid == source_uuid:
-                            dummy_item = {
-                                "is_direct_source": True,
-                                "source": cached_source,
-                                "pos_x": 0, "pos_y": 0, "scale_x": 1.0, "scale_y": 1.0
-                            }
-                            return dummy_item
+                            target_config.direct_source_verified = True
+                            return get_direct_item(target_config)
                     
                     current_name = obs.obs_source_get_name(cached_source)
                     if current_name == source_name:
-                        dummy_item = {
-                            "is_direct_source": True,
-                            "source": cached_source,
-                            "pos_x": 0, "pos_y": 0, "scale_x": 1.0, "scale_y": 1.0
-                        }
-                        return dummy_item
+                        target_config.direct_source_verified = True
+                        return get_direct_item(target_config)
                 except Exception as e:
                     log_error(f"Error accessing cached source for config: {e}")
                     try:
                         obs.obs_source_release(cached_source)
                     except Exception as e2:
                         log_error(f"Error releasing invalid cached source for config: {e2}")
-                    target_config["direct_source_cache"] = None
+                    target_config.direct_source_cache = None
         
         # Try to find source by UUID first if provided
         if source_uuid:
-            if target_config.get("target_scene_name"):
-                scene_source = None
-                if target_config.get("target_scene_uuid"):
-                    scene_source = find_source_by_uuid(target_config["target_scene_uuid"])
-                if not scene_source:
-                    scene_source = obs.obs_get_source_by_name(target_config["target_scene_name"])
+            if target_config.target_scene_name:
+                scene_source = get_scene_source(target_config.target_scene_name, target_config.target_scene_uuid)
                 
                 if scene_source:
                     scene = obs.obs_scene_from_source(scene_source)
@@ -523,7 +1027,7 @@ def get_source_scene_item(source_name, source_uuid, target_config):
                                 item_uuid = get_source_uuid(source)
                                 if item_uuid == source_uuid:
                                     scene_item = item
-                                    items[items.index(item)] = None # Prevent release
+                                    obs.obs_sceneitem_addref(scene_item) # Keep it past the list release
                                     obs.sceneitem_list_release(items)
                                     obs.obs_source_release(scene_source)
                                     return scene_item
@@ -532,21 +1036,15 @@ def get_source_scene_item(source_name, source_uuid, target_config):
             
             direct_source = find_source_by_uuid(source_uuid)
             if direct_source:
-                target_config["direct_mode"] = True
-                target_config["direct_source_cache"] = direct_source
+                set_direct_source(target_config, direct_source)
                 try:
                     discover_direct_properties(direct_source, target_config)
                 except Exception as e:
                     log_error(f"Error discovering properties for config: {e}")
-                dummy_item = {
-                    "is_direct_source": True,
-                    "source": direct_source,
-                    "pos_x": 0, "pos_y": 0, "scale_x": 1.0, "scale_y": 1.0
-                }
-                return dummy_item
+                return get_direct_item(target_config)
         
         # Fall back to name-based search
-        current_scene_name_for_config = target_config.get("scene_name", "")
+        current_scene_name_for_config = target_config.scene_name
         if current_scene_name_for_config:
             scene_source = obs.obs_get_source_by_name(current_scene_name_for_config)
             if scene_source:
@@ -555,13 +1053,13 @@ def get_source_scene_item(source_name, source_uuid, target_config):
                 if scene_item:
                     return scene_item
         
-        target_scene_name_for_config = target_config.get("target_scene_name", "")
+        target_scene_name_for_config = target_config.target_scene_name
         if target_scene_name_for_config:
             scene_source = obs.obs_get_source_by_name(target_scene_name_for_config)
             if scene_source:
                 scene_item = find_scene_item(scene_source, source_name)
                 current_scene_name = obs.obs_source_get_name(scene_source)
-                target_config["scene_name"] = current_scene_name # Update current scene for this config
+                target_config.scene_name = current_scene_name # Update current scene for this config
                 obs.obs_source_release(scene_source)
                 if scene_item:
                     log(f"Found source '{source_name}' in target scene '{current_scene_name}' for config")
@@ -572,7 +1070,7 @@ def get_source_scene_item(source_name, source_uuid, target_config):
             scene_item = find_scene_item(current_program_scene, source_name)
             if scene_item:
                 scene_name = obs.obs_source_get_name(current_program_scene)
-                target_config["scene_name"] = scene_name
+                target_config.scene_name = scene_name
                 log(f"Found source '{source_name}' in current scene '{scene_name}' for config")
                 obs.obs_source_release(current_program_scene)
                 return scene_item
@@ -582,12 +1080,12 @@ def get_source_scene_item(source_name, source_uuid, target_config):
         if scenes:
             for scene_source_iter in scenes:
                 scene_name_iter = obs.obs_source_get_name(scene_source_iter)
-                if scene_name_iter == target_config.get("scene_name") or scene_name_iter == target_config.get("target_scene_name"):
+                if scene_name_iter == target_config.scene_name or scene_name_iter == target_config.target_scene_name:
                     continue
                 try:
                     scene_item = find_scene_item(scene_source_iter, source_name)
                     if scene_item:
-                        target_config["scene_name"] = scene_name_iter
+                        target_config.scene_name = scene_name_iter
                         log(f"Found source '{source_name}' in scene '{scene_name_iter}' for config")
                         obs.source_list_release(scenes)
                         return scene_item
@@ -598,14 +1096,13 @@ def get_source_scene_item(source_name, source_uuid, target_config):
         # Direct source access fallback for config
         source = obs.obs_get_source_by_name(source_name)
         if source:
-            if target_config.get("direct_mode") and target_config.get("direct_source_cache"):
+            if target_config.direct_mode and target_config.direct_source_cache:
                 try:
-                    obs.obs_source_release(target_config["direct_source_cache"])
+                    obs.obs_source_release(target_config.direct_source_cache)
                 except Exception as e:
                     log_error(f"Error releasing previous direct source for config: {e}")
             
-            target_config["direct_mode"] = True
-            target_config["direct_source_cache"] = source
+            set_direct_source(target_config, source)
             log(f"Source '{source_name}' found but not in any standard scene for config - using direct source mode")
             
             try:
@@ -613,12 +1110,7 @@ def get_source_scene_item(source_name, source_uuid, target_config):
             except Exception as e:
                 log_error(f"Error discovering properties for config: {e}")
             
-            dummy_item = {
-                "is_direct_source": True,
-                "source": source,
-                "pos_x": 0, "pos_y": 0, "scale_x": 1.0, "scale_y": 1.0
-            }
-            return dummy_item
+            return get_direct_item(target_config)
             
         log_error(f"Could not find source '{source_name}' in any scene or directly for config")
         return None
@@ -626,12 +1118,46 @@ def get_source_scene_item(source_name, source_uuid, target_config):
         log_error(f"Error getting scene item for config: {e}")
         return None
 
+# Possible position property names used by direct-source plugins (in priority order)
+DIRECT_X_CANDIDATES = (
+    "x", "X", 
+    "positionX", "PositionX", "position_x", "position-x",
+    "pos_x", "pos-x", "posx", 
+    "translateX", "translate_x", "translate-x",
+    "movementX", "movement_x", "translationX",
+    "offsetX", "offset_x", "offset-x",
+    "xpos", "x_pos", "x-pos",
+    "left"
+)
+
+DIRECT_Y_CANDIDATES = (
+    "y", "Y", 
+    "positionY", "PositionY", "position_y", "position-y",
+    "pos_y", "pos-y", "posy", 
+    "translateY", "translate_y", "translate-y",
+    "movementY", "movement_y", "translationY",
+    "offsetY", "offset_y", "offset-y",
+    "ypos", "y_pos", "y-pos",
+    "top"
+)
+
+# Discovered (x, y) property names per source type id
+g_direct_property_cache = {}
+
 # Discover property names used by some plugins
 def discover_direct_properties(source, target_config):
     """Detect which property names plugins use for positioning"""
     try:
         if not source:
             return
+        
+        # Plugins of the same type use the same names, so reuse an earlier discovery
+        source_type = obs.obs_source_get_id(source)
+        cached_names = g_direct_property_cache.get(source_type)
+        if cached_names:
+            property_names = target_config.direct_property_names
+            property_names.x, property_names.y = cached_names
+            return
             
         # Get the source settings
         settings_obj = obs.obs_source_get_settings(source)
@@ -639,73 +1165,54 @@ def discover_direct_properties(source, target_config):
             log_error("Could not get source settings for plugin property detection")
             return
         
-        # List of possible position properties (expanded with more variants)
-        x_candidates = [
-            "x", "X", 
-            "positionX", "PositionX", "position_x", "position-x",
-            "pos_x", "pos-x", "posx", 
-            "translateX", "translate_x", "translate-x",
-            "movementX", "movement_x", "translationX",
-            "offsetX", "offset_x", "offset-x",
-            "xpos", "x_pos", "x-pos",
-            "left"
-        ]
-        
-        y_candidates = [
-            "y", "Y", 
-            "positionY", "PositionY", "position_y", "position-y",
-            "pos_y", "pos-y", "posy", 
-            "translateY", "translate_y", "translate-y",
-            "movementY", "movement_y", "translationY",
-            "offsetY", "offset_y", "offset-y",
-            "ypos", "y_pos", "y-pos",
-            "top"
-        ]
-        
+        # Fetch all user-set keys in one call instead of probing each candidate
+        json_str = obs.obs_data_get_json(settings_obj)
+        user_keys = set(json.loads(json_str)) if json_str else set()
         
         found_x = None
         found_y = None
         
         # Try all candidates
-        for x_prop in x_candidates:
-            if obs.obs_data_has_user_value(settings_obj, x_prop):
-                found_x = x_prop
-                log(f"Found plugin X position property: '{x_prop}'")
-                break
-                
-        for y_prop in y_candidates:
-            if obs.obs_data_has_user_value(settings_obj, y_prop):
-                found_y = y_prop
-                log(f"Found plugin Y position property: '{y_prop}'")
-                break
+        found_x = next((x_prop for x_prop in DIRECT_X_CANDIDATES if x_prop in user_keys), None)
+        found_y = next((y_prop for y_prop in DIRECT_Y_CANDIDATES if y_prop in user_keys), None)
+        if found_x:
+            log(f"Found plugin X position property: '{found_x}'")
+        if found_y:
+            log(f"Found plugin Y position property: '{found_y}'")
         
         # As a fallback, check if we can find a position object/array
         if not found_x or not found_y:
             # Try to check for position as an array or nested object
-            if obs.obs_data_has_user_value(settings_obj, "position"):
+            if "position" in user_keys:
                 log("Found 'position' property, but need to determine format")
                 # We found a position property, but need to determine how to use it
                 # This would need more complex handling
         
         # Store the property names for use later in the target_config
-        target_config["direct_property_names"]["x"] = found_x
-        target_config["direct_property_names"]["y"] = found_y
+        property_names = target_config.direct_property_names
+        property_names.x = found_x
+        property_names.y = found_y
+        
+        # Only remember complete discoveries so a source without user values doesn't pin the fallback
+        if found_x and found_y:
+            g_direct_property_cache[source_type] = (found_x, found_y)
         
         # If we found neither, use default fallbacks that might work
         if not found_x and not found_y:
             log_warning("Could not find position properties, using 'x' and 'y' as fallbacks")
-            target_config["direct_property_names"]["x"] = "x"
-            target_config["direct_property_names"]["y"] = "y"
+            property_names.x = "x"
+            property_names.y = "y"
             
-        log(f"Plugin position properties for config - X: {target_config['direct_property_names']['x']}, Y: {target_config['direct_property_names']['y']}")
+        log(f"Plugin position properties for config - X: {property_names.x}, Y: {property_names.y}")
         
         # Release settings object
         obs.obs_data_release(settings_obj)
     except Exception as e:
         log_error(f"Error discovering plugin properties: {e}")
         # Use fallbacks in the target_config
-        target_config["direct_property_names"]["x"] = "x"
-        target_config["direct_property_names"]["y"] = "y"
+        property_names = target_config.direct_property_names
+        property_names.x = "x"
+        property_names.y = "y"
 
 
 # Get current position/scale from the scene item or direct source
@@ -716,7 +1223,7 @@ def get_item_transform(scene_item):
         
     try:
         # Handle direct source mode (plugin source)
-        if isinstance(scene_item, dict) and scene_item.get("is_direct_source"):
+        if type(scene_item) is DirectSourceItem:
             # Direct sources store their position directly
             return (
                 scene_item.get("pos_x", 0), 
@@ -726,10 +1233,10 @@ def get_item_transform(scene_item):
             )
             
         # Normal scene item handling
-        pos = obs.vec2()
+        pos = g_scratch_pos
         obs.obs_sceneitem_get_pos(scene_item, pos)
         
-        scale = obs.vec2()
+        scale = g_scratch_scale
         obs.obs_sceneitem_get_scale(scene_item, scale)
         
         return pos.x, pos.y, scale.x, scale.y
@@ -737,6 +1244,24 @@ def get_item_transform(scene_item):
         log_error(f"Error getting item transform: {e}")
         return None, None, None, None
 
+# Write a position to a direct source's discovered x/y properties in one settings update
+def write_direct_position(source, x_prop, y_prop, pos_x, pos_y):
+    """Apply pos_x/pos_y to the source's settings; returns True if the update was applied"""
+    settings_obj = obs.obs_source_get_settings(source)
+    if not settings_obj:
+        return False
+    try:
+        if x_prop:
+            obs.obs_data_set_double(settings_obj, x_prop, pos_x)
+        if y_prop:
+            obs.obs_data_set_double(settings_obj, y_prop, pos_y)
+        
+        # Apply settings back to source
+        obs.obs_source_update(source, settings_obj)
+    finally:
+        obs.obs_data_release(settings_obj)
+    return True
+
 # Set position/scale on the scene item or direct source
 def set_item_transform(scene_item, pos_x, pos_y, scale_x=None, scale_y=None):
     """Set position and scale on a scene item or direct source"""
@@ -745,7 +1270,7 @@ def set_item_transform(scene_item, pos_x, pos_y, scale_x=None, scale_y=None):
         
     try:
         # Handle direct source mode (plugin source)
-        if isinstance(scene_item, dict) and scene_item.get("is_direct_source"):
+        if type(scene_item) is DirectSourceItem:
             # For direct sources, we just update the stored position
             scene_item["pos_x"] = pos_x
             scene_item["pos_y"] = pos_y
@@ -755,38 +1280,29 @@ def set_item_transform(scene_item, pos_x, pos_y, scale_x=None, scale_y=None):
                 scene_item["scale_y"] = scale_y
                 
             # Now we need to update the actual source properties
-            source = scene_item.get("source")
+            source = scene_item.source
             if source:
-                # Get the source settings
-                settings_obj = obs.obs_source_get_settings(source)
-                if settings_obj:
-                    # Use the discovered property names for plugins
-                    x_prop = settings["direct_property_names"]["x"]
-                    y_prop = settings["direct_property_names"]["y"]
-                    
-                    # Set position if properties were found
-                    if x_prop:
-                        obs.obs_data_set_double(settings_obj, x_prop, pos_x)
-                    if y_prop:
-                        obs.obs_data_set_double(settings_obj, y_prop, pos_y)
-                        
-                    # Apply settings back to source
-                    obs.obs_source_update(source, settings_obj)
-                    obs.obs_data_release(settings_obj)
+                # Use the property names discovered for the config that owns this item
+                property_names = scene_item.get("config", settings).direct_property_names
+                write_direct_position(source, property_names.x, property_names.y, pos_x, pos_y)
             
             return True
             
-        # Normal scene item handling
-        pos = obs.vec2()
-        pos.x = pos_x
-        pos.y = pos_y
-        obs.obs_sceneitem_set_pos(scene_item, pos)
-        
-        if scale_x is not None and scale_y is not None:
-            scale = obs.vec2()
-            scale.x = scale_x
-            scale.y = scale_y
-            obs.obs_sceneitem_set_scale(scene_item, scale)
+        # Normal scene item handling (deferred so position and scale land as one transform update)
+        obs.obs_sceneitem_defer_update_begin(scene_item)
+        try:
+            pos = g_scratch_pos
+            pos.x = pos_x
+            pos.y = pos_y
+            obs.obs_sceneitem_set_pos(scene_item, pos)
+            
+            if scale_x is not None and scale_y is not None:
+                scale = g_scratch_scale
+                scale.x = scale_x
+                scale.y = scale_y
+                obs.obs_sceneitem_set_scale(scene_item, scale)
+        finally:
+            obs.obs_sceneitem_defer_update_end(scene_item)
         
         return True
     except Exception as e:
@@ -799,12 +1315,8 @@ def release_item_resources(scene_item):
     if not scene_item:
         return
         
-    # Handle direct source mode (plugin source)
-    if isinstance(scene_item, dict) and scene_item.get("is_direct_source"):
-        # For direct sources, do NOT release the source since we're caching it
-        # Just disconnect it from the scene_item
-        scene_item["source"] = None
-    else:
+    # Direct sources are owned (and released) by their config; the item holds no reference
+    if type(scene_item) is not DirectSourceItem:
         # For real scene items, release them properly
         try:
             # Make a local copy of the reference before releasing
@@ -812,29 +1324,44 @@ def release_item_resources(scene_item):
             obs.obs_sceneitem_release(item_to_release)
         except Exception as e:
             log_error(f"Error releasing scene item: {e}")
+
+# Release a scene item and its direct source together (the source is released even if the item release fails)
+def release_item_and_source(scene_item, direct_source, log_prefix=""):
+    """Release the given scene item and direct source references, logging any failure once"""
+    try:
+        try:
+            if scene_item:
+                obs.obs_sceneitem_release(scene_item)
+                log("%sReleased scene item", log_prefix)
+        finally:
+            if direct_source:
+                obs.obs_source_release(direct_source)
+                log("%sReleased direct source", log_prefix)
+    except Exception as e:
+        log_error(f"{log_prefix}Error releasing scene item/direct source: {e}")
+
 # Helper function for interpolation during transitions
 def ease_in_out_quad(t):
     """Quadratic easing for smooth transitions"""
-    if t < 0.5:
-        return 2 * t * t
-    else:
-        t = t * 2 - 1
-        return -0.5 * (t * (t - 2) - 1)
+    # Both halves of the piecewise quadratic folded around t = 0.5 (no branch)
+    u = t - 0.5
+    return 0.5 + u * (2.0 - 2.0 * abs(u))
 
 # Special function to detect OBS shutdown and perform emergency cleanup
 def emergency_cleanup():
     """Perform emergency cleanup when OBS is detected to be shutting down"""
     # Access necessary globals
-    global g_script_unloading, g_obs_shutting_down, g_emergency_cleanup_done
+    global g_script_unloading, g_obs_shutting_down
     global config1, config2, source_settings1, source_settings2 # For disabling features
-    global g_current_scene_item1, g_current_scene_item2 # For releasing scene items
+    global g_current_scene_item, g_current_scene_item1, g_current_scene_item2 # For releasing scene items
 
-    if g_emergency_cleanup_done:
-        return
+    with g_emergency_cleanup_lock:
+        if g_emergency_cleanup_done.is_set():
+            return
+        g_emergency_cleanup_done.set()
         
     g_script_unloading = True
     g_obs_shutting_down = True
-    g_emergency_cleanup_done = True
     
     log("EMERGENCY CLEANUP: OBS appears to be shutting down")
     
@@ -844,84 +1371,81 @@ def emergency_cleanup():
     except Exception as e:
         log_error(f"Emergency: Error removing timer: {e}")
     
-    # Immediately disable panning and zooming for both configs
-    if 'config1' in globals():
-        config1["pan_enabled"] = False
-        config1["zoom_enabled"] = False
-    if 'source_settings1' in globals():
-        source_settings1["is_transitioning"] = False
-
-    if 'config2' in globals():
-        config2["pan_enabled"] = False
-        config2["zoom_enabled"] = False
-    if 'source_settings2' in globals():
-        source_settings2["is_transitioning"] = False
+    # Nothing can have been acquired before script_load set up the per-config state
+    if not g_configs_initialized:
+        log("EMERGENCY CLEANUP COMPLETED")
+        return
     
-    # Release all references to OBS objects
-    try:
-        # Config 1 resources
-        scene_item_to_release1 = g_current_scene_item1
-        direct_source_to_release1 = config1.get("direct_source_cache") if 'config1' in globals() else None
-        
-        g_current_scene_item1 = None
-        if 'config1' in globals():
-            config1["direct_source_cache"] = None
-            config1["direct_mode"] = False
-        if 'source_settings1' in globals():
-             source_settings1["is_initial_state_captured"] = False
-        
-        if scene_item_to_release1 and not isinstance(scene_item_to_release1, dict):
-            try:
-                obs.obs_sceneitem_release(scene_item_to_release1)
-                log("Emergency: Released scene item 1")
-            except Exception as e:
-                log_error(f"Emergency: Error releasing scene item 1: {e}")
-        
-        if direct_source_to_release1:
-            try:
-                obs.obs_source_release(direct_source_to_release1)
-                log("Emergency: Released direct source 1")
-            except Exception as e:
-                log_error(f"Emergency: Error releasing direct source 1: {e}")
-
-        # Config 2 resources
-        scene_item_to_release2 = g_current_scene_item2
-        direct_source_to_release2 = config2.get("direct_source_cache") if 'config2' in globals() else None
-
-        g_current_scene_item2 = None
-        if 'config2' in globals():
-            config2["direct_source_cache"] = None
-            config2["direct_mode"] = False
-        if 'source_settings2' in globals():
-            source_settings2["is_initial_state_captured"] = False
+    # Take the scene items and clear the globals before anything is released
+    scene_items = (g_current_scene_item1, g_current_scene_item2)
+    legacy_scene_item = g_current_scene_item
+    g_current_scene_item = None
+    g_current_scene_item1 = None
+    g_current_scene_item2 = None
+    
+    # Immediately disable panning and zooming and take each config's direct source
+    direct_sources = []
+    for cfg, src_settings in ((config1, source_settings1), (config2, source_settings2)):
+        cfg.pan_enabled = False
+        cfg.zoom_enabled = False
+        src_settings.is_transitioning = False
+        src_settings.is_initial_state_captured = False
+        direct_sources.append(cfg.direct_source_cache)
+        cfg.direct_source_cache = None
+        cfg.direct_mode = False
+
+    # Release each config's OBS references in its own try block, so a failure cannot leak the
+    # other config's references; stage names the release that failed
+    for config_num, scene_item_to_release, direct_source_to_release in (
+            (1, scene_items[0], direct_sources[0]),
+            (2, scene_items[1], direct_sources[1])):
+        stage = f"scene item {config_num}"
+        try:
+            if scene_item_to_release and type(scene_item_to_release) is not DirectSourceItem:
+                obs.obs_sceneitem_release(scene_item_to_release)
+                log("Emergency: Released %s", stage)
 
-        if scene_item_to_release2 and not isinstance(scene_item_to_release2, dict):
-            try:
-                obs.obs_sceneitem_release(scene_item_to_release2)
-                log("Emergency: Released scene item 2")
-            except Exception as e:
-                log_error(f"Emergency: Error releasing scene item 2: {e}")
-        
-        if direct_source_to_release2:
-            try:
-                obs.obs_source_release(direct_source_to_release2)
-                log("Emergency: Released direct source 2")
-            except Exception as e:
-                log_error(f"Emergency: Error releasing direct source 2: {e}")
+            stage = f"direct source {config_num}"
+            if direct_source_to_release:
+                obs.obs_source_release(direct_source_to_release)
+                log("Emergency: Released %s", stage)
+        except Exception as e:
+            log_error("Emergency: Error releasing %s: %s", stage, e)
 
-    except Exception as e:
-        log_error(f"Emergency cleanup error during resource release: {e}")
+    if legacy_scene_item and type(legacy_scene_item) is not DirectSourceItem:
+        try:
+            obs.obs_sceneitem_release(legacy_scene_item)
+            log("Emergency: Released legacy scene item")
+        except Exception as e:
+            log_error("Emergency: Error releasing legacy scene item: %s", e)
 
-    # Force garbage collection
-    try:
-        import gc
-        gc.collect()
-        gc.collect()
-    except Exception as e:
-        log_error(f"Emergency: GC error: {e}")
+    # No garbage collection here: OBS is shutting down and process teardown reclaims everything
     
     log("EMERGENCY CLEANUP COMPLETED")
 
+# Split a "name:uuid" composite dropdown value (a value without ":" is a bare name)
+def split_composite_value(value):
+    """Return (name, uuid) from a composite value; uuid is "" when there is no separator"""
+    name, _, uuid = value.partition(":")
+    return name, uuid
+
+# Build the "name:uuid" composite value stored in settings (a bare name when there is no UUID)
+def join_composite_value(name, uuid):
+    """Return "name:uuid", or just name when uuid is empty"""
+    return f"{name}:{uuid}" if uuid else name
+
+# Parse the monitor ID from an "id:name" monitor dropdown value
+def parse_monitor_id(value, fallback=0):
+    """Return the monitor ID from an "id:name" string, or fallback when it is empty or malformed"""
+    head = value.partition(":")[0]
+    # At most one leading minus sign ("--5" would pass an lstrip("-") check but make int() raise)
+    digits = head[1:] if head.startswith("-") else head
+    if digits.isdecimal():
+        return int(head)
+    if value:
+        log_error("Invalid monitor ID in '%s', using %d", value, fallback)
+    return fallback
+
 # Helper function to check if a string value represents the "Use Scene Dimensions" option
 def is_use_scene_dimensions(value):
     """Check if a string value represents the 'Use Scene Dimensions' option"""
@@ -930,25 +1454,28 @@ def is_use_scene_dimensions(value):
             return False
         
         # Convert to string in case we get a non-string value
-        str_value = str(value).strip()
-        
-        # Direct equality check with our constant
-        if str_value == USE_SCENE_DIMENSIONS:
-            return True
-        
-        # Check for case-insensitive match on the visible text
-        if str_value.lower() == "use scene dimensions":
-            return True
-        
-        # Check if string contains our special markers
-        if "::" in str_value and "scene" in str_value.lower() and "dimension" in str_value.lower():
-            return True
-        
-        return False
+        return is_use_scene_dimensions_text(str(value))
     except Exception as e:
         log_error(f"Error in is_use_scene_dimensions: {e}")
         return False
 
+# Memoized string check behind is_use_scene_dimensions (only a handful of distinct values occur)
+@functools.lru_cache(maxsize=64)
+def is_use_scene_dimensions_text(text):
+    """Check if a string matches the 'Use Scene Dimensions' option"""
+    str_value = text.strip()
+    
+    # Direct equality check with our constant
+    if str_value == USE_SCENE_DIMENSIONS:
+        return True
+    
+    # Check for case-insensitive match on the visible text
+    if str_value.lower() == "use scene dimensions":
+        return True
+    
+    # Check if string contains our special markers (in any order)
+    return USE_SCENE_DIMENSIONS_MARKERS_RE.match(str_value) is not None
+
 # Toggle panning on/off
 def toggle_panning(pressed):
     """Toggle panning on or off based on hotkey press"""
@@ -959,51 +1486,51 @@ def toggle_panning(pressed):
         return
         
     # Check if main switch is enabled
-    if not settings["master_enabled"]:
+    if not settings.master_enabled:
         log("Cannot toggle: Master switch is disabled")
         return
     
     # Toggle state
-    settings["pan_enabled"] = not settings["pan_enabled"]
+    settings.pan_enabled = not settings.pan_enabled
     
-    if settings["pan_enabled"]:
+    if settings.pan_enabled:
         # Always clear cached values first to ensure fresh capture
-        source_settings["viewport_width"] = 0
-        source_settings["viewport_height"] = 0
-        source_settings["viewport_scene_center_x"] = 0
-        source_settings["viewport_scene_center_y"] = 0
-        source_settings["is_initial_state_captured"] = False
-        source_settings["crop_left"] = 0 # Reset crop
-        source_settings["crop_top"] = 0
-        source_settings["crop_right"] = 0
-        source_settings["crop_bottom"] = 0
+        source_settings.viewport_width = 0
+        source_settings.viewport_height = 0
+        source_settings.viewport_scene_center_x = 0
+        source_settings.viewport_scene_center_y = 0
+        source_settings.is_initial_state_captured = False
+        source_settings.crop_left = 0 # Reset crop
+        source_settings.crop_top = 0
+        source_settings.crop_right = 0
+        source_settings.crop_bottom = 0
         
         # Enable panning - verify we have required sources first
-        target_source_name = settings["source_name"]
-        target_source_uuid = settings["source_uuid"]
-        viewport_source_name = settings["viewport_color_source_name"]
-        viewport_source_uuid = settings["viewport_color_source_uuid"]
+        target_source_name = settings.source_name
+        target_source_uuid = settings.source_uuid
+        viewport_source_name = settings.viewport_color_source_name
+        viewport_source_uuid = settings.viewport_color_source_uuid
         
         # First check: should we be using scene dimensions?
         is_using_scene_dims = is_use_scene_dimensions(viewport_source_name)
         
         # Second check: empty viewport but we have a scene - use scene dimensions as fallback
-        if not viewport_source_name and settings["target_scene_name"]:
+        if not viewport_source_name and settings.target_scene_name:
             log_warning("No viewport source selected, but scene exists - using scene dimensions as fallback")
             is_using_scene_dims = True
             # Update settings to reflect this change
-            settings["viewport_color_source_name"] = USE_SCENE_DIMENSIONS
+            settings.viewport_color_source_name = USE_SCENE_DIMENSIONS
             
         # Basic Checks
         if not target_source_name:
             log_error("Cannot enable panning: No Target Source selected.")
-            settings["pan_enabled"] = False
+            settings.pan_enabled = False
             return
         
         # Check for viewport source - empty is valid if we're using scene dimensions
         if not viewport_source_name and not is_using_scene_dims:
             log_error(f"Cannot enable panning: No Viewport Source selected. viewport_source_name='{viewport_source_name}', is_using_scene_dims={is_using_scene_dims}")
-            settings["pan_enabled"] = False
+            settings.pan_enabled = False
             return
         
         # Special handling for "Use Scene Dimensions" option
@@ -1011,16 +1538,11 @@ def toggle_panning(pressed):
             log(f"Using scene dimensions for viewport")
             
             # Get target scene
-            scene_source = None
-            if settings["target_scene_uuid"]:
-                scene_source = find_source_by_uuid(settings["target_scene_uuid"])
-            
-            if not scene_source:
-                scene_source = obs.obs_get_source_by_name(settings["target_scene_name"])
+            scene_source = get_scene_source(settings.target_scene_name, settings.target_scene_uuid)
             
             if not scene_source:
-                log_error(f"Cannot enable panning: Target Scene '{settings['target_scene_name']}' not found.")
-                settings["pan_enabled"] = False
+                log_error(f"Cannot enable panning: Target Scene '{settings.target_scene_name}' not found.")
+                settings.pan_enabled = False
                 return
                 
             # Get scene dimensions
@@ -1029,7 +1551,7 @@ def toggle_panning(pressed):
             if scene_width <= 0 or scene_height <= 0:
                 log_error(f"Cannot enable panning: Could not determine scene dimensions.")
                 obs.obs_source_release(scene_source)
-                settings["pan_enabled"] = False
+                settings.pan_enabled = False
                 return
                 
             # Get scene center position (0, 0) is top-left
@@ -1039,10 +1561,10 @@ def toggle_panning(pressed):
             log(f"Using scene dimensions: {scene_width}x{scene_height}, Center: ({scene_center_x},{scene_center_y})")
             
             # Store viewport dimensions
-            source_settings["viewport_width"] = scene_width
-            source_settings["viewport_height"] = scene_height
-            source_settings["viewport_scene_center_x"] = scene_center_x
-            source_settings["viewport_scene_center_y"] = scene_center_y
+            source_settings.viewport_width = scene_width
+            source_settings.viewport_height = scene_height
+            source_settings.viewport_scene_center_x = scene_center_x
+            source_settings.viewport_scene_center_y = scene_center_y
             
             # Release scene source
             obs.obs_source_release(scene_source)
@@ -1051,90 +1573,14 @@ def toggle_panning(pressed):
             log(f"Capturing viewport dimensions for: {viewport_source_name}")
             
             # Find the viewport source in any scene to get its bounds
-            viewport_scene_item = None
-            viewport_found_in_scene = False
-            
-            # Try to find viewport source by UUID first if available
-            if viewport_source_uuid:
-                viewport_source = find_source_by_uuid(viewport_source_uuid)
-                if viewport_source:
-                    log(f"Found viewport source '{viewport_source_name}' by UUID")
-                    
-                    # Now look for this source's scene item in the target scene
-                    if settings["target_scene_name"]:
-                        scene_source = None
-                        if settings["target_scene_uuid"]:
-                            scene_source = find_source_by_uuid(settings["target_scene_uuid"])
-                        if not scene_source:
-                            scene_source = obs.obs_get_source_by_name(settings["target_scene_name"])
-                            
-                        if scene_source:
-                            scene = obs.obs_scene_from_source(scene_source)
-                            if scene:
-                                # Enumerate items to find the one with matching source
-                                items = obs.obs_scene_enum_items(scene)
-                                if items:
-                                    for item in items:
-                                        if not item:
-                                            continue
-                                            
-                                        item_source = obs.obs_sceneitem_get_source(item)
-                                        if not item_source:
-                                            continue
-                                            
-                                        item_uuid = get_source_uuid(item_source)
-                                        if item_uuid == viewport_source_uuid:
-                                            viewport_scene_item = item
-                                            viewport_found_in_scene = True
-                                            # Don't release this specific item
-                                            items[items.index(item)] = None
-                                            break
-                                            
-                                    obs.sceneitem_list_release(items)
-                            
-                            obs.obs_source_release(scene_source)
-                    
-                    obs.obs_source_release(viewport_source)
-            
-            # If not found by UUID, try traditional methods
-            if not viewport_found_in_scene:
-                # Check current scene first
-                current_scene = obs.obs_frontend_get_current_scene()
-                if current_scene:
-                    scene_obj = obs.obs_scene_from_source(current_scene)
-                    if scene_obj:
-                        viewport_scene_item = find_scene_item(current_scene, viewport_source_name)
-                        if viewport_scene_item:
-                            viewport_found_in_scene = True
-                    obs.obs_source_release(current_scene)
-                
-                # If not found in current scene, search target scene
-                if not viewport_found_in_scene and settings["target_scene_name"]:
-                    scene_source = obs.obs_get_source_by_name(settings["target_scene_name"])
-                    if scene_source:
-                        scene_obj = obs.obs_scene_from_source(scene_source)
-                        if scene_obj:
-                            viewport_scene_item = find_scene_item(scene_source, viewport_source_name)
-                            if viewport_scene_item:
-                                viewport_found_in_scene = True
-                        obs.obs_source_release(scene_source)
-                
-                # If still not found, search all scenes
-                if not viewport_found_in_scene:
-                    scenes = obs.obs_frontend_get_scenes()
-                    if scenes:
-                        for scene in scenes:
-                            scene_name = obs.obs_source_get_name(scene)
-                            viewport_scene_item = find_scene_item(scene, viewport_source_name)
-                            if viewport_scene_item:
-                                viewport_found_in_scene = True
-                                break
-                        obs.source_list_release(scenes)
+            viewport_scene_item = find_viewport_scene_item(
+                viewport_source_name, viewport_source_uuid,
+                settings.target_scene_name, settings.target_scene_uuid)
             
             # If found in a scene, get its bounds
-            if viewport_found_in_scene and viewport_scene_item:
+            if viewport_scene_item:
                 # Get position
-                pos = obs.vec2()
+                pos = g_scratch_pos
                 obs.obs_sceneitem_get_pos(viewport_scene_item, pos)
                 
                 # Get the source info for base dimensions
@@ -1143,7 +1589,7 @@ def toggle_panning(pressed):
                 vp_base_height = obs.obs_source_get_height(viewport_source)
                 
                 # Get scale to calculate bounds
-                scale = obs.vec2()
+                scale = g_scratch_scale
                 obs.obs_sceneitem_get_scale(viewport_scene_item, scale)
                 
                 # Calculate actual viewport dimensions based on bounds
@@ -1160,15 +1606,14 @@ def toggle_panning(pressed):
                     # If the item has rotation or special alignment, use bounding box
                     # This ensures we get the true visible dimensions on screen
                     if rot != 0.0 or alignment != 0:
-                        # Create a bounding box struct
-                        bounds_type = obs.OBS_BOUNDS_STRETCH  # Default bounds type
-                        bounds = obs.vec2()
+                        # Reuse the scratch bounding box struct
+                        bounds = g_scratch_bounds
                         
                         # Get current bounds
                         obs.obs_sceneitem_get_bounds(viewport_scene_item, bounds)
                         bounds_type = obs.obs_sceneitem_get_bounds_type(viewport_scene_item)
                         
-                        if bounds_type != obs.OBS_BOUNDS_NONE:
+                        if bounds_type != BOUNDS_NONE:
                             viewport_width = bounds.x
                             viewport_height = bounds.y
                             log(f"Using bounds values: {viewport_width}x{viewport_height}")
@@ -1176,15 +1621,15 @@ def toggle_panning(pressed):
                     log_warning(f"Could not get precise bounds, using scaled dimensions: {e}")
                 
                 # Calculate viewport's center in the scene
-                source_settings["viewport_scene_center_x"] = pos.x + (viewport_width / 2.0)
-                source_settings["viewport_scene_center_y"] = pos.y + (viewport_height / 2.0)
+                source_settings.viewport_scene_center_x = pos.x + (viewport_width / 2.0)
+                source_settings.viewport_scene_center_y = pos.y + (viewport_height / 2.0)
                 
                 log(f"Found viewport source in scene with bounds: {viewport_width:.0f}x{viewport_height:.0f}, Pos: ({pos.x:.1f},{pos.y:.1f})")
-                log(f"Viewport scene center calculated: ({source_settings['viewport_scene_center_x']:.1f},{source_settings['viewport_scene_center_y']:.1f})")
+                log(f"Viewport scene center calculated: ({source_settings.viewport_scene_center_x:.1f},{source_settings.viewport_scene_center_y:.1f})")
                 
                 # Store viewport dimensions
-                source_settings["viewport_width"] = viewport_width
-                source_settings["viewport_height"] = viewport_height
+                source_settings.viewport_width = viewport_width
+                source_settings.viewport_height = viewport_height
                 
                 # Release the viewport scene item
                 if viewport_scene_item:
@@ -1195,96 +1640,75 @@ def toggle_panning(pressed):
             else:
                 log_error(f"Viewport source '{viewport_source_name}' not found as an item in any scene. Panning cannot be enabled.")
                 log_error("Please add the viewport source to a scene and ensure it's spelled correctly.")
-                settings["pan_enabled"] = False # Crucial: Prevent enabling panning
+                settings.pan_enabled = False # Crucial: Prevent enabling panning
                 return
         
         # Now find and store the source item
         scene_item = get_source_scene_item(target_source_name, target_source_uuid, settings)
         if not scene_item:
             log_error(f"Cannot enable panning: Target Source '{target_source_name}' not found in any scene.")
-            settings["pan_enabled"] = False
+            settings.pan_enabled = False
             return
         
         # IMPORTANT: Check and set alignment to CENTER
-        if isinstance(scene_item, dict) and scene_item.get("is_direct_source"):
+        if type(scene_item) is DirectSourceItem:
             # For direct sources, we may not be able to set alignment
             log_warning("Direct source mode does not support changing alignment. Please set Center alignment manually.")
         else:
             # For standard scene items, check and set alignment
             current_alignment = obs.obs_sceneitem_get_alignment(scene_item)
             
-            # Define OBS alignment constants
-            OBS_ALIGN_CENTER = 0  # This appears to be incorrect in our implementation
-            
-            # Try to get the constants from the obs module if available
-            try:
-                # These constants may be directly available in the obs module
-                if hasattr(obs, "OBS_ALIGN_CENTER"):
-                    OBS_ALIGN_CENTER = obs.OBS_ALIGN_CENTER
-                else:
-                    # If not directly available, these are the typical values
-                    # OBS_ALIGN_LEFT = 0x0001
-                    # OBS_ALIGN_RIGHT = 0x0002
-                    # OBS_ALIGN_TOP = 0x0004
-                    # OBS_ALIGN_BOTTOM = 0x0008
-                    # OBS_ALIGN_CENTER = 0x0010
-                    OBS_ALIGN_CENTER = 0x0010
-                log(f"Using OBS_ALIGN_CENTER value: {OBS_ALIGN_CENTER}")
-            except Exception as e:
-                log_error(f"Error getting alignment constants: {e}, using default value 0x0010")
-                OBS_ALIGN_CENTER = 0x0010  # Center alignment value
-            
             # Check if alignment needs to be changed to CENTER
-            if current_alignment != OBS_ALIGN_CENTER:
-                log(f"Setting alignment to CENTER (was {current_alignment}, using value {OBS_ALIGN_CENTER})")
-                obs.obs_sceneitem_set_alignment(scene_item, OBS_ALIGN_CENTER)
+            if current_alignment != ALIGN_CENTER:
+                log(f"Setting alignment to CENTER (was {current_alignment})")
+                obs.obs_sceneitem_set_alignment(scene_item, ALIGN_CENTER)
         
         # IMPORTANT: Make a copy of the scene item properties instead of storing a reference
         # This avoids keeping references to OBS objects that might cause crashes on exit
-        if isinstance(scene_item, dict) and scene_item.get("is_direct_source"):
+        if type(scene_item) is DirectSourceItem:
             # For direct sources, store a copy of the properties
-            source = scene_item.get("source")
+            source = scene_item.source
             if source:
                 source_width = obs.obs_source_get_width(source)
                 source_height = obs.obs_source_get_height(source)
                 
                 # Store source dimensions
-                source_settings["source_base_width"] = source_width
-                source_settings["source_base_height"] = source_height
+                source_settings.source_base_width = source_width
+                source_settings.source_base_height = source_height
                 
                 # Get current position and scale
                 pos_x, pos_y, scale_x, scale_y = get_item_transform(scene_item)
                 if pos_x is not None and scale_x is not None:
-                    source_settings["initial_pos_x"] = pos_x
-                    source_settings["initial_pos_y"] = pos_y
-                    source_settings["initial_scale_x"] = scale_x
-                    source_settings["initial_scale_y"] = scale_y
-                    source_settings["is_initial_state_captured"] = True
+                    source_settings.initial_pos_x = pos_x
+                    source_settings.initial_pos_y = pos_y
+                    source_settings.initial_scale_x = scale_x
+                    source_settings.initial_scale_y = scale_y
+                    source_settings.is_initial_state_captured = True
                     log(f"Initial state captured: Pos=({pos_x:.1f},{pos_y:.1f}), Scale=({scale_x:.2f},{scale_y:.2f})")
                 else:
-                    source_settings["initial_pos_x"] = 0
-                    source_settings["initial_pos_y"] = 0
-                    source_settings["initial_scale_x"] = 1.0
-                    source_settings["initial_scale_y"] = 1.0
-                    source_settings["is_initial_state_captured"] = True
+                    source_settings.initial_pos_x = 0
+                    source_settings.initial_pos_y = 0
+                    source_settings.initial_scale_x = 1.0
+                    source_settings.initial_scale_y = 1.0
+                    source_settings.is_initial_state_captured = True
                     log_warning("Could not get initial transform values. Using defaults.")
                 
                 # Get crop values if it's a standard scene item
-                crop = obs.obs_sceneitem_crop()
+                crop = g_scratch_crop
                 obs.obs_sceneitem_get_crop(scene_item, crop)
-                source_settings["crop_left"] = crop.left
-                source_settings["crop_top"] = crop.top
-                source_settings["crop_right"] = crop.right
-                source_settings["crop_bottom"] = crop.bottom
+                source_settings.crop_left = crop.left
+                source_settings.crop_top = crop.top
+                source_settings.crop_right = crop.right
+                source_settings.crop_bottom = crop.bottom
                 log(f"Captured crop: L{crop.left} T{crop.top} R{crop.right} B{crop.bottom}")
             else:
-                source_settings["source_base_width"] = 1920  # Fallback
-                source_settings["source_base_height"] = 1080  # Fallback
-                source_settings["initial_pos_x"] = 0
-                source_settings["initial_pos_y"] = 0
-                source_settings["initial_scale_x"] = 1.0
-                source_settings["initial_scale_y"] = 1.0
-                source_settings["is_initial_state_captured"] = True
+                source_settings.source_base_width = 1920  # Fallback
+                source_settings.source_base_height = 1080  # Fallback
+                source_settings.initial_pos_x = 0
+                source_settings.initial_pos_y = 0
+                source_settings.initial_scale_x = 1.0
+                source_settings.initial_scale_y = 1.0
+                source_settings.is_initial_state_captured = True
         else:
             # For standard scene items
             source = obs.obs_sceneitem_get_source(scene_item)
@@ -1293,42 +1717,42 @@ def toggle_panning(pressed):
                 source_height = obs.obs_source_get_height(source)
                 
                 # Store source dimensions
-                source_settings["source_base_width"] = source_width
-                source_settings["source_base_height"] = source_height
+                source_settings.source_base_width = source_width
+                source_settings.source_base_height = source_height
                 
                 # Get current position and scale
                 pos_x, pos_y, scale_x, scale_y = get_item_transform(scene_item)
                 if pos_x is not None and scale_x is not None:
-                    source_settings["initial_pos_x"] = pos_x
-                    source_settings["initial_pos_y"] = pos_y
-                    source_settings["initial_scale_x"] = scale_x
-                    source_settings["initial_scale_y"] = scale_y
-                    source_settings["is_initial_state_captured"] = True
+                    source_settings.initial_pos_x = pos_x
+                    source_settings.initial_pos_y = pos_y
+                    source_settings.initial_scale_x = scale_x
+                    source_settings.initial_scale_y = scale_y
+                    source_settings.is_initial_state_captured = True
                     log(f"Initial state captured: Pos=({pos_x:.1f},{pos_y:.1f}), Scale=({scale_x:.2f},{scale_y:.2f})")
                 else:
-                    source_settings["initial_pos_x"] = 0
-                    source_settings["initial_pos_y"] = 0
-                    source_settings["initial_scale_x"] = 1.0
-                    source_settings["initial_scale_y"] = 1.0
-                    source_settings["is_initial_state_captured"] = True
+                    source_settings.initial_pos_x = 0
+                    source_settings.initial_pos_y = 0
+                    source_settings.initial_scale_x = 1.0
+                    source_settings.initial_scale_y = 1.0
+                    source_settings.is_initial_state_captured = True
                     log_warning("Could not get initial transform values. Using defaults.")
                 
                 # Get crop values if it's a standard scene item
-                crop = obs.obs_sceneitem_crop()
+                crop = g_scratch_crop
                 obs.obs_sceneitem_get_crop(scene_item, crop)
-                source_settings["crop_left"] = crop.left
-                source_settings["crop_top"] = crop.top
-                source_settings["crop_right"] = crop.right
-                source_settings["crop_bottom"] = crop.bottom
+                source_settings.crop_left = crop.left
+                source_settings.crop_top = crop.top
+                source_settings.crop_right = crop.right
+                source_settings.crop_bottom = crop.bottom
                 log(f"Captured crop: L{crop.left} T{crop.top} R{crop.right} B{crop.bottom}")
             else:
-                source_settings["source_base_width"] = 1920  # Fallback
-                source_settings["source_base_height"] = 1080  # Fallback
-                source_settings["initial_pos_x"] = 0
-                source_settings["initial_pos_y"] = 0
-                source_settings["initial_scale_x"] = 1.0
-                source_settings["initial_scale_y"] = 1.0
-                source_settings["is_initial_state_captured"] = True
+                source_settings.source_base_width = 1920  # Fallback
+                source_settings.source_base_height = 1080  # Fallback
+                source_settings.initial_pos_x = 0
+                source_settings.initial_pos_y = 0
+                source_settings.initial_scale_x = 1.0
+                source_settings.initial_scale_y = 1.0
+                source_settings.is_initial_state_captured = True
             
             # Store the scene item reference
             g_current_scene_item = scene_item
@@ -1338,104 +1762,59 @@ def toggle_panning(pressed):
         log("Disabling panning...")
         
         # Disable any ongoing zoom transition
-        source_settings["is_transitioning"] = False
-        settings["zoom_enabled"] = False
+        source_settings.is_transitioning = False
+        settings.zoom_enabled = False
         
         # Restore original position if we have the data and a valid scene item
-        if source_settings["is_initial_state_captured"] and g_current_scene_item:
+        if source_settings.is_initial_state_captured and g_current_scene_item:
             try:
                 # Restore original position and scale
                 set_item_transform(
                     g_current_scene_item,
-                    source_settings["initial_pos_x"],
-                    source_settings["initial_pos_y"],
-                    source_settings["initial_scale_x"],
-                    source_settings["initial_scale_y"]
+                    source_settings.initial_pos_x,
+                    source_settings.initial_pos_y,
+                    source_settings.initial_scale_x,
+                    source_settings.initial_scale_y
                 )
                 log(f"Restored position and scale to initial values")
                 
                 # Ensure CENTER alignment is maintained when panning is turned off
-                if not isinstance(g_current_scene_item, dict):  # If it's a standard scene item
-                    # Define OBS alignment constants
-                    OBS_ALIGN_CENTER = 0  # This appears to be incorrect in our implementation
-                    
-                    # Try to get the constants from the obs module if available
-                    try:
-                        # These constants may be directly available in the obs module
-                        if hasattr(obs, "OBS_ALIGN_CENTER"):
-                            OBS_ALIGN_CENTER = obs.OBS_ALIGN_CENTER
-                        else:
-                            # If not directly available, these are the typical values
-                            OBS_ALIGN_CENTER = 0x0010
-                        log(f"Using OBS_ALIGN_CENTER value: {OBS_ALIGN_CENTER}")
-                    except Exception as e:
-                        log_error(f"Error getting alignment constants: {e}, using default value 0x0010")
-                        OBS_ALIGN_CENTER = 0x0010  # Center alignment value
-                    
+                if type(g_current_scene_item) is not DirectSourceItem:  # If it's a standard scene item
                     current_alignment = obs.obs_sceneitem_get_alignment(g_current_scene_item)
-                    if current_alignment != OBS_ALIGN_CENTER:
-                        log(f"Maintaining CENTER alignment (was {current_alignment}, using value {OBS_ALIGN_CENTER})")
-                        obs.obs_sceneitem_set_alignment(g_current_scene_item, OBS_ALIGN_CENTER)
+                    if current_alignment != ALIGN_CENTER:
+                        log(f"Maintaining CENTER alignment (was {current_alignment}, using value {ALIGN_CENTER})")
+                        obs.obs_sceneitem_set_alignment(g_current_scene_item, ALIGN_CENTER)
                     
                     # Center the source on screen (center to viewport)
-                    if source_settings["viewport_width"] > 0 and source_settings["viewport_height"] > 0:
-                        center_x = source_settings["viewport_scene_center_x"]
-                        center_y = source_settings["viewport_scene_center_y"]
-                        set_item_transform(g_current_scene_item, center_x, center_y)
-                        log(f"Centered source on screen at ({center_x:.1f}, {center_y:.1f})")
+                    if source_settings.viewport_width > 0 and source_settings.viewport_height > 0:
+                        center_x = source_settings.viewport_scene_center_x
+                        center_y = source_settings.viewport_scene_center_y
+                        # Skip the write (and the scene re-render it triggers) when already centered
+                        current_pos = g_scratch_pos
+                        obs.obs_sceneitem_get_pos(g_current_scene_item, current_pos)
+                        if abs(current_pos.x - center_x) > CENTER_POSITION_EPSILON or abs(current_pos.y - center_y) > CENTER_POSITION_EPSILON:
+                            set_item_transform(g_current_scene_item, center_x, center_y)
+                            log(f"Centered source on screen at ({center_x:.1f}, {center_y:.1f})")
             except Exception as e:
                 log_error(f"Error restoring position: {e}")
         
         # Make local copies of references before clearing them
         scene_item_to_release = None
-        if g_current_scene_item and not isinstance(g_current_scene_item, dict):
+        if g_current_scene_item and type(g_current_scene_item) is not DirectSourceItem:
             scene_item_to_release = g_current_scene_item
         
-        direct_source_to_release = settings.get("direct_source_cache")
+        direct_source_to_release = settings.direct_source_cache
         
         # Clear all references BEFORE releasing them
         g_current_scene_item = None
-        settings["direct_source_cache"] = None
-        settings["direct_mode"] = False
+        settings.direct_source_cache = None
+        settings.direct_mode = False
         
         # Now release the resources from our local copies
-        if scene_item_to_release:
-            try:
-                obs.obs_sceneitem_release(scene_item_to_release)
-                log("Released scene item")
-            except Exception as e:
-                log_error(f"Error releasing scene item: {e}")
+        release_item_and_source(scene_item_to_release, direct_source_to_release)
         
-        if direct_source_to_release:
-            try:
-                obs.obs_source_release(direct_source_to_release)
-                log("Released direct source")
-            except Exception as e:
-                log_error(f"Error releasing direct source: {e}")
-        
-        # Reset all state variables to defaults
-        source_settings["viewport_width"] = 0
-        source_settings["viewport_height"] = 0
-        source_settings["viewport_scene_center_x"] = 0
-        source_settings["viewport_scene_center_y"] = 0
-        source_settings["source_base_width"] = 0
-        source_settings["source_base_height"] = 0
-        source_settings["initial_pos_x"] = 0
-        source_settings["initial_pos_y"] = 0
-        source_settings["initial_scale_x"] = 1.0
-        source_settings["initial_scale_y"] = 1.0
-        source_settings["is_initial_state_captured"] = False
-        source_settings["crop_left"] = 0 # Reset crop
-        source_settings["crop_top"] = 0
-        source_settings["crop_right"] = 0
-        source_settings["crop_bottom"] = 0
-        
-        # Force garbage collection
-        try:
-            import gc
-            gc.collect()
-        except Exception as e:
-            log_error(f"Error during garbage collection: {e}")
+        # Reset the captured viewport/initial-state values to defaults
+        source_settings.reset_captured_state()
         
         log("Panning DISABLED - All resources released")
 
@@ -1449,57 +1828,66 @@ def toggle_zooming(pressed):
         return
         
     # Check if main switch is enabled
-    if not settings["master_enabled"]:
+    if not settings.master_enabled:
         log("Cannot toggle zooming: Master switch is disabled")
         return
     
     # Check if panning is enabled (required for zooming)
-    if not settings["pan_enabled"]:
+    if not settings.pan_enabled:
         log("Cannot toggle zooming: Panning must be enabled first")
         return
     
-    if source_settings["viewport_width"] <= 0 or source_settings["viewport_height"] <= 0:
+    if source_settings.viewport_width <= 0 or source_settings.viewport_height <= 0:
         log("Cannot toggle zooming: Viewport not set properly.")
         return
     
     # Toggle zoom state
-    new_zoom_enabled = not settings["zoom_enabled"]
-    settings["zoom_enabled"] = new_zoom_enabled
+    new_zoom_enabled = not settings.zoom_enabled
+    settings.zoom_enabled = new_zoom_enabled
     
     # Only start a transition if we have a valid scene item
     if g_current_scene_item:
+        # One clock read serves both the mid-transition zoom and the new start time
+        now = time.monotonic()
+        zoom_level = settings.zoom_level
+        
         # Determine current actual zoom level (might be mid-transition)
-        current_zoom = settings["zoom_level"]
+        current_zoom = zoom_level
         
         # If we're in the middle of a transition, calculate the actual current zoom level
-        if source_settings["is_transitioning"]:
-            elapsed_time = time.time() - source_settings["transition_start_time"]
-            progress = min(1.0, elapsed_time / source_settings["transition_duration"])
-            eased_progress = ease_in_out_quad(progress)
+        if source_settings.is_transitioning:
+            start_zoom = source_settings.transition_start_zoom
+            target_zoom = source_settings.transition_target_zoom
+            elapsed_time = now - source_settings.transition_start_time
+            transition_duration = source_settings.transition_duration
             
             # Get the actual current interpolated zoom level
-            start_zoom = source_settings["transition_start_zoom"]
-            target_zoom = source_settings["transition_target_zoom"]
-            current_zoom = start_zoom + (target_zoom - start_zoom) * eased_progress
+            if elapsed_time >= transition_duration:
+                current_zoom = target_zoom
+            else:
+                eased_progress = ease_in_out_quad(elapsed_time / transition_duration)
+                current_zoom = start_zoom + (target_zoom - start_zoom) * eased_progress
             
         # Set up the transition
-        source_settings["is_transitioning"] = True
-        source_settings["transition_start_time"] = time.time()
+        source_settings.is_transitioning = True
+        source_settings.transition_start_time = now
         
         if new_zoom_enabled:
             # Transitioning from 1.0 to zoom_level (zoom IN)
-            source_settings["transition_start_zoom"] = 1.0
-            source_settings["transition_target_zoom"] = settings["zoom_level"]
-            source_settings["transition_duration"] = settings["zoom_in_duration"]
-            source_settings["is_zooming_in"] = True
-            log(f"Zooming IN to {settings['zoom_level']}x over {settings['zoom_in_duration']}s")
+            zoom_in_duration = settings.zoom_in_duration
+            source_settings.transition_start_zoom = 1.0
+            source_settings.transition_target_zoom = zoom_level
+            source_settings.transition_duration = zoom_in_duration
+            source_settings.is_zooming_in = True
+            log("Zooming IN to %sx over %ss", zoom_level, zoom_in_duration)
         else:
             # Transitioning from current zoom level to 1.0 (zoom OUT)
-            source_settings["transition_start_zoom"] = current_zoom
-            source_settings["transition_target_zoom"] = 1.0
-            source_settings["transition_duration"] = settings["zoom_out_duration"] 
-            source_settings["is_zooming_in"] = False
-            log(f"Zooming OUT to 1.0x over {settings['zoom_out_duration']}s from current zoom {current_zoom:.2f}")
+            zoom_out_duration = settings.zoom_out_duration
+            source_settings.transition_start_zoom = current_zoom
+            source_settings.transition_target_zoom = 1.0
+            source_settings.transition_duration = zoom_out_duration
+            source_settings.is_zooming_in = False
+            log("Zooming OUT to 1.0x over %ss from current zoom %.2f", zoom_out_duration, current_zoom)
     else:
         log_warning("Cannot perform zoom transition: No valid scene item")
 
@@ -1576,9 +1964,10 @@ def toggle_instructions_visibility(props, prop):
     button = obs.obs_properties_get(props, "toggle_instructions")
     instructions_text = obs.obs_properties_get(props, "setup_instructions")
     
-    # Update button text
+    # Update button text (and fill in the instructions the first time they are shown)
     if g_show_instructions:
         obs.obs_property_set_description(button, "Hide Instructions")
+        obs.obs_property_set_description(instructions_text, SETUP_INSTRUCTIONS)
     else:
         obs.obs_property_set_description(button, "Show Instructions")
     
@@ -1660,9 +2049,9 @@ def script_properties():
     else:
         obs.obs_property_set_description(toggle_button, "Show Instructions")
     
-    # Add instructions text (hidden by default)
+    # Add instructions text (hidden by default; the HTML is only handed to OBS once it is shown)
     instructions_text = obs.obs_properties_add_text(props, "setup_instructions",
-                                            SETUP_INSTRUCTIONS, obs.OBS_TEXT_INFO)
+                                            SETUP_INSTRUCTIONS if g_show_instructions else "", obs.OBS_TEXT_INFO)
     # Set initial visibility based on global state
     obs.obs_property_set_visible(instructions_text, g_show_instructions)
     
@@ -1711,8 +2100,7 @@ def script_properties():
     # If auto-refresh is enabled, refresh the scenes and sources now
     if script_settings and obs.obs_data_get_bool(script_settings, "auto_refresh_enabled"):
         log("Auto-refreshing scenes and sources on UI open")
-        refresh_caches_for_config(config1)
-        refresh_caches_for_config(config2)
+        refresh_caches_for_both_configs()
     
     return props
 
@@ -1750,7 +2138,7 @@ def refresh_config_sources_clicked(props, prop):
             obs.obs_property_list_add_string(target_src_list, "Select Source", "")
             
             # For viewport source list
-            if current_config.get("target_scene_name"):
+            if current_config.target_scene_name:
                 # Add 'Use Scene Dimensions' option for viewport list
                 obs.obs_property_list_add_string(viewport_src_list, "Use Scene Dimensions", USE_SCENE_DIMENSIONS)
             else:
@@ -1758,18 +2146,14 @@ def refresh_config_sources_clicked(props, prop):
                 obs.obs_property_list_add_string(viewport_src_list, "Select Source", "")
             
             # Add cached source items
-            if current_config.get("source_cache"):
-                for source_item in current_config.get("source_cache"):
-                    obs.obs_property_list_add_string(target_src_list, source_item["name"], source_item["value"])
+            add_list_strings(target_src_list, [(item["name"], item["value"]) for item in current_config.source_cache])
             
             # Add cached viewport items (skip "Use Scene Dimensions" as we already added it)
-            if current_config.get("viewport_cache"):
-                for viewport_item in current_config.get("viewport_cache"):
-                    if viewport_item["value"] != USE_SCENE_DIMENSIONS:
-                        obs.obs_property_list_add_string(viewport_src_list, viewport_item["name"], viewport_item["value"])
+            add_list_strings(viewport_src_list, [(item["name"], item["value"]) for item in current_config.viewport_cache
+                                                 if item["value"] != USE_SCENE_DIMENSIONS])
             
             # Set visibility based on whether a scene is selected
-            has_scene = bool(current_config.get("target_scene_name"))
+            has_scene = bool(current_config.target_scene_name)
             obs.obs_property_set_visible(target_src_list, has_scene)
             obs.obs_property_set_visible(viewport_src_list, has_scene)
         
@@ -1779,6 +2163,15 @@ def refresh_config_sources_clicked(props, prop):
         log_error(f"Error refreshing config {config_num} sources: {e}\n{traceback.format_exc()}")
         return False
 
+# Bind a property modified-callback to one config (OBS only accepts plain functions, not partials)
+def bind_config_callback(callback, config_num):
+    """Return a modified-callback that passes the config's number, config and source settings to callback"""
+    current_config = config1 if config_num == 1 else config2
+    src_settings = source_settings1 if config_num == 1 else source_settings2
+    def config_callback(props, prop, settings_obj):
+        return callback(props, prop, settings_obj, config_num, current_config, src_settings)
+    return config_callback
+
 # Helper function to create config-specific properties
 def create_config_properties(config_num):
     props = obs.obs_properties_create()
@@ -1796,20 +2189,10 @@ def create_config_properties(config_num):
     # Add "Select Scene" as first option
     obs.obs_property_list_add_string(scene_list, "Select Scene", "")
     
-    # Populate with available scenes
-    scenes = obs.obs_frontend_get_scenes()
-    if scenes:
-        for scene in scenes:
-            scene_name = obs.obs_source_get_name(scene)
-            scene_uuid = get_source_uuid(scene)
-            
-            # Store as composite value
-            composite_value = f"{scene_name}:{scene_uuid}"
-            obs.obs_property_list_add_string(scene_list, scene_name, composite_value)
-        obs.source_list_release(scenes)
+    # Populate with available scenes (stored as "name:uuid" composite values)
+    add_list_strings(scene_list, get_scene_list_entries())
     
-    # NOTE: We'll need to modify the callback implementation later
-    obs.obs_property_set_modified_callback(scene_list, on_target_scene_changed)
+    obs.obs_property_set_modified_callback(scene_list, bind_config_callback(on_target_scene_changed, config_num))
     
     # Target Source
     target_source_list = obs.obs_properties_add_list(props, f"{config_prefix}source_name", "Target Display Capture Source",
@@ -1821,11 +2204,12 @@ def create_config_properties(config_num):
     
     # Get current config to check if we should show the lists
     current_config = config1 if config_num == 1 else config2
-    has_scene_selected = current_config.get("target_scene_name", "") != ""
+    has_scene_selected = current_config.target_scene_name != ""
     
-    # Populate with cached values if available
-    source_cache_key = "source_cache"
-    viewport_cache_key = "viewport_cache"
+    # The startup refresh skips disabled configs, so build their lists the first time the UI needs them
+    # (a refreshed config with a scene always has "Use Scene Dimensions" in its viewport cache)
+    if has_scene_selected and not current_config.viewport_cache:
+        refresh_caches_for_config(current_config)
     
     # Get the current saved source and viewport values
     saved_source_value = ""
@@ -1849,15 +2233,15 @@ def create_config_properties(config_num):
     saved_viewport_added = (saved_viewport_value == "" or saved_viewport_value == USE_SCENE_DIMENSIONS)
     
     # Add cached source items if available
-    if source_cache_key in current_config and current_config[source_cache_key]:
-        for source_item in current_config[source_cache_key]:
+    if current_config.source_cache:
+        for source_item in current_config.source_cache:
             obs.obs_property_list_add_string(target_source_list, source_item["name"], source_item["value"])
             if source_item["value"] == saved_source_value:
                 saved_source_added = True
     
     # Add cached viewport items if available
-    if viewport_cache_key in current_config and current_config[viewport_cache_key]:
-        for viewport_item in current_config[viewport_cache_key]:
+    if current_config.viewport_cache:
+        for viewport_item in current_config.viewport_cache:
             # Skip "Use Scene Dimensions" as we already added it
             if viewport_item["value"] != USE_SCENE_DIMENSIONS:
                 obs.obs_property_list_add_string(viewport_list, viewport_item["name"], viewport_item["value"])
@@ -1867,10 +2251,7 @@ def create_config_properties(config_num):
     # If we haven't added the saved source value yet and it's not empty, add it
     if not saved_source_added and saved_source_value:
         # Parse the saved value to get the name
-        if ":" in saved_source_value:
-            source_name, _ = saved_source_value.split(":", 1)
-        else:
-            source_name = saved_source_value
+        source_name, _ = split_composite_value(saved_source_value)
         
         if source_name:
             obs.obs_property_list_add_string(target_source_list, source_name, saved_source_value)
@@ -1879,10 +2260,7 @@ def create_config_properties(config_num):
     # If we haven't added the saved viewport value yet and it's not empty or USE_SCENE_DIMENSIONS, add it
     if not saved_viewport_added and saved_viewport_value and saved_viewport_value != USE_SCENE_DIMENSIONS:
         # Parse the saved value to get the name
-        if ":" in saved_viewport_value:
-            viewport_name, _ = saved_viewport_value.split(":", 1)
-        else:
-            viewport_name = saved_viewport_value
+        viewport_name, _ = split_composite_value(saved_viewport_value)
         
         if viewport_name:
             obs.obs_property_list_add_string(viewport_list, viewport_name, saved_viewport_value)
@@ -1892,9 +2270,9 @@ def create_config_properties(config_num):
     obs.obs_property_set_visible(target_source_list, has_scene_selected)
     obs.obs_property_set_visible(viewport_list, has_scene_selected)
     
-    # Add callbacks for selection changes - we'll need to implement the proper versions later
-    obs.obs_property_set_modified_callback(target_source_list, on_target_source_changed)
-    obs.obs_property_set_modified_callback(viewport_list, on_viewport_source_changed)
+    # Add callbacks for selection changes, each bound to this config
+    obs.obs_property_set_modified_callback(target_source_list, bind_config_callback(on_target_source_changed, config_num))
+    obs.obs_property_set_modified_callback(viewport_list, bind_config_callback(on_viewport_source_changed, config_num))
     
     # Monitor list - using a string property for better persistence
     monitor_list = obs.obs_properties_add_list(props, f"{config_prefix}monitor_id_string", "Target Monitor (for mouse tracking)",
@@ -1950,7 +2328,7 @@ def create_config_properties(config_num):
     
     # Add viewport alignment status indicator - more compact styling
     current_config = config1 if config_num == 1 else config2
-    alignment_status = current_config.get("viewport_alignment_correct", True)
+    alignment_status = current_config.viewport_alignment_correct
     alignment_text = "✓ Viewport alignment correct (Top Left)" if alignment_status else "⚠ VIEWPORT ALIGNMENT INCORRECT! Set to Top Left in Edit Transform"
     alignment_style = "color: green; font-weight: bold; margin: 0; padding: 0;" if alignment_status else "color: red; font-weight: bold; background-color: #fff3cd; padding: 2px; margin: 0;"
     
@@ -2001,26 +2379,18 @@ def script_defaults(settings_obj):
     obs.obs_data_set_default_bool(settings_obj, "config2_pause_enabled", False)
     # Removed unpause transition duration default
     
-    # Use our global variable to initialize config 1 monitor ID if it's not 0
-    global g_selected_monitor_id1
-    if g_selected_monitor_id1 > 0:
+    # Seed the monitor strings from the remembered monitor IDs (enumerate monitors at most once)
+    monitors = None
+    for config_num, monitor_id in ((1, g_selected_monitor_id1), (2, g_selected_monitor_id2)):
+        if monitor_id <= 0:
+            continue
+        if monitors is None:
+            monitors = get_monitor_info()
         # Find the monitor name from the ID
-        monitors = get_monitor_info()
-        for monitor in monitors:
-            if monitor['id'] == g_selected_monitor_id1:
-                default_value = f"{g_selected_monitor_id1}:{monitor['name']}"
-                obs.obs_data_set_string(settings_obj, "config1_monitor_id_string", default_value)
-                break
-                
-    # Do the same for config 2
-    global g_selected_monitor_id2
-    if g_selected_monitor_id2 > 0:
-        # Find the monitor name from the ID
-        monitors = get_monitor_info()
         for monitor in monitors:
-            if monitor['id'] == g_selected_monitor_id2:
-                default_value = f"{g_selected_monitor_id2}:{monitor['name']}"
-                obs.obs_data_set_string(settings_obj, "config2_monitor_id_string", default_value)
+            if monitor['id'] == monitor_id:
+                default_value = f"{monitor_id}:{monitor['name']}"
+                obs.obs_data_set_string(settings_obj, CONFIG_SETTING_KEYS[config_num]["monitor_id_string"], default_value)
                 break
 
 def script_update(settings_obj):
@@ -2030,346 +2400,81 @@ def script_update(settings_obj):
     # Store the settings object for use throughout the script
     script_settings = settings_obj
     
+    # Bound getters, reused for every read below
+    get_bool = OBS_DATA_GETTERS["bool"]
+    get_string = OBS_DATA_GETTERS["string"]
+    
     # Update visibility states
-    g_show_instructions = obs.obs_data_get_bool(settings_obj, "show_instructions")
-    g_show_config1 = obs.obs_data_get_bool(settings_obj, "show_config1")
-    g_show_config2 = obs.obs_data_get_bool(settings_obj, "show_config2")
+    g_show_instructions = get_bool(settings_obj, "show_instructions")
+    g_show_config1 = get_bool(settings_obj, "show_config1")
+    g_show_config2 = get_bool(settings_obj, "show_config2")
     
     # Store previous value of monitor_id before updating
-    previous_monitor_id = settings["monitor_id"]
+    previous_monitor_id = settings.monitor_id
     
     # Update all settings from the object
-    settings["master_enabled"] = obs.obs_data_get_bool(settings_obj, "master_enabled")
-    
-    # Update config1 settings
-    config1["enabled"] = obs.obs_data_get_bool(settings_obj, "config1_enabled")
-    
-    # Get source and viewport settings for config1
-    source_value1 = obs.obs_data_get_string(settings_obj, "config1_source_name")
-    viewport_value1 = obs.obs_data_get_string(settings_obj, "config1_viewport_color_source_name")
-    
-    # Update config1 target source
-    if ":" in source_value1:
-        source_name, source_uuid = source_value1.split(":", 1)
-        config1["source_name"] = source_name
-        config1["source_uuid"] = source_uuid
-    else:
-        config1["source_name"] = source_value1
-        config1["source_uuid"] = ""
-    
-    # Update config1 viewport source
-    if is_use_scene_dimensions(viewport_value1):
-        config1["viewport_color_source_name"] = USE_SCENE_DIMENSIONS
-        config1["viewport_color_source_uuid"] = ""
-    elif ":" in viewport_value1:
-        viewport_name, viewport_uuid = viewport_value1.split(":", 1)
-        config1["viewport_color_source_name"] = viewport_name
-        config1["viewport_color_source_uuid"] = viewport_uuid
-    else:
-        config1["viewport_color_source_name"] = viewport_value1
-        config1["viewport_color_source_uuid"] = ""
-    
-    
-    # Update config2 settings
-    config2["enabled"] = obs.obs_data_get_bool(settings_obj, "config2_enabled")
-    
-    # Get source and viewport settings for config2
-    source_value2 = obs.obs_data_get_string(settings_obj, "config2_source_name")
-    viewport_value2 = obs.obs_data_get_string(settings_obj, "config2_viewport_color_source_name")
-    
-    # Update config2 target source
-    if ":" in source_value2:
-        source_name, source_uuid = source_value2.split(":", 1)
-        config2["source_name"] = source_name
-        config2["source_uuid"] = source_uuid
-    else:
-        config2["source_name"] = source_value2
-        config2["source_uuid"] = ""
-    
-    # Update config2 viewport source
-    if is_use_scene_dimensions(viewport_value2):
-        config2["viewport_color_source_name"] = USE_SCENE_DIMENSIONS
-        config2["viewport_color_source_uuid"] = ""
-    elif ":" in viewport_value2:
-        viewport_name, viewport_uuid = viewport_value2.split(":", 1)
-        config2["viewport_color_source_name"] = viewport_name
-        config2["viewport_color_source_uuid"] = viewport_uuid
-    else:
-        config2["viewport_color_source_name"] = viewport_value2
-        config2["viewport_color_source_uuid"] = ""
-    
-    # Handle target scene selection for both configs
-    # Config 1 scene
-    scene_value1 = obs.obs_data_get_string(settings_obj, "config1_target_scene")
-    if ":" in scene_value1:
-        scene_name, scene_uuid = scene_value1.split(":", 1)
-        config1["target_scene_name"] = scene_name
-        config1["target_scene_uuid"] = scene_uuid
-    else:
-        config1["target_scene_name"] = scene_value1
-        config1["target_scene_uuid"] = ""
-        
-    # Config 2 scene
-    scene_value2 = obs.obs_data_get_string(settings_obj, "config2_target_scene")
-    if ":" in scene_value2:
-        scene_name, scene_uuid = scene_value2.split(":", 1)
-        config2["target_scene_name"] = scene_name
-        config2["target_scene_uuid"] = scene_uuid
-    else:
-        config2["target_scene_name"] = scene_value2
-        config2["target_scene_uuid"] = ""
-        
-    # For backwards compatibility
-    settings["target_scene_name"] = config1["target_scene_name"]
-    settings["target_scene_uuid"] = config1["target_scene_uuid"]
+    settings.master_enabled = get_bool(settings_obj, "master_enabled")
     
     # Handle global settings
     # Update FPS setting - ensure it's between 30 and 240
-    update_fps = obs.obs_data_get_int(settings_obj, "update_fps")
-    if update_fps < 30:
-        update_fps = 30
-    elif update_fps > 240:
-        update_fps = 240
-    global_settings["update_fps"] = update_fps
-    
-    # Update config1 zoom settings
-    # Update zoom level - ensure it's between 1.0 and 5.0
-    zoom_level1 = obs.obs_data_get_double(settings_obj, "config1_zoom_level")
-    if zoom_level1 < 1.0:
-        zoom_level1 = 1.0
-    elif zoom_level1 > 5.0:
-        zoom_level1 = 5.0
-    config1["zoom_level"] = zoom_level1
-    
-    # Update zoom transition durations - ensure they're between 0 and 1
-    zoom_in_duration1 = obs.obs_data_get_double(settings_obj, "config1_zoom_in_duration")
-    if zoom_in_duration1 < 0.0:
-        zoom_in_duration1 = 0.0
-    elif zoom_in_duration1 > 1.0:
-        zoom_in_duration1 = 1.0
-    config1["zoom_in_duration"] = zoom_in_duration1
-    
-    zoom_out_duration1 = obs.obs_data_get_double(settings_obj, "config1_zoom_out_duration")
-    if zoom_out_duration1 < 0.0:
-        zoom_out_duration1 = 0.0
-    elif zoom_out_duration1 > 1.0:
-        zoom_out_duration1 = 1.0
-    config1["zoom_out_duration"] = zoom_out_duration1
-    
-    # Update offset values
-    config1["offset_x"] = obs.obs_data_get_int(settings_obj, "config1_offset_x")
-    config1["offset_y"] = obs.obs_data_get_int(settings_obj, "config1_offset_y")
-    
-    # Update deadzone settings
-    config1["deadzone_enabled"] = obs.obs_data_get_bool(settings_obj, "config1_deadzone_enabled")
-    config1["deadzone_h_pct"] = obs.obs_data_get_int(settings_obj, "config1_deadzone_h_pct")
-    config1["deadzone_v_pct"] = obs.obs_data_get_int(settings_obj, "config1_deadzone_v_pct")
-    
-    # Update deadzone transition duration
-    deadzone_off_duration1 = obs.obs_data_get_double(settings_obj, "config1_deadzone_off_transition_duration")
-    if deadzone_off_duration1 < 0.0:
-        deadzone_off_duration1 = 0.0
-    elif deadzone_off_duration1 > 1.0:
-        deadzone_off_duration1 = 1.0
-    config1["deadzone_off_transition_duration"] = deadzone_off_duration1
-    
-    # Update pause setting
-    config1["pause_enabled"] = obs.obs_data_get_bool(settings_obj, "config1_pause_enabled")
-    
-    # Removed unpause transition duration update
-    
-    # Update config2 zoom settings
-    zoom_level2 = obs.obs_data_get_double(settings_obj, "config2_zoom_level")
-    if zoom_level2 < 1.0:
-        zoom_level2 = 1.0
-    elif zoom_level2 > 5.0:
-        zoom_level2 = 5.0
-    config2["zoom_level"] = zoom_level2
-    
-    zoom_in_duration2 = obs.obs_data_get_double(settings_obj, "config2_zoom_in_duration")
-    if zoom_in_duration2 < 0.0:
-        zoom_in_duration2 = 0.0
-    elif zoom_in_duration2 > 1.0:
-        zoom_in_duration2 = 1.0
-    config2["zoom_in_duration"] = zoom_in_duration2
-    
-    zoom_out_duration2 = obs.obs_data_get_double(settings_obj, "config2_zoom_out_duration")
-    if zoom_out_duration2 < 0.0:
-        zoom_out_duration2 = 0.0
-    elif zoom_out_duration2 > 1.0:
-        zoom_out_duration2 = 1.0
-    config2["zoom_out_duration"] = zoom_out_duration2
-    
-    # Update offset values
-    config2["offset_x"] = obs.obs_data_get_int(settings_obj, "config2_offset_x")
-    config2["offset_y"] = obs.obs_data_get_int(settings_obj, "config2_offset_y")
-    
-    # Update deadzone settings
-    config2["deadzone_enabled"] = obs.obs_data_get_bool(settings_obj, "config2_deadzone_enabled")
-    config2["deadzone_h_pct"] = obs.obs_data_get_int(settings_obj, "config2_deadzone_h_pct")
-    config2["deadzone_v_pct"] = obs.obs_data_get_int(settings_obj, "config2_deadzone_v_pct")
-    
-    # Update deadzone transition duration
-    deadzone_off_duration2 = obs.obs_data_get_double(settings_obj, "config2_deadzone_off_transition_duration")
-    if deadzone_off_duration2 < 0.0:
-        deadzone_off_duration2 = 0.0
-    elif deadzone_off_duration2 > 1.0:
-        deadzone_off_duration2 = 1.0
-    config2["deadzone_off_transition_duration"] = deadzone_off_duration2
-    
-    # Update pause setting
-    config2["pause_enabled"] = obs.obs_data_get_bool(settings_obj, "config2_pause_enabled")
-    
-    # Removed unpause transition duration update
-    
-    # For backwards compatibility - use values from config1
-    settings["source_name"] = config1["source_name"]
-    settings["source_uuid"] = config1["source_uuid"]
-    settings["viewport_color_source_name"] = config1["viewport_color_source_name"]
-    settings["viewport_color_source_uuid"] = config1["viewport_color_source_uuid"]
-    settings["zoom_level"] = config1["zoom_level"]
-    settings["update_fps"] = global_settings["update_fps"]
-    settings["zoom_in_duration"] = config1["zoom_in_duration"]
-    settings["zoom_out_duration"] = config1["zoom_out_duration"]
-    
-    # Extract monitor ID from the composite string values for both configs
-    # Config 1 monitor
-    monitor_id_string1 = obs.obs_data_get_string(settings_obj, "config1_monitor_id_string")
-    monitor_id1 = 0  # Default to all monitors (virtual screen)
-    
-    if monitor_id_string1:
-        # Parse monitor ID from the string (format: "id:name")
-        try:
-            monitor_id1 = int(monitor_id_string1.split(":")[0])
-            config1["monitor_id"] = monitor_id1
-            
-            # Store in our global variable for persistence
-            g_selected_monitor_id1 = monitor_id1
-            
-        except Exception as e:
-            log_error(f"Error parsing monitor ID 1 from '{monitor_id_string1}': {e}")
-            # Keep using previous value
-            config1["monitor_id"] = previous_monitor_id if previous_monitor_id > 0 else 0
-    else:
-        # If no string in settings, use previous monitor ID or default
-        config1["monitor_id"] = previous_monitor_id if previous_monitor_id > 0 else 0
-    
-    # Config 2 monitor
-    monitor_id_string2 = obs.obs_data_get_string(settings_obj, "config2_monitor_id_string")
-    monitor_id2 = 0  # Default to all monitors (virtual screen)
-    
-    if monitor_id_string2:
-        # Parse monitor ID from the string (format: "id:name")
-        try:
-            monitor_id2 = int(monitor_id_string2.split(":")[0])
-            config2["monitor_id"] = monitor_id2
-            
-            # Store in our global variable for persistence
-            g_selected_monitor_id2 = monitor_id2
-            
-        except Exception as e:
-            log_error(f"Error parsing monitor ID 2 from '{monitor_id_string2}': {e}")
-            # Default to 0
-            config2["monitor_id"] = 0
-    else:
-        # If no string in settings, default to 0
-        config2["monitor_id"] = 0
+    global_settings["update_fps"] = min(240, max(30, OBS_DATA_GETTERS["int"](settings_obj, "update_fps")))
+    global_settings["update_interval_ms"] = 1000 // global_settings["update_fps"]
+    
+    for config_num, cfg in ((1, config1), (2, config2)):
+        keys = CONFIG_SETTING_KEYS[config_num]
+        
+        # Plain and clamped per-config fields
+        for key, value_type, bounds in CONFIG_FIELD_SPECS:
+            value = OBS_DATA_GETTERS[value_type](settings_obj, keys[key])
+            if bounds is not None:
+                value = min(bounds[1], max(bounds[0], value))
+            setattr(cfg, key, value)
+        
+        # Target source ("name:uuid")
+        source_value = get_string(settings_obj, keys["source_name"])
+        cfg.source_name, cfg.source_uuid = split_composite_value(source_value)
+        
+        # Viewport source ("name:uuid" or the scene dimensions marker)
+        viewport_value = get_string(settings_obj, keys["viewport_color_source_name"])
+        if is_use_scene_dimensions(viewport_value):
+            cfg.viewport_color_source_name = USE_SCENE_DIMENSIONS
+            cfg.viewport_color_source_uuid = ""
+        else:
+            cfg.viewport_color_source_name, cfg.viewport_color_source_uuid = split_composite_value(viewport_value)
+        
+        # Target scene ("name:uuid")
+        scene_value = get_string(settings_obj, keys["target_scene"])
+        cfg.target_scene_name, cfg.target_scene_uuid = split_composite_value(scene_value)
+        
+        # Monitor ID from the composite "id:name" string; config 1 keeps its previous
+        # value when the string is missing or invalid, config 2 falls back to all monitors
+        fallback_monitor_id = previous_monitor_id if config_num == 1 and previous_monitor_id > 0 else 0
+        cfg.monitor_id = parse_monitor_id(get_string(settings_obj, keys["monitor_id_string"]), fallback_monitor_id)
     
-    # For backwards compatibility
-    settings["monitor_id"] = config1["monitor_id"]
-    g_selected_monitor_id = config1["monitor_id"]
+    # For backwards compatibility (the legacy `settings` alias is config1 itself, so only this global needs syncing)
+    g_selected_monitor_id = config1.monitor_id
             
     # Update alignment status for both configs if viewport source is set
     # This ensures the UI shows correct alignment status even before panning is toggled
-    if config1.get("viewport_color_source_name") and not is_use_scene_dimensions(config1.get("viewport_color_source_name")):
-        try:
-            viewport_source_name = config1.get("viewport_color_source_name")
-            viewport_source_uuid = config1.get("viewport_color_source_uuid")
-            viewport_found = False
-            viewport_scene_item = None
-            
-            # Try to find viewport by UUID first
-            if viewport_source_uuid:
-                viewport_source = find_source_by_uuid(viewport_source_uuid)
-                if viewport_source:
-                    # Now search for this source in scenes
-                    scenes = obs.obs_frontend_get_scenes()
-                    if scenes:
-                        for scene in scenes:
-                            viewport_scene_item = find_scene_item(scene, viewport_source_name)
-                            if viewport_scene_item:
-                                viewport_found = True
-                                config1["viewport_alignment_correct"] = check_viewport_alignment(
-                                    viewport_scene_item, viewport_source_name, 1
-                                )
-                                obs.obs_sceneitem_release(viewport_scene_item)
-                                break
-                        obs.source_list_release(scenes)
-                    obs.obs_source_release(viewport_source)
-            
-            # If not found by UUID, try by name
-            if not viewport_found and viewport_source_name:
-                scenes = obs.obs_frontend_get_scenes()
-                if scenes:
-                    for scene in scenes:
-                        viewport_scene_item = find_scene_item(scene, viewport_source_name)
-                        if viewport_scene_item:
-                            config1["viewport_alignment_correct"] = check_viewport_alignment(
-                                viewport_scene_item, viewport_source_name, 1
-                            )
-                            obs.obs_sceneitem_release(viewport_scene_item)
-                            break
-                    obs.source_list_release(scenes)
-        except Exception as e:
-            log_error(f"Error checking viewport alignment for Config 1 during update: {e}")
-    
-    # Same for config 2
-    if config2.get("viewport_color_source_name") and not is_use_scene_dimensions(config2.get("viewport_color_source_name")):
+    # (skipped when the viewport and scene selection are unchanged since the last check)
+    for config_num, cfg in ((1, config1), (2, config2)):
+        alignment_inputs = (cfg.viewport_color_source_name, cfg.viewport_color_source_uuid,
+                            cfg.target_scene_name, cfg.target_scene_uuid)
+        if alignment_inputs == cfg.viewport_alignment_inputs:
+            continue
         try:
-            viewport_source_name = config2.get("viewport_color_source_name")
-            viewport_source_uuid = config2.get("viewport_color_source_uuid")
-            viewport_found = False
-            viewport_scene_item = None
-            
-            # Try to find viewport by UUID first
-            if viewport_source_uuid:
-                viewport_source = find_source_by_uuid(viewport_source_uuid)
-                if viewport_source:
-                    # Now search for this source in scenes
-                    scenes = obs.obs_frontend_get_scenes()
-                    if scenes:
-                        for scene in scenes:
-                            viewport_scene_item = find_scene_item(scene, viewport_source_name)
-                            if viewport_scene_item:
-                                viewport_found = True
-                                config2["viewport_alignment_correct"] = check_viewport_alignment(
-                                    viewport_scene_item, viewport_source_name, 2
-                                )
-                                obs.obs_sceneitem_release(viewport_scene_item)
-                                break
-                        obs.source_list_release(scenes)
-                    obs.obs_source_release(viewport_source)
-            
-            # If not found by UUID, try by name
-            if not viewport_found and viewport_source_name:
-                scenes = obs.obs_frontend_get_scenes()
-                if scenes:
-                    for scene in scenes:
-                        viewport_scene_item = find_scene_item(scene, viewport_source_name)
-                        if viewport_scene_item:
-                            config2["viewport_alignment_correct"] = check_viewport_alignment(
-                                viewport_scene_item, viewport_source_name, 2
-                            )
-                            obs.obs_sceneitem_release(viewport_scene_item)
-                            break
-                    obs.source_list_release(scenes)
+            refresh_viewport_alignment(cfg, config_num)
+            cfg.viewport_alignment_inputs = alignment_inputs
         except Exception as e:
-            log_error(f"Error checking viewport alignment for Config 2 during update: {e}")
+            log_error(f"Error checking viewport alignment for Config {config_num} during update: {e}")
     
     # Handle monitor selection change for backward compatibility
-    if previous_monitor_id != config1["monitor_id"]:
-        log(f"Monitor ID change detected: {previous_monitor_id} -> {config1['monitor_id']}")
+    if previous_monitor_id != config1.monitor_id:
+        log("Monitor ID change detected: %s -> %s", previous_monitor_id, config1.monitor_id)
         update_selected_monitor()
+    
+    # Apply FPS / enabled changes to the update timer
+    update_timer_rate()
 
 # Function to get OBS version
 def get_obs_version():
@@ -2394,14 +2499,14 @@ def get_obs_version():
 # Function to thoroughly release resources
 def release_all_resources():
     """Thoroughly release all resources to prevent crashes on exit"""
-    global g_current_scene_item, g_in_exit_handler, g_emergency_cleanup_done
+    global g_current_scene_item, g_in_exit_handler
     
     if g_in_exit_handler:
         log_warning("Already in resource release process, skipping duplicate call")
         return
     
     g_in_exit_handler = True
-    g_emergency_cleanup_done = True  # Mark that we've done emergency cleanup
+    g_emergency_cleanup_done.set()  # Mark that we've done emergency cleanup
     log("Starting thorough resource cleanup")
     
     # Stop timer first - this is critical to prevent callbacks during shutdown
@@ -2413,27 +2518,22 @@ def release_all_resources():
     
     # Make local copies of references before clearing them
     scene_item_to_release = g_current_scene_item
-    direct_source_to_release = settings.get("direct_source_cache")
+    direct_source_to_release = settings.direct_source_cache
+    initial_state_captured = source_settings.is_initial_state_captured
     
     # Clear all references BEFORE releasing them
     g_current_scene_item = None
-    if "direct_source_cache" in settings:
-        settings["direct_source_cache"] = None
+    settings.direct_source_cache = None
     
     # Clear all state
-    if "direct_mode" in settings:
-        settings["direct_mode"] = False
-    if "pan_enabled" in settings:
-        settings["pan_enabled"] = False
-    if "zoom_enabled" in settings:
-        settings["zoom_enabled"] = False
-    if "is_transitioning" in source_settings:
-        source_settings["is_transitioning"] = False
-    if "is_initial_state_captured" in source_settings:
-        source_settings["is_initial_state_captured"] = False
+    settings.direct_mode = False
+    settings.pan_enabled = False
+    settings.zoom_enabled = False
+    source_settings.is_transitioning = False
+    source_settings.is_initial_state_captured = False
     
     # Release scene item if it's a real OBS scene item
-    if scene_item_to_release and not isinstance(scene_item_to_release, dict):
+    if scene_item_to_release and type(scene_item_to_release) is not DirectSourceItem:
         try:
             # If there are any filters attached to the source, remove them first
             if direct_source_to_release:
@@ -2451,18 +2551,17 @@ def release_all_resources():
             
             # Reset transform info if needed
             try:
-                # Check if we need to reset transform info
-                if hasattr(source_settings, "initial_pos_x") and hasattr(source_settings, "initial_pos_y"):
-                    pos = obs.vec2()
+                # Only restore values that were actually captured from the item
+                if initial_state_captured:
+                    pos = g_scratch_pos
                     pos.x = source_settings.initial_pos_x
                     pos.y = source_settings.initial_pos_y
                     obs.obs_sceneitem_set_pos(scene_item_to_release, pos)
                     
-                    if hasattr(source_settings, "initial_scale_x") and hasattr(source_settings, "initial_scale_y"):
-                        scale = obs.vec2()
-                        scale.x = source_settings.initial_scale_x
-                        scale.y = source_settings.initial_scale_y
-                        obs.obs_sceneitem_set_scale(scene_item_to_release, scale)
+                    scale = g_scratch_scale
+                    scale.x = source_settings.initial_scale_x
+                    scale.y = source_settings.initial_scale_y
+                    obs.obs_sceneitem_set_scale(scene_item_to_release, scale)
                     
                     log("Reset transform info to original")
             except Exception as e:
@@ -2486,17 +2585,21 @@ def release_all_resources():
             log_error(f"Error releasing direct source: {e}")
     
     # Force garbage collection
-    try:
-        import gc
-        log("Running garbage collection...")
-        gc.collect(2)  # Full collection
-        gc.collect(2)
-    except Exception as e:
-        log_error(f"Error during garbage collection: {e}")
+    log("Running garbage collection...")
+    gc.collect()  # Full collection (finalizers freed during it are handled in the same pass)
     
     g_in_exit_handler = False
     log("Resource cleanup completed")
 
+# Frontend events after which a cached viewport scene may be stale
+VIEWPORT_CACHE_INVALIDATING_EVENTS = tuple(
+    getattr(obs, name) for name in (
+        "OBS_FRONTEND_EVENT_SCENE_CHANGED",
+        "OBS_FRONTEND_EVENT_SCENE_LIST_CHANGED",
+        "OBS_FRONTEND_EVENT_SCENE_COLLECTION_CHANGED",
+    ) if hasattr(obs, name)
+)
+
 # Function to handle OBS frontend events
 def on_frontend_event(event):
     """Handle OBS frontend events"""
@@ -2516,13 +2619,28 @@ def on_frontend_event(event):
         log("OBS_FRONTEND_EVENT_FINISHED_LOADING received")
         global g_is_obs_loaded, g_pending_config_refresh
         g_is_obs_loaded = True
+        # Scenes created during startup were not in any list built before this point
+        invalidate_scene_list_entries()
+        invalidate_viewport_alignment_checks()
         
         # If refreshing is pending, do it now that OBS is fully loaded
         if g_pending_config_refresh:
             log("Performing delayed scene and source refresh now that OBS is fully loaded")
-            refresh_caches_for_config(config1)
-            refresh_caches_for_config(config2)
+            # Disabled configs are not consulted at runtime; create_config_properties builds their lists on demand
+            for cfg in (config1, config2):
+                if cfg.enabled:
+                    refresh_caches_for_config(cfg)
+                else:
+                    cfg.source_cache = []
+                    cfg.viewport_cache = []
             g_pending_config_refresh = False
+            
+    elif event in VIEWPORT_CACHE_INVALIDATING_EVENTS:
+        # Scene layout changed - viewport items may have moved between scenes
+        g_viewport_scene_cache.clear()
+        g_source_uuid_cache.clear()
+        invalidate_scene_list_entries()
+        invalidate_viewport_alignment_checks()
 
 # Global flag to indicate UI needs refreshing on next properties display
 g_schedule_ui_refresh = False
@@ -2530,163 +2648,99 @@ g_schedule_ui_refresh = False
 def script_load(settings_obj):
     """Called when the script is loaded in OBS"""
     # Ensure global variables are accessible
-    global toggle_pan_hotkey1_id, toggle_zoom_hotkey1_id, toggle_pan_hotkey2_id, toggle_zoom_hotkey2_id
-    global toggle_deadzone_hotkey1_id, toggle_deadzone_hotkey2_id, toggle_pause_hotkey1_id, toggle_pause_hotkey2_id
     global g_current_scene_item1, g_current_scene_item2, g_is_obs_loaded, script_settings
     global global_settings, config1, config2, source_settings1, source_settings2
     global settings, source_settings # For legacy compatibility
     global g_selected_monitor_id1, g_selected_monitor_id2
     global g_show_instructions
 
+    # Store settings object for use throughout the script
+    script_settings = settings_obj
+    
+    # Clear dynamic references/state
+    g_current_scene_item1 = None
+    g_current_scene_item2 = None
+    g_is_obs_loaded = False
+    g_show_instructions = False  # Always start with instructions hidden
+    
+    # Ensure the setting is also saved as False
+    obs.obs_data_set_bool(settings_obj, "show_instructions", False)
+    
+    # Load script
+    log("Script loaded (Mouse Pan & Zoom v%s)", SCRIPT_VERSION)
+
+    # Load Global Settings
+    global_settings["update_fps"] = get_user_value_or_default(settings_obj, "update_fps", "int", 60)
+    global_settings["update_interval_ms"] = 1000 // max(global_settings["update_fps"], 1)
+
+    # Load per-config settings
+    for config_num, cfg in ((1, config1), (2, config2)):
+        keys = CONFIG_SETTING_KEYS[config_num]
+        cfg.enabled = obs.obs_data_get_bool(settings_obj, keys["enabled"])
+        cfg.target_scene_name, cfg.target_scene_uuid = split_composite_value(obs.obs_data_get_string(settings_obj, keys["target_scene"]))
+        cfg.source_name, cfg.source_uuid = split_composite_value(obs.obs_data_get_string(settings_obj, keys["source_name"]))
+        viewport_value = obs.obs_data_get_string(settings_obj, keys["viewport_color_source_name"])
+        if is_use_scene_dimensions(viewport_value): cfg.viewport_color_source_name, cfg.viewport_color_source_uuid = USE_SCENE_DIMENSIONS, ""
+        else: cfg.viewport_color_source_name, cfg.viewport_color_source_uuid = split_composite_value(viewport_value)
+        for key, default in CONFIG_LOAD_DOUBLE_DEFAULTS:
+            setattr(cfg, key, get_user_value_or_default(settings_obj, keys[key], "double", default))
+        if cfg.zoom_level < 1.0: cfg.zoom_level = 1.0
+        cfg.monitor_id = parse_monitor_id(obs.obs_data_get_string(settings_obj, keys["monitor_id_string"]))
+    g_selected_monitor_id1 = config1.monitor_id
+    g_selected_monitor_id2 = config2.monitor_id
+
+    # Initialize/reset dynamic source_settings
+    source_settings1.reset()
+    source_settings2.reset()
+    global g_configs_initialized
+    g_configs_initialized = True
+    
+    settings = config1 # Legacy alias
+    source_settings = source_settings1 # Legacy alias
+
+    # From here on OBS holds our callbacks, so script_unload must run its cleanup
+    global g_script_initialized
+    g_script_initialized = True
+
+    # Register for OBS frontend events 
+    obs.obs_frontend_add_event_callback(on_frontend_event)
+    
+    # Invalidate cached direct sources when sources are renamed or removed
+    connect_source_signals(True)
+
+    # Register hotkeys (on failure no IDs are kept, so nothing below is loaded for them)
+    g_hotkey_ids.clear()
     try:
-        # Store settings object for use throughout the script
-        script_settings = settings_obj
-        
-        # Clear dynamic references/state
-        g_current_scene_item1 = None
-        g_current_scene_item2 = None
-        g_is_obs_loaded = False
-        g_show_instructions = False  # Always start with instructions hidden
-        
-        # Ensure the setting is also saved as False
-        obs.obs_data_set_bool(settings_obj, "show_instructions", False)
-        
-        # Load script
-        log(f"Script loaded (Mouse Pan & Zoom v{SCRIPT_VERSION})")
-
-        # Load Global Settings
-        global_settings["update_fps"] = obs.obs_data_get_int(settings_obj, "update_fps")
-        if global_settings["update_fps"] == 0 and not obs.obs_data_has_user_value(settings_obj, "update_fps"):
-            global_settings["update_fps"] = 60
-
-        # Load Config 1 Settings
-        config1["enabled"] = obs.obs_data_get_bool(settings_obj, "config1_enabled")
-        scene_value1 = obs.obs_data_get_string(settings_obj, "config1_target_scene")
-        if ":" in scene_value1: config1["target_scene_name"], config1["target_scene_uuid"] = scene_value1.split(":", 1)
-        else: config1["target_scene_name"], config1["target_scene_uuid"] = scene_value1, ""
-        source_value1 = obs.obs_data_get_string(settings_obj, "config1_source_name")
-        if ":" in source_value1: config1["source_name"], config1["source_uuid"] = source_value1.split(":", 1)
-        else: config1["source_name"], config1["source_uuid"] = source_value1, ""
-        viewport_value1 = obs.obs_data_get_string(settings_obj, "config1_viewport_color_source_name")
-        if is_use_scene_dimensions(viewport_value1): config1["viewport_color_source_name"], config1["viewport_color_source_uuid"] = USE_SCENE_DIMENSIONS, ""
-        elif ":" in viewport_value1: config1["viewport_color_source_name"], config1["viewport_color_source_uuid"] = viewport_value1.split(":", 1)
-        else: config1["viewport_color_source_name"], config1["viewport_color_source_uuid"] = viewport_value1, ""
-        config1["zoom_level"] = obs.obs_data_get_double(settings_obj, "config1_zoom_level")
-        if not obs.obs_data_has_user_value(settings_obj, "config1_zoom_level"): config1["zoom_level"] = 1.0
-        elif config1["zoom_level"] < 1.0: config1["zoom_level"] = 1.0
-        config1["zoom_in_duration"] = obs.obs_data_get_double(settings_obj, "config1_zoom_in_duration")
-        if not obs.obs_data_has_user_value(settings_obj, "config1_zoom_in_duration"): config1["zoom_in_duration"] = 0.3
-        config1["zoom_out_duration"] = obs.obs_data_get_double(settings_obj, "config1_zoom_out_duration")
-        if not obs.obs_data_has_user_value(settings_obj, "config1_zoom_out_duration"): config1["zoom_out_duration"] = 0.3
-        monitor_id_string1 = obs.obs_data_get_string(settings_obj, "config1_monitor_id_string")
-        if monitor_id_string1 and ":" in monitor_id_string1: 
-            try: config1["monitor_id"] = int(monitor_id_string1.split(":")[0]); g_selected_monitor_id1 = config1["monitor_id"]
-            except ValueError: config1["monitor_id"], g_selected_monitor_id1 = 0, 0
-        else: config1["monitor_id"], g_selected_monitor_id1 = 0, 0
-
-        # Load Config 2 Settings
-        config2["enabled"] = obs.obs_data_get_bool(settings_obj, "config2_enabled")
-        scene_value2 = obs.obs_data_get_string(settings_obj, "config2_target_scene")
-        if ":" in scene_value2: config2["target_scene_name"], config2["target_scene_uuid"] = scene_value2.split(":", 1)
-        else: config2["target_scene_name"], config2["target_scene_uuid"] = scene_value2, ""
-        source_value2 = obs.obs_data_get_string(settings_obj, "config2_source_name")
-        if ":" in source_value2: config2["source_name"], config2["source_uuid"] = source_value2.split(":", 1)
-        else: config2["source_name"], config2["source_uuid"] = source_value2, ""
-        viewport_value2 = obs.obs_data_get_string(settings_obj, "config2_viewport_color_source_name")
-        if is_use_scene_dimensions(viewport_value2): config2["viewport_color_source_name"], config2["viewport_color_source_uuid"] = USE_SCENE_DIMENSIONS, ""
-        elif ":" in viewport_value2: config2["viewport_color_source_name"], config2["viewport_color_source_uuid"] = viewport_value2.split(":", 1)
-        else: config2["viewport_color_source_name"], config2["viewport_color_source_uuid"] = viewport_value2, ""
-        config2["zoom_level"] = obs.obs_data_get_double(settings_obj, "config2_zoom_level")
-        if not obs.obs_data_has_user_value(settings_obj, "config2_zoom_level"): config2["zoom_level"] = 1.0
-        elif config2["zoom_level"] < 1.0: config2["zoom_level"] = 1.0
-        config2["zoom_in_duration"] = obs.obs_data_get_double(settings_obj, "config2_zoom_in_duration")
-        if not obs.obs_data_has_user_value(settings_obj, "config2_zoom_in_duration"): config2["zoom_in_duration"] = 0.3
-        config2["zoom_out_duration"] = obs.obs_data_get_double(settings_obj, "config2_zoom_out_duration")
-        if not obs.obs_data_has_user_value(settings_obj, "config2_zoom_out_duration"): config2["zoom_out_duration"] = 0.3
-        monitor_id_string2 = obs.obs_data_get_string(settings_obj, "config2_monitor_id_string")
-        if monitor_id_string2 and ":" in monitor_id_string2: 
-            try: config2["monitor_id"] = int(monitor_id_string2.split(":")[0]); g_selected_monitor_id2 = config2["monitor_id"]
-            except ValueError: config2["monitor_id"], g_selected_monitor_id2 = 0, 0
-        else: config2["monitor_id"], g_selected_monitor_id2 = 0, 0
-
-        # Initialize/reset dynamic source_settings
-        default_ss_values = {
-            "viewport_width": 0, "viewport_height": 0, "viewport_scene_center_x": 0.0,
-            "viewport_scene_center_y": 0.0, "source_base_width": 0, "source_base_height": 0,
-            "is_initial_state_captured": False, "initial_pos_x": 0.0, "initial_pos_y": 0.0,
-            "initial_scale_x": 1.0, "initial_scale_y": 1.0, "crop_left": 0, "crop_top": 0,
-            "crop_right": 0, "crop_bottom": 0, "scene_item": None,
-            "is_transitioning": False, "transition_start_time": 0, "transition_start_zoom": 1.0,
-            "transition_target_zoom": 1.0, "transition_duration": 0.3, "is_zooming_in": False
-        }
-        source_settings1.clear(); source_settings1.update(default_ss_values)
-        source_settings2.clear(); source_settings2.update(default_ss_values)
-        
-        settings = config1 # Legacy alias
-        source_settings = source_settings1 # Legacy alias
-
-        # Register for OBS frontend events 
-        obs.obs_frontend_add_event_callback(on_frontend_event)
-
-        # Initialize hotkey IDs to None
-        toggle_pan_hotkey1_id, toggle_zoom_hotkey1_id = None, None
-        toggle_pan_hotkey2_id, toggle_zoom_hotkey2_id = None, None
-        toggle_deadzone_hotkey1_id, toggle_deadzone_hotkey2_id = None, None
-        toggle_pause_hotkey1_id, toggle_pause_hotkey2_id = None, None
-
-        # Register hotkeys
-        toggle_pan_hotkey1_id = obs.obs_hotkey_register_frontend("mouse_pan_zoom_toggle_pan1", "Toggle ToxMox Pan Zoomer - Config 1 - Panning", toggle_panning1)
-        toggle_zoom_hotkey1_id = obs.obs_hotkey_register_frontend("mouse_pan_zoom_toggle_zoom1", "Toggle ToxMox Pan Zoomer - Config 1 - Zooming", toggle_zooming1)
-        toggle_deadzone_hotkey1_id = obs.obs_hotkey_register_frontend("mouse_pan_zoom_toggle_deadzone1", "Toggle ToxMox Pan Zoomer - Config 1 - Deadzone", toggle_deadzone1)
-        toggle_pause_hotkey1_id = obs.obs_hotkey_register_frontend("mouse_pan_zoom_toggle_pause1", "Toggle ToxMox Pan Zoomer - Config 1 - Pause", toggle_pause1)
-        
-        toggle_pan_hotkey2_id = obs.obs_hotkey_register_frontend("mouse_pan_zoom_toggle_pan2", "Toggle ToxMox Pan Zoomer - Config 2 - Panning", toggle_panning2)
-        toggle_zoom_hotkey2_id = obs.obs_hotkey_register_frontend("mouse_pan_zoom_toggle_zoom2", "Toggle ToxMox Pan Zoomer - Config 2 - Zooming", toggle_zooming2)
-        toggle_deadzone_hotkey2_id = obs.obs_hotkey_register_frontend("mouse_pan_zoom_toggle_deadzone2", "Toggle ToxMox Pan Zoomer - Config 2 - Deadzone", toggle_deadzone2)
-        toggle_pause_hotkey2_id = obs.obs_hotkey_register_frontend("mouse_pan_zoom_toggle_pause2", "Toggle ToxMox Pan Zoomer - Config 2 - Pause", toggle_pause2)
-
-        # Load hotkey bindings from saved settings
-        if toggle_pan_hotkey1_id: 
-            arr = obs.obs_data_get_array(settings_obj, "toggle_pan_hotkey1"); obs.obs_hotkey_load(toggle_pan_hotkey1_id, arr); obs.obs_data_array_release(arr)
-        if toggle_zoom_hotkey1_id: 
-            arr = obs.obs_data_get_array(settings_obj, "toggle_zoom_hotkey1"); obs.obs_hotkey_load(toggle_zoom_hotkey1_id, arr); obs.obs_data_array_release(arr)
-        if toggle_pan_hotkey2_id: 
-            arr = obs.obs_data_get_array(settings_obj, "toggle_pan_hotkey2"); obs.obs_hotkey_load(toggle_pan_hotkey2_id, arr); obs.obs_data_array_release(arr)
-        if toggle_zoom_hotkey2_id:
-            arr = obs.obs_data_get_array(settings_obj, "toggle_zoom_hotkey2"); obs.obs_hotkey_load(toggle_zoom_hotkey2_id, arr); obs.obs_data_array_release(arr)
-        if toggle_deadzone_hotkey1_id:
-            arr = obs.obs_data_get_array(settings_obj, "toggle_deadzone_hotkey1"); obs.obs_hotkey_load(toggle_deadzone_hotkey1_id, arr); obs.obs_data_array_release(arr)
-        if toggle_pause_hotkey1_id:
-            arr = obs.obs_data_get_array(settings_obj, "toggle_pause_hotkey1"); obs.obs_hotkey_load(toggle_pause_hotkey1_id, arr); obs.obs_data_array_release(arr)
-        if toggle_deadzone_hotkey2_id:
-            arr = obs.obs_data_get_array(settings_obj, "toggle_deadzone_hotkey2"); obs.obs_hotkey_load(toggle_deadzone_hotkey2_id, arr); obs.obs_data_array_release(arr)
-        if toggle_pause_hotkey2_id:
-            arr = obs.obs_data_get_array(settings_obj, "toggle_pause_hotkey2"); obs.obs_hotkey_load(toggle_pause_hotkey2_id, arr); obs.obs_data_array_release(arr)
-
-        # Defer these UI/state update calls until after critical setup and hotkey registration
-        update_selected_monitor() # Uses legacy `settings` (config1)
-        
-        # Mark configs for refresh after OBS is fully loaded
-        global g_pending_config_refresh
-        g_pending_config_refresh = True
-        log("Scene and source refresh scheduled to occur after OBS is fully loaded")
-
-        # Calculate timer interval and start timer
-        update_interval_ms = int(1000 / global_settings.get("update_fps", 60))
-        obs.timer_add(update_pan_and_zoom, update_interval_ms)
-        log(f"Update timer started with interval {update_interval_ms}ms.")
+        for settings_key, hotkey_name, description, callback in HOTKEY_DEFINITIONS:
+            g_hotkey_ids[settings_key] = obs.obs_hotkey_register_frontend(hotkey_name, description, callback)
+    except Exception as e:
+        log_error(f"Hotkey registration failed: {e}\n{traceback.format_exc()}")
+        g_hotkey_ids.clear()
+
+    # Load hotkey bindings from saved settings
+    for settings_key, hotkey_id in g_hotkey_ids.items():
+        if hotkey_id:
+            arr = obs.obs_data_get_array(settings_obj, settings_key); obs.obs_hotkey_load(hotkey_id, arr); obs.obs_data_array_release(arr)
 
+    # Defer these UI/state update calls until after critical setup and hotkey registration
+    update_selected_monitor() # Uses legacy `settings` (config1)
+    
+    # Mark configs for refresh after OBS is fully loaded
+    global g_pending_config_refresh
+    g_pending_config_refresh = True
+    log("Scene and source refresh scheduled to occur after OBS is fully loaded")
+
+    # Start the update timer (idle rate until a config starts panning)
+    global g_timer_interval_ms
+    g_timer_interval_ms = 0
+    try:
+        update_timer_rate()
     except Exception as e:
-        log_error(f"CRITICAL ERROR IN SCRIPT_LOAD: {e}\n{traceback.format_exc()}")
-        # Ensure hotkey IDs are None if registration failed catastrophically
-        toggle_pan_hotkey1_id, toggle_zoom_hotkey1_id = None, None
-        toggle_pan_hotkey2_id, toggle_zoom_hotkey2_id = None, None
+        log_error(f"Failed to start update timer: {e}\n{traceback.format_exc()}")
 
 def script_save(settings_obj):
     """Save script settings and hotkey bindings"""
     # Ensure global hotkey IDs are accessible
-    global toggle_pan_hotkey1_id, toggle_zoom_hotkey1_id, toggle_pan_hotkey2_id, toggle_zoom_hotkey2_id
-    global toggle_deadzone_hotkey1_id, toggle_deadzone_hotkey2_id, toggle_pause_hotkey1_id, toggle_pause_hotkey2_id
     # Ensure global config settings are accessible for saving
     global global_settings, config1, config2, g_selected_monitor_id1, g_selected_monitor_id2, g_show_instructions
 
@@ -2695,161 +2749,47 @@ def script_save(settings_obj):
     obs.obs_data_set_int(settings_obj, "update_fps", global_settings.get("update_fps", 60))
     obs.obs_data_set_bool(settings_obj, "show_instructions", g_show_instructions)
 
-    # Save Config 1 Settings
-    obs.obs_data_set_bool(settings_obj, "config1_enabled", config1.get("enabled", False))
-    
-    # Scene (name:uuid)
-    scene1_name = config1.get("target_scene_name", "")
-    scene1_uuid = config1.get("target_scene_uuid", "")
-    if scene1_uuid:
-        obs.obs_data_set_string(settings_obj, "config1_target_scene", f"{scene1_name}:{scene1_uuid}")
-    else:
-        obs.obs_data_set_string(settings_obj, "config1_target_scene", scene1_name)
-
-    # Source (name:uuid)
-    source1_name = config1.get("source_name", "")
-    source1_uuid = config1.get("source_uuid", "")
-    if source1_uuid:
-        obs.obs_data_set_string(settings_obj, "config1_source_name", f"{source1_name}:{source1_uuid}")
-    else:
-        obs.obs_data_set_string(settings_obj, "config1_source_name", source1_name)
-
-    # Viewport (name:uuid or special value)
-    viewport1_val = config1.get("viewport_color_source_name", "")
-    viewport1_uuid = config1.get("viewport_color_source_uuid", "")
-    if viewport1_val == USE_SCENE_DIMENSIONS:
-        obs.obs_data_set_string(settings_obj, "config1_viewport_color_source_name", USE_SCENE_DIMENSIONS)
-    elif viewport1_uuid:
-        obs.obs_data_set_string(settings_obj, "config1_viewport_color_source_name", f"{viewport1_val}:{viewport1_uuid}")
-    else:
-        obs.obs_data_set_string(settings_obj, "config1_viewport_color_source_name", viewport1_val)
-
-    obs.obs_data_set_double(settings_obj, "config1_zoom_level", config1.get("zoom_level", 1.0))
-    obs.obs_data_set_double(settings_obj, "config1_zoom_in_duration", config1.get("zoom_in_duration", 0.3))
-    obs.obs_data_set_double(settings_obj, "config1_zoom_out_duration", config1.get("zoom_out_duration", 0.3))
-    obs.obs_data_set_int(settings_obj, "config1_offset_x", config1.get("offset_x", 0))
-    obs.obs_data_set_int(settings_obj, "config1_offset_y", config1.get("offset_y", 0))
-    obs.obs_data_set_bool(settings_obj, "config1_deadzone_enabled", config1.get("deadzone_enabled", False))
-    obs.obs_data_set_int(settings_obj, "config1_deadzone_h_pct", config1.get("deadzone_h_pct", 10))
-    obs.obs_data_set_int(settings_obj, "config1_deadzone_v_pct", config1.get("deadzone_v_pct", 10))
-    obs.obs_data_set_double(settings_obj, "config1_deadzone_off_transition_duration", config1.get("deadzone_off_transition_duration", 0.3))
-    obs.obs_data_set_bool(settings_obj, "config1_pause_enabled", config1.get("pause_enabled", False))
-    # Removed unpause transition duration save
-    
-    monitor_id1 = config1.get("monitor_id", 0)
-    monitors = get_monitor_info() # Re-fetch to ensure names are current
-    monitor_name1 = "All Monitors (Virtual Screen)" # Default
-    for monitor in monitors:
-        if monitor['id'] == monitor_id1:
-            monitor_name1 = monitor['name']
-            break
-    obs.obs_data_set_string(settings_obj, "config1_monitor_id_string", f"{monitor_id1}:{monitor_name1}")
-
-
-    # Save Config 2 Settings
-    obs.obs_data_set_bool(settings_obj, "config2_enabled", config2.get("enabled", False))
-
-    scene2_name = config2.get("target_scene_name", "")
-    scene2_uuid = config2.get("target_scene_uuid", "")
-    if scene2_uuid:
-        obs.obs_data_set_string(settings_obj, "config2_target_scene", f"{scene2_name}:{scene2_uuid}")
-    else:
-        obs.obs_data_set_string(settings_obj, "config2_target_scene", scene2_name)
-
-    source2_name = config2.get("source_name", "")
-    source2_uuid = config2.get("source_uuid", "")
-    if source2_uuid:
-        obs.obs_data_set_string(settings_obj, "config2_source_name", f"{source2_name}:{source2_uuid}")
-    else:
-        obs.obs_data_set_string(settings_obj, "config2_source_name", source2_name)
-
-    viewport2_val = config2.get("viewport_color_source_name", "")
-    viewport2_uuid = config2.get("viewport_color_source_uuid", "")
-    if viewport2_val == USE_SCENE_DIMENSIONS:
-        obs.obs_data_set_string(settings_obj, "config2_viewport_color_source_name", USE_SCENE_DIMENSIONS)
-    elif viewport2_uuid:
-        obs.obs_data_set_string(settings_obj, "config2_viewport_color_source_name", f"{viewport2_val}:{viewport2_uuid}")
-    else:
-        obs.obs_data_set_string(settings_obj, "config2_viewport_color_source_name", viewport2_val)
-
-    obs.obs_data_set_double(settings_obj, "config2_zoom_level", config2.get("zoom_level", 1.0))
-    obs.obs_data_set_double(settings_obj, "config2_zoom_in_duration", config2.get("zoom_in_duration", 0.3))
-    obs.obs_data_set_double(settings_obj, "config2_zoom_out_duration", config2.get("zoom_out_duration", 0.3))
-    obs.obs_data_set_int(settings_obj, "config2_offset_x", config2.get("offset_x", 0))
-    obs.obs_data_set_int(settings_obj, "config2_offset_y", config2.get("offset_y", 0))
-    obs.obs_data_set_bool(settings_obj, "config2_deadzone_enabled", config2.get("deadzone_enabled", False))
-    obs.obs_data_set_int(settings_obj, "config2_deadzone_h_pct", config2.get("deadzone_h_pct", 10))
-    obs.obs_data_set_int(settings_obj, "config2_deadzone_v_pct", config2.get("deadzone_v_pct", 10))
-    obs.obs_data_set_double(settings_obj, "config2_deadzone_off_transition_duration", config2.get("deadzone_off_transition_duration", 0.3))
-    obs.obs_data_set_bool(settings_obj, "config2_pause_enabled", config2.get("pause_enabled", False))
-    # Removed unpause transition duration save
-
-    monitor_id2 = config2.get("monitor_id", 0)
-    monitor_name2 = "All Monitors (Virtual Screen)" # Default
-    for monitor in monitors: # Reuse fetched monitors
-        if monitor['id'] == monitor_id2:
-            monitor_name2 = monitor['name']
-            break
-    obs.obs_data_set_string(settings_obj, "config2_monitor_id_string", f"{monitor_id2}:{monitor_name2}")
+    # Save per-config settings
+    monitor_name_by_id = {monitor['id']: monitor['name'] for monitor in get_monitor_info()} # Re-fetch to ensure names are current
+    for config_num, cfg in ((1, config1), (2, config2)):
+        keys = CONFIG_SETTING_KEYS[config_num]
+        
+        # Scene, source and viewport as "name:uuid" (or the bare name / special value)
+        obs.obs_data_set_string(settings_obj, keys["target_scene"], join_composite_value(cfg.target_scene_name, cfg.target_scene_uuid))
+        obs.obs_data_set_string(settings_obj, keys["source_name"], join_composite_value(cfg.source_name, cfg.source_uuid))
+        viewport_val = cfg.viewport_color_source_name
+        if viewport_val == USE_SCENE_DIMENSIONS:
+            obs.obs_data_set_string(settings_obj, keys["viewport_color_source_name"], USE_SCENE_DIMENSIONS)
+        else:
+            obs.obs_data_set_string(settings_obj, keys["viewport_color_source_name"],
+                                    join_composite_value(viewport_val, cfg.viewport_color_source_uuid))
+        
+        # Plain per-config fields (the same set script_update reads)
+        for key, value_type, _ in CONFIG_FIELD_SPECS:
+            OBS_DATA_SETTERS[value_type](settings_obj, keys[key], getattr(cfg, key))
+        
+        monitor_id = cfg.monitor_id
+        monitor_name = monitor_name_by_id.get(monitor_id, "All Monitors (Virtual Screen)")
+        obs.obs_data_set_string(settings_obj, keys["monitor_id_string"], f"{monitor_id}:{monitor_name}")
 
     # Save Hotkey Bindings
     try:
-        if toggle_pan_hotkey1_id is not None:
-            pan_hotkey1_save_array = obs.obs_hotkey_save(toggle_pan_hotkey1_id)
-            if pan_hotkey1_save_array:
-                obs.obs_data_set_array(settings_obj, "toggle_pan_hotkey1", pan_hotkey1_save_array)
-                obs.obs_data_array_release(pan_hotkey1_save_array)
-        
-        if toggle_zoom_hotkey1_id is not None:
-            zoom_hotkey1_save_array = obs.obs_hotkey_save(toggle_zoom_hotkey1_id)
-            if zoom_hotkey1_save_array:
-                obs.obs_data_set_array(settings_obj, "toggle_zoom_hotkey1", zoom_hotkey1_save_array)
-                obs.obs_data_array_release(zoom_hotkey1_save_array)
-        
-        if toggle_deadzone_hotkey1_id is not None:
-            deadzone_hotkey1_save_array = obs.obs_hotkey_save(toggle_deadzone_hotkey1_id)
-            if deadzone_hotkey1_save_array:
-                obs.obs_data_set_array(settings_obj, "toggle_deadzone_hotkey1", deadzone_hotkey1_save_array)
-                obs.obs_data_array_release(deadzone_hotkey1_save_array)
-        
-        if toggle_pause_hotkey1_id is not None:
-            pause_hotkey1_save_array = obs.obs_hotkey_save(toggle_pause_hotkey1_id)
-            if pause_hotkey1_save_array:
-                obs.obs_data_set_array(settings_obj, "toggle_pause_hotkey1", pause_hotkey1_save_array)
-                obs.obs_data_array_release(pause_hotkey1_save_array)
-        
-        if toggle_pan_hotkey2_id is not None:
-            pan_hotkey2_save_array = obs.obs_hotkey_save(toggle_pan_hotkey2_id)
-            if pan_hotkey2_save_array:
-                obs.obs_data_set_array(settings_obj, "toggle_pan_hotkey2", pan_hotkey2_save_array)
-                obs.obs_data_array_release(pan_hotkey2_save_array)
-        
-        if toggle_zoom_hotkey2_id is not None:
-            zoom_hotkey2_save_array = obs.obs_hotkey_save(toggle_zoom_hotkey2_id)
-            if zoom_hotkey2_save_array:
-                obs.obs_data_set_array(settings_obj, "toggle_zoom_hotkey2", zoom_hotkey2_save_array)
-                obs.obs_data_array_release(zoom_hotkey2_save_array)
-        
-        if toggle_deadzone_hotkey2_id is not None:
-            deadzone_hotkey2_save_array = obs.obs_hotkey_save(toggle_deadzone_hotkey2_id)
-            if deadzone_hotkey2_save_array:
-                obs.obs_data_set_array(settings_obj, "toggle_deadzone_hotkey2", deadzone_hotkey2_save_array)
-                obs.obs_data_array_release(deadzone_hotkey2_save_array)
-        
-        if toggle_pause_hotkey2_id is not None:
-            pause_hotkey2_save_array = obs.obs_hotkey_save(toggle_pause_hotkey2_id)
-            if pause_hotkey2_save_array:
-                obs.obs_data_set_array(settings_obj, "toggle_pause_hotkey2", pause_hotkey2_save_array)
-                obs.obs_data_array_release(pause_hotkey2_save_array)
+        for settings_key, hotkey_id in g_hotkey_ids.items():
+            if hotkey_id is not None:
+                hotkey_save_array = obs.obs_hotkey_save(hotkey_id)
+                if hotkey_save_array:
+                    obs.obs_data_set_array(settings_obj, settings_key, hotkey_save_array)
+                    obs.obs_data_array_release(hotkey_save_array)
     except Exception as e:
         log_error(f"Error saving hotkeys: {e}")
     
-    log("Settings saved successfully by script_save")
+    if LOG_LEVEL >= LOG_LEVEL_DEBUG:
+        log("Settings saved successfully by script_save")
 
 # Python exit handler - will be called when Python is exiting
 def python_exit_handler():
     """Special handler that runs when Python is exiting"""
-    global g_in_exit_handler, g_script_unloading, g_obs_shutting_down, g_emergency_cleanup_done
+    global g_in_exit_handler, g_script_unloading, g_obs_shutting_down
     
     # Prevent recursive calls
     if g_in_exit_handler:
@@ -2861,15 +2801,8 @@ def python_exit_handler():
     
     log_warning(f"PYTHON EXIT HANDLER ACTIVATED (Mouse Pan & Zoom v{SCRIPT_VERSION})")
     
-    # If we haven't done emergency cleanup yet, do it now
-    if not g_emergency_cleanup_done:
-        try:
-            emergency_cleanup()
-        except Exception as e:
-            log_error(f"Error in emergency cleanup during exit handler: {e}")
-    
     try:
-        # Perform ultra-aggressive cleanup
+        # Release everything once (the emergency cleanup is a no-op if it already ran)
         perform_ultra_aggressive_cleanup()
     except Exception as e:
         log_error(f"Error in exit handler: {e}")
@@ -2880,71 +2813,20 @@ def python_exit_handler():
 # Ultra-aggressive cleanup function
 def perform_ultra_aggressive_cleanup():
     """Perform the most aggressive cleanup possible"""
-    global g_current_scene_item, g_emergency_cleanup_done
-    
-    # Mark that we've done emergency cleanup
-    g_emergency_cleanup_done = True
-    
     log_warning("Performing ultra-aggressive cleanup")
     
-    # First, remove the timer to prevent any further callbacks
+    # 1-2. Remove the timer, disable both configs and release their OBS references.
+    # emergency_cleanup is idempotent, so nothing is released (or logged) twice
     try:
-        obs.timer_remove(update_pan_and_zoom)
-        log_warning("Ultra: Removed update timer")
+        emergency_cleanup()
     except Exception as e:
-        log_error(f"Ultra: Error removing timer: {e}")
-    
-    # 1. Clear all global references that might hold OBS objects
-    scene_item_to_release = g_current_scene_item
-    direct_source_to_release = settings.get("direct_source_cache")
+        log_error(f"Ultra: Error during emergency cleanup: {e}")
     
-    # Clear references immediately
-    g_current_scene_item = None
-    if "direct_source_cache" in settings:
-        settings["direct_source_cache"] = None
-    
-    # Clear all state variables
-    if "direct_mode" in settings:
-        settings["direct_mode"] = False
-    if "pan_enabled" in settings:
-        settings["pan_enabled"] = False
-    if "zoom_enabled" in settings:
-        settings["zoom_enabled"] = False
-    
-    if "is_transitioning" in source_settings:
-        source_settings["is_transitioning"] = False
-    if "is_initial_state_captured" in source_settings:
-        source_settings["is_initial_state_captured"] = False
-    
-    # 2. Try to release resources
-    try:
-        # Release scene item if it's a real OBS scene item
-        if scene_item_to_release and not isinstance(scene_item_to_release, dict):
-            try:
-                obs.obs_sceneitem_release(scene_item_to_release)
-                log("Released scene item in ultra cleanup")
-            except Exception as e:
-                log_error(f"Error releasing scene item in ultra cleanup: {e}")
-        
-        # Release direct source if we have one
-        if direct_source_to_release:
-            try:
-                obs.obs_source_release(direct_source_to_release)
-                log("Released direct source in ultra cleanup")
-            except Exception as e:
-                log_error(f"Error releasing direct source in ultra cleanup: {e}")
-    except Exception as e:
-        log_error(f"Error during ultra resource cleanup: {e}")
-    
-    # 3. Force multiple garbage collections
-    try:
-        import gc
+    # 3. Collect leftover cycles before OBS tears down Python (only needed on Windows;
+    # the released wrappers above are freed by refcounting everywhere else)
+    if IS_WINDOWS:
         log("Running ultra garbage collection...")
-        gc.collect(2)  # Full collection
-        gc.collect(2)
-        gc.collect(2)
-    except Exception as e:
-        log_error(f"Error during ultra garbage collection: {e}")
+        gc.collect()
     
     # DO NOT try to manipulate the module in sys.modules
     # Let OBS handle the reloading process naturally
@@ -2953,156 +2835,97 @@ def script_unload():
     """Clean up when script is unloaded"""
     # Access all necessary globals for cleanup
     global g_current_scene_item1, g_current_scene_item2, script_settings # script_settings might be None if load failed
-    global toggle_pan_hotkey1_id, toggle_zoom_hotkey1_id, toggle_pan_hotkey2_id, toggle_zoom_hotkey2_id
-    global toggle_deadzone_hotkey1_id, toggle_deadzone_hotkey2_id, toggle_pause_hotkey1_id, toggle_pause_hotkey2_id
     global config1, config2, source_settings1, source_settings2, global_settings
+    global g_timer_interval_ms, g_script_initialized
+
+    # Nothing was registered or acquired if script_load never got that far
+    if not g_script_initialized:
+        log("Script unload: nothing to clean up")
+        return
+    g_script_initialized = False
 
     log("Script unload started")
 
     # Stop timer first to prevent any further callbacks
     try:
         obs.timer_remove(update_pan_and_zoom) # update_pan_and_zoom is the correct timer function name
+        g_timer_interval_ms = 0
         log("Timer removed")
     except Exception as e:
         log_error(f"Error removing timer: {e}")
+    
+    # Stop listening for source rename/remove signals
+    connect_source_signals(False)
         
     # Clean up hotkeys properly
     try:
-        if toggle_pan_hotkey1_id is not None:
-            obs.obs_hotkey_unregister(toggle_pan_hotkey1_id)
-            toggle_pan_hotkey1_id = None
-        if toggle_zoom_hotkey1_id is not None:
-            obs.obs_hotkey_unregister(toggle_zoom_hotkey1_id)
-            toggle_zoom_hotkey1_id = None
-        if toggle_pan_hotkey2_id is not None:
-            obs.obs_hotkey_unregister(toggle_pan_hotkey2_id)
-            toggle_pan_hotkey2_id = None
-        if toggle_zoom_hotkey2_id is not None:
-            obs.obs_hotkey_unregister(toggle_zoom_hotkey2_id)
-            toggle_zoom_hotkey2_id = None
-        if toggle_deadzone_hotkey1_id is not None:
-            obs.obs_hotkey_unregister(toggle_deadzone_hotkey1_id)
-            toggle_deadzone_hotkey1_id = None
-        if toggle_pause_hotkey1_id is not None:
-            obs.obs_hotkey_unregister(toggle_pause_hotkey1_id)
-            toggle_pause_hotkey1_id = None
-        if toggle_deadzone_hotkey2_id is not None:
-            obs.obs_hotkey_unregister(toggle_deadzone_hotkey2_id)
-            toggle_deadzone_hotkey2_id = None
-        if toggle_pause_hotkey2_id is not None:
-            obs.obs_hotkey_unregister(toggle_pause_hotkey2_id)
-            toggle_pause_hotkey2_id = None
+        for hotkey_id in g_hotkey_ids.values():
+            if hotkey_id is not None:
+                obs.obs_hotkey_unregister(hotkey_id)
+        g_hotkey_ids.clear()
         log("Hotkeys unregistered")
     except Exception as e:
         log_error(f"Error unregistering hotkeys: {e}")
 
     # Helper function to reset a specific config's state and release its resources
-    def cleanup_config_resources(cfg, src_settings, scene_item_global_name):
-        # Check if cfg and src_settings are valid dictionaries before proceeding
-        if not isinstance(cfg, dict) or not isinstance(src_settings, dict):
+    def cleanup_config_resources(cfg, src_settings, current_scene_item_val, scene_item_global_name):
+        # Check if cfg and src_settings are valid before proceeding
+        if not isinstance(cfg, ConfigState) or not isinstance(src_settings, SourceState):
             log_warning(f"Skipping cleanup for {scene_item_global_name} due to invalid config/source_settings.")
             return
-            
-        current_scene_item_val = globals().get(scene_item_global_name)
 
-        if cfg.get("pan_enabled", False):
+        if cfg.pan_enabled:
             log(f"Disabling panning for {scene_item_global_name} during unload")
-            src_settings["is_transitioning"] = False
-            cfg["zoom_enabled"] = False
-            cfg["pan_enabled"] = False
+            src_settings.is_transitioning = False
+            cfg.zoom_enabled = False
+            cfg.pan_enabled = False
 
-            if src_settings.get("is_initial_state_captured") and current_scene_item_val:
+            if src_settings.is_initial_state_captured and current_scene_item_val:
                 try:
                     set_item_transform(
                         current_scene_item_val,
-                        src_settings["initial_pos_x"],
-                        src_settings["initial_pos_y"],
-                        src_settings["initial_scale_x"],
-                        src_settings["initial_scale_y"]
+                        src_settings.initial_pos_x,
+                        src_settings.initial_pos_y,
+                        src_settings.initial_scale_x,
+                        src_settings.initial_scale_y
                     )
                     log(f"Restored original position/scale for {scene_item_global_name}")
                 except Exception as e:
                     log_error(f"Error restoring position for {scene_item_global_name}: {e}")
         
         scene_item_to_release = None
-        if current_scene_item_val and not isinstance(current_scene_item_val, dict):
+        if current_scene_item_val and type(current_scene_item_val) is not DirectSourceItem:
             scene_item_to_release = current_scene_item_val
         
-        direct_source_to_release = cfg.get("direct_source_cache")
-
-        # Use a try-except block for globals().set to handle potential issues if the global doesn't exist
-        try:
-            globals()[scene_item_global_name] = None # Clear the global scene item reference
-        except KeyError:
-            log_warning(f"Global variable {scene_item_global_name} not found for clearing.")
+        direct_source_to_release = cfg.direct_source_cache
+        cfg.direct_source_cache = None
+        cfg.direct_mode = False
 
-        if "direct_source_cache" in cfg: cfg["direct_source_cache"] = None
-        if "direct_mode" in cfg: cfg["direct_mode"] = False
-
-        if scene_item_to_release:
-            try:
-                obs.obs_sceneitem_release(scene_item_to_release)
-                log(f"Released scene item for {scene_item_global_name}")
-            except Exception as e:
-                log_error(f"Error releasing scene item for {scene_item_global_name}: {e}")
-        
-        if direct_source_to_release:
-            try:
-                obs.obs_source_release(direct_source_to_release)
-                log(f"Released direct source for {scene_item_global_name}")
-            except Exception as e:
-                log_error(f"Error releasing direct source for {scene_item_global_name}: {e}")
+        release_item_and_source(scene_item_to_release, direct_source_to_release, f"{scene_item_global_name}: ")
 
         # Reset all state variables to defaults for this config's source_settings
-        default_source_settings_values = {
-            "viewport_width": 0, "viewport_height": 0, "viewport_scene_center_x": 0.0,
-            "viewport_scene_center_y": 0.0, "source_base_width": 0, "source_base_height": 0,
-            "is_initial_state_captured": False, "initial_pos_x": 0.0, "initial_pos_y": 0.0,
-            "initial_scale_x": 1.0, "initial_scale_y": 1.0, "crop_left": 0, "crop_top": 0,
-            "crop_right": 0, "crop_bottom": 0, "scene_item": None,
-            "is_transitioning": False, "transition_start_time": 0, "transition_start_zoom": 1.0,
-            "transition_target_zoom": 1.0, "transition_duration": 0.3, "is_zooming_in": False
-        }
-        src_settings.clear()
-        src_settings.update(default_source_settings_values)
+        src_settings.reset()
+
+    # Take the scene items and clear the globals before anything is released
+    scene_items = (g_current_scene_item1, g_current_scene_item2)
+    g_current_scene_item1 = None
+    g_current_scene_item2 = None
 
     # Cleanup resources for Config 1
     # Ensure config1 and source_settings1 exist before calling cleanup to prevent errors during early/failed script load
-    if isinstance(config1, dict) and isinstance(source_settings1, dict):
-        cleanup_config_resources(config1, source_settings1, "g_current_scene_item1")
+    if isinstance(config1, ConfigState) and isinstance(source_settings1, SourceState):
+        cleanup_config_resources(config1, source_settings1, scene_items[0], "g_current_scene_item1")
     else:
         log_warning("Config1 or source_settings1 not properly initialized for unload cleanup.")
 
     # Cleanup resources for Config 2
-    if isinstance(config2, dict) and isinstance(source_settings2, dict):
-        cleanup_config_resources(config2, source_settings2, "g_current_scene_item2")
+    if isinstance(config2, ConfigState) and isinstance(source_settings2, SourceState):
+        cleanup_config_resources(config2, source_settings2, scene_items[1], "g_current_scene_item2")
     else:
         log_warning("Config2 or source_settings2 not properly initialized for unload cleanup.")
     
-    # Force garbage collection
-    try:
-        import gc
-        gc.collect()
-        # Run multiple collections to ensure everything is cleaned up
-        gc.collect(2)  # Full collection
-        gc.collect(2)  # Run again to catch anything missed
-        log("Aggressive garbage collection performed")
-    except Exception as e:
-        log_error(f"Error during garbage collection: {e}")
-    
-    # Store the final log message before we clear the module
-    final_log_message = f"Script unload completed (Mouse Pan & Zoom v{SCRIPT_VERSION})"
-    
-    # Force Python to run garbage collection one more time
-    try:
-        import gc
-        gc.collect(2)  # Full collection
-        log("Final garbage collection performed")
-    except Exception as e:
-        log_error(f"Error during final garbage collection: {e}")
-    
-    # Log the final message
-    log(final_log_message)
+    # No gc.collect() here: the released wrappers hold no cycles, so refcounting frees them
+    log("Script unload completed (Mouse Pan & Zoom v%s)", SCRIPT_VERSION)
     
     # DO NOT try to manipulate the module in sys.modules
     # Let OBS handle the reloading process naturally
@@ -3115,56 +2938,47 @@ def refresh_sources_clicked(props, prop):
     try:
         # First, update the internal caches for both configurations
         # This will use the currently selected scenes in config1 and config2 settings dicts
-        refresh_caches_for_config(config1)
-        refresh_caches_for_config(config2)
+        refresh_caches_for_both_configs()
+        invalidate_monitor_cache()
+        invalidate_scene_list_entries()
+        invalidate_viewport_alignment_checks()
 
         # Helper to repopulate UI lists for a given config number
-        def repopulate_ui_for_config(p, config_num_str, current_cfg):
-            prefix = f"config{config_num_str}_"
-            target_scene_list_prop = obs.obs_properties_get(p, f"{prefix}target_scene")
-            target_source_list_prop = obs.obs_properties_get(p, f"{prefix}source_name")
-            viewport_list_prop = obs.obs_properties_get(p, f"{prefix}viewport_color_source_name")
+        def repopulate_ui_for_config(p, config_num, current_cfg):
+            keys = CONFIG_SETTING_KEYS[config_num]
+            target_scene_list_prop = obs.obs_properties_get(p, keys["target_scene"])
+            target_source_list_prop = obs.obs_properties_get(p, keys["source_name"])
+            viewport_list_prop = obs.obs_properties_get(p, keys["viewport_color_source_name"])
 
             # --- Repopulate Scene List (already up-to-date by OBS, but good to ensure selection)
             # We still clear and repopulate to manage our specific name:uuid format and "Select Scene" option.
             obs.obs_property_list_clear(target_scene_list_prop) 
             obs.obs_property_list_add_string(target_scene_list_prop, "Select Scene", "") # Default empty option
-            scenes = obs.obs_frontend_get_scenes()
-            if scenes:
-                for scene_obj in scenes:
-                    s_name = obs.obs_source_get_name(scene_obj)
-                    s_uuid = get_source_uuid(scene_obj)
-                    val = f"{s_name}:{s_uuid}"
-                    obs.obs_property_list_add_string(target_scene_list_prop, s_name, val)
-                obs.source_list_release(scenes)
+            add_list_strings(target_scene_list_prop, get_scene_list_entries())
             
             # --- Repopulate Target Source List from its cache
             obs.obs_property_list_clear(target_source_list_prop)
             obs.obs_property_list_add_string(target_source_list_prop, "Select Source", "") # Blank option
-            if current_cfg.get("source_cache"):
-                for source_item in current_cfg["source_cache"]:
-                    obs.obs_property_list_add_string(target_source_list_prop, source_item["name"], source_item["value"])
+            add_list_strings(target_source_list_prop, [(item["name"], item["value"]) for item in current_cfg.source_cache])
             
             # --- Repopulate Viewport Source List from its cache
             obs.obs_property_list_clear(viewport_list_prop)
             # The viewport_cache (populated by refresh_caches_for_config) 
             # should have "Use Scene Dimensions" as the first item if a scene is selected.
             # If no scene is selected for the config, its viewport_cache will be empty (or just have "Select Source").
-            if not current_cfg.get("target_scene_name"):
+            if not current_cfg.target_scene_name:
                  obs.obs_property_list_add_string(viewport_list_prop, "Select Source", "") # Blank if no scene for this config
             
-            if current_cfg.get("viewport_cache"):
-                for viewport_item in current_cfg["viewport_cache"]:
-                    obs.obs_property_list_add_string(viewport_list_prop, viewport_item["name"], viewport_item["value"])
+            add_list_strings(viewport_list_prop, [(item["name"], item["value"]) for item in current_cfg.viewport_cache])
 
             # Set visibility based on whether a scene is selected for this config
-            has_scene_selected = bool(current_cfg.get("target_scene_name"))
+            has_scene_selected = bool(current_cfg.target_scene_name)
             obs.obs_property_set_visible(target_source_list_prop, has_scene_selected)
             obs.obs_property_set_visible(viewport_list_prop, has_scene_selected)
 
         # Repopulate UI for both configs
-        repopulate_ui_for_config(props, "1", config1)
-        repopulate_ui_for_config(props, "2", config2)
+        repopulate_ui_for_config(props, 1, config1)
+        repopulate_ui_for_config(props, 2, config2)
         
         log("Scene and source lists UI refreshed manually.")
         return True # Important: must return True for OBS to update properties UI
@@ -3175,28 +2989,40 @@ def refresh_sources_clicked(props, prop):
 # Helper function to get a source's UUID
 def get_source_uuid(source):
     """Get the UUID of a source as a string, or the source name if UUID functions are unavailable"""
+    # SWIG wrappers are recreated on every call, so key the cache by the underlying pointer
+    try:
+        cache_key = int(source)
+    except (TypeError, ValueError):
+        cache_key = None
+    if cache_key:
+        cached_uuid = g_source_uuid_cache.get(cache_key)
+        if cached_uuid is not None:
+            return cached_uuid
+    
+    source_uuid = ""
     try:
         # Check if OBS UUID functions are available (OBS 31.0+)
-        if hasattr(obs, "obs_source_get_uuid") and hasattr(obs, "obs_source_get_uuid_str"):
-            uuid = obs.obs_source_get_uuid(source)
+        if HAS_SOURCE_UUID:
+            uuid = OBS_SOURCE_GET_UUID(source)
             if uuid:
-                uuid_str = obs.obs_source_get_uuid_str(uuid)
-                return uuid_str
+                source_uuid = OBS_SOURCE_GET_UUID_STR(uuid)
         
         # Fallback to using source name with a unique identifier
         # This provides compatibility while still allowing unique identification
-        if source:
+        if not source_uuid and source:
             source_name = obs.obs_source_get_name(source)
             source_id = obs.obs_source_get_id(source)
             if source_name and source_id:
-                return f"{source_name}:{source_id}"
+                source_uuid = f"{source_name}:{source_id}"
             elif source_name:
-                return source_name
+                source_uuid = source_name
     
     except Exception as e:
         log_error(f"Error getting source UUID: {e}")
     
-    return ""
+    if cache_key and source_uuid:
+        g_source_uuid_cache[cache_key] = source_uuid
+    return source_uuid or ""
 
 # Helper function to find a source by UUID
 def find_source_by_uuid(uuid_str):
@@ -3207,94 +3033,75 @@ def find_source_by_uuid(uuid_str):
     # Check if this looks like our fallback format (name:id)
     is_fallback_format = ":" in uuid_str and not uuid_str.startswith(":")
     
+    # Real UUID on OBS 29+: let libobs look it up (returns a reference the caller releases)
+    if not is_fallback_format and OBS_GET_SOURCE_BY_UUID:
+        found_source = OBS_GET_SOURCE_BY_UUID(uuid_str)
+        if found_source:
+            return found_source
+    
     sources = obs.obs_enum_sources()
     found_source = None
     
     if sources:
+        # Single pass: keep the first match (caller is responsible for it) and release everything else
         for source in sources:
-            if is_fallback_format:
-                # If using fallback format, check source_name:source_id
+            if found_source is None:
                 source_name = obs.obs_source_get_name(source)
-                source_id = obs.obs_source_get_id(source)
-                if source_name and source_id:
-                    current_id = f"{source_name}:{source_id}"
-                    if current_id == uuid_str:
+                if is_fallback_format:
+                    # If using fallback format, check source_name:source_id
+                    source_id = obs.obs_source_get_id(source)
+                    if source_name and source_id and f"{source_name}:{source_id}" == uuid_str:
                         found_source = source
-                        # Don't release this specific source - caller is responsible
-                        break
-            else:
-                # Try using real UUID if available
-                try:
-                    if hasattr(obs, "obs_source_get_uuid") and hasattr(obs, "obs_source_get_uuid_str"):
-                        source_uuid = obs.obs_source_get_uuid(source)
-                        if source_uuid:
-                            current_uuid = obs.obs_source_get_uuid_str(source_uuid)
-                            if current_uuid == uuid_str:
+                        continue
+                else:
+                    # Try using real UUID if available
+                    if HAS_SOURCE_UUID:
+                        try:
+                            source_uuid = OBS_SOURCE_GET_UUID(source)
+                            if source_uuid and OBS_SOURCE_GET_UUID_STR(source_uuid) == uuid_str:
                                 found_source = source
-                                # Don't release this specific source - caller is responsible
-                                break
-                except Exception:
-                    pass
-                
-                # Also check source name as a fallback
-                source_name = obs.obs_source_get_name(source)
-                if source_name == uuid_str:
-                    found_source = source
-                    # Don't release this specific source - caller is responsible
-                    break
-        
-        # Release all sources except the one we found
-        for source in sources:
-            if source != found_source:
-                obs.obs_source_release(source)
+                                continue
+                        except Exception:
+                            pass
+                    
+                    # Also check source name as a fallback
+                    if source_name == uuid_str:
+                        found_source = source
+                        continue
+            obs.obs_source_release(source)
     
     return found_source
 
 # Callback function for when the Target Scene is changed
-def on_target_scene_changed(props, prop, settings_obj):
+def on_target_scene_changed(props, prop, settings_obj, config_num, current_config, src_settings):
     """Callback when the target scene is changed - updates source lists"""
     try:
-        # Determine which configuration we're working with based on the property name
-        prop_name = obs.obs_property_name(prop)
-        config_num = 1
-        config_prefix = "config1_"
-        
-        if "config2_" in prop_name:
-            config_num = 2
-            config_prefix = "config2_"
-        
-        # Get the appropriate config dictionary
-        current_config = config1 if config_num == 1 else config2
+        keys = CONFIG_SETTING_KEYS[config_num]
         
         # Get the scene value - using the correct property ID with prefix
-        scene_value = obs.obs_data_get_string(settings_obj, f"{config_prefix}target_scene")
+        scene_value = obs.obs_data_get_string(settings_obj, keys["target_scene"])
         
         # Parse the scene name and UUID
-        if ":" in scene_value:
-            scene_name, scene_uuid = scene_value.split(":", 1)
-        else:
-            scene_name = scene_value
-            scene_uuid = ""
+        scene_name, scene_uuid = split_composite_value(scene_value)
         
         # Update config settings
-        current_config["target_scene_name"] = scene_name
-        current_config["target_scene_uuid"] = scene_uuid
+        current_config.target_scene_name = scene_name
+        current_config.target_scene_uuid = scene_uuid
         
         # Perform a full refresh of scenes and sources for both configs
         # This ensures all dropdowns are up-to-date whenever the scene changes
         log(f"Target scene changed to '{scene_name}' - refreshing all scenes and sources")
         
         # First refresh the caches for both configs
-        refresh_caches_for_config(config1)
-        refresh_caches_for_config(config2)
+        refresh_caches_for_both_configs()
         
         # Now update the UI for both configs
-        def update_ui_for_config(p, cfg_num_str, cfg):
-            prefix = f"config{cfg_num_str}_"
+        def update_ui_for_config(p, cfg_num, cfg):
+            cfg_keys = CONFIG_SETTING_KEYS[cfg_num]
             
             # Get the source lists to update
-            target_src_list = obs.obs_properties_get(p, f"{prefix}source_name")
-            viewport_src_list = obs.obs_properties_get(p, f"{prefix}viewport_color_source_name")
+            target_src_list = obs.obs_properties_get(p, cfg_keys["source_name"])
+            viewport_src_list = obs.obs_properties_get(p, cfg_keys["viewport_color_source_name"])
             
             # Clear current lists
             obs.obs_property_list_clear(target_src_list)
@@ -3304,37 +3111,33 @@ def on_target_scene_changed(props, prop, settings_obj):
             obs.obs_property_list_add_string(target_src_list, "Select Source", "")
             
             # For viewport source list
-            if cfg.get("target_scene_name"):
+            if cfg.target_scene_name:
                 # Add 'Use Scene Dimensions' option for viewport list
                 obs.obs_property_list_add_string(viewport_src_list, "Use Scene Dimensions", USE_SCENE_DIMENSIONS)
                 
                 # Pre-select "Use Scene Dimensions" as the active option
-                current_viewport = obs.obs_data_get_string(settings_obj, f"{prefix}viewport_color_source_name")
+                current_viewport = obs.obs_data_get_string(settings_obj, cfg_keys["viewport_color_source_name"])
                 if not current_viewport or is_use_scene_dimensions(current_viewport):
-                    obs.obs_data_set_string(settings_obj, f"{prefix}viewport_color_source_name", USE_SCENE_DIMENSIONS)
+                    obs.obs_data_set_string(settings_obj, cfg_keys["viewport_color_source_name"], USE_SCENE_DIMENSIONS)
             else:
                 # Add blank option only if no scene is selected
                 obs.obs_property_list_add_string(viewport_src_list, "Select Source", "")
             
             # Add cached source items
-            if cfg.get("source_cache"):
-                for source_item in cfg.get("source_cache"):
-                    obs.obs_property_list_add_string(target_src_list, source_item["name"], source_item["value"])
+            add_list_strings(target_src_list, [(item["name"], item["value"]) for item in cfg.source_cache])
             
             # Add cached viewport items (skip "Use Scene Dimensions" as we already added it)
-            if cfg.get("viewport_cache"):
-                for viewport_item in cfg.get("viewport_cache"):
-                    if viewport_item["value"] != USE_SCENE_DIMENSIONS:
-                        obs.obs_property_list_add_string(viewport_src_list, viewport_item["name"], viewport_item["value"])
+            add_list_strings(viewport_src_list, [(item["name"], item["value"]) for item in cfg.viewport_cache
+                                                 if item["value"] != USE_SCENE_DIMENSIONS])
             
             # Set visibility based on whether a scene is selected
-            has_scene = bool(cfg.get("target_scene_name"))
+            has_scene = bool(cfg.target_scene_name)
             obs.obs_property_set_visible(target_src_list, has_scene)
             obs.obs_property_set_visible(viewport_src_list, has_scene)
         
         # Update UI for both configs
-        update_ui_for_config(props, "1", config1)
-        update_ui_for_config(props, "2", config2)
+        update_ui_for_config(props, 1, config1)
+        update_ui_for_config(props, 2, config2)
         
         # Return true to trigger a refresh of the properties
         return True
@@ -3343,33 +3146,19 @@ def on_target_scene_changed(props, prop, settings_obj):
         return False
 
 # Callback for when target source is changed
-def on_target_source_changed(props, prop, settings_obj):
+def on_target_source_changed(props, prop, settings_obj, config_num, current_config, src_settings):
     """Callback when the target source is changed"""
     try:
-        # Determine which configuration we're working with based on the property name
-        prop_name = obs.obs_property_name(prop)
-        config_num = 1
-        config_prefix = "config1_"
+        keys = CONFIG_SETTING_KEYS[config_num]
         
-        if "config2_" in prop_name:
-            config_num = 2
-            config_prefix = "config2_"
-        
-        # Get the appropriate config dictionary
-        current_config = config1 if config_num == 1 else config2
-        
-        source_value = obs.obs_data_get_string(settings_obj, f"{config_prefix}source_name")
+        source_value = obs.obs_data_get_string(settings_obj, keys["source_name"])
         
         # Parse the source name and UUID
-        if ":" in source_value:
-            source_name, source_uuid = source_value.split(":", 1)
-        else:
-            source_name = source_value
-            source_uuid = ""
+        source_name, source_uuid = split_composite_value(source_value)
         
         # Update config settings
-        current_config["source_name"] = source_name
-        current_config["source_uuid"] = source_uuid
+        current_config.source_name = source_name
+        current_config.source_uuid = source_uuid
         
         return True
     except Exception as e:
@@ -3377,43 +3166,30 @@ def on_target_source_changed(props, prop, settings_obj):
         return False
 
 # Callback for when viewport source is changed
-def on_viewport_source_changed(props, prop, settings_obj):
+def on_viewport_source_changed(props, prop, settings_obj, config_num, current_config, src_settings):
     """Callback when the viewport source is changed"""
     try:
-        # Determine which configuration we're working with based on the property name
-        prop_name = obs.obs_property_name(prop)
-        config_num = 1
-        config_prefix = "config1_"
-        
-        if "config2_" in prop_name:
-            config_num = 2
-            config_prefix = "config2_"
-        
-        # Get the appropriate config dictionary
-        current_config = config1 if config_num == 1 else config2
+        keys = CONFIG_SETTING_KEYS[config_num]
         
-        # Get the appropriate source settings
-        src_settings = source_settings1 if config_num == 1 else source_settings2
-        
-        source_value = obs.obs_data_get_string(settings_obj, f"{config_prefix}viewport_color_source_name")
+        source_value = obs.obs_data_get_string(settings_obj, keys["viewport_color_source_name"])
         
         # Check if special "Use Scene Dimensions" option is selected using the helper
         if is_use_scene_dimensions(source_value):
-            current_config["viewport_color_source_name"] = USE_SCENE_DIMENSIONS
-            current_config["viewport_color_source_uuid"] = ""
+            current_config.viewport_color_source_name = USE_SCENE_DIMENSIONS
+            current_config.viewport_color_source_uuid = ""
             log(f"Config {config_num}: Using scene dimensions for viewport")
             
             # When switching to scene dimensions, clear any previous viewport dimensions
-            src_settings["viewport_width"] = 0
-            src_settings["viewport_height"] = 0
-            src_settings["viewport_scene_center_x"] = 0
-            src_settings["viewport_scene_center_y"] = 0
+            src_settings.viewport_width = 0
+            src_settings.viewport_height = 0
+            src_settings.viewport_scene_center_x = 0
+            src_settings.viewport_scene_center_y = 0
             
             # For scene dimensions, alignment is always considered correct (not applicable)
-            current_config["viewport_alignment_correct"] = True
+            current_config.viewport_alignment_correct = True
             
             # Update the alignment status indicator in UI
-            alignment_text_prop = obs.obs_properties_get(props, f"{config_prefix}alignment_status")
+            alignment_text_prop = obs.obs_properties_get(props, keys["alignment_status"])
             if alignment_text_prop:
                 alignment_style = "color: green; font-weight: bold;"
                 alignment_text = "✓ Viewport alignment correct (Top Left)"
@@ -3425,59 +3201,19 @@ def on_viewport_source_changed(props, prop, settings_obj):
             return True
         
         # Parse the source name and UUID
-        if ":" in source_value:
-            source_name, source_uuid = source_value.split(":", 1)
-        else:
-            source_name = source_value
-            source_uuid = ""
+        source_name, source_uuid = split_composite_value(source_value)
         
         # Update config settings
-        current_config["viewport_color_source_name"] = source_name
-        current_config["viewport_color_source_uuid"] = source_uuid
+        current_config.viewport_color_source_name = source_name
+        current_config.viewport_color_source_uuid = source_uuid
         
         # Check the viewport alignment immediately when source is selected
-        viewport_scene_item = None
-        viewport_found = False
-        
-        # Try to find source by UUID first if available
-        if source_uuid:
-            viewport_source = find_source_by_uuid(source_uuid)
-            if viewport_source:
-                # Now look for this in scenes
-                scenes = obs.obs_frontend_get_scenes()
-                if scenes:
-                    for scene in scenes:
-                        viewport_scene_item = find_scene_item(scene, source_name)
-                        if viewport_scene_item:
-                            viewport_found = True
-                            # Check alignment and store result
-                            current_config["viewport_alignment_correct"] = check_viewport_alignment(
-                                viewport_scene_item, source_name, config_num
-                            )
-                            obs.obs_sceneitem_release(viewport_scene_item)
-                            break
-                    obs.source_list_release(scenes)
-                obs.obs_source_release(viewport_source)
-        
-        # If not found by UUID, try by name
-        if not viewport_found and source_name:
-            scenes = obs.obs_frontend_get_scenes()
-            if scenes:
-                for scene in scenes:
-                    viewport_scene_item = find_scene_item(scene, source_name)
-                    if viewport_scene_item:
-                        # Check alignment and store result
-                        current_config["viewport_alignment_correct"] = check_viewport_alignment(
-                            viewport_scene_item, source_name, config_num
-                        )
-                        obs.obs_sceneitem_release(viewport_scene_item)
-                        break
-                obs.source_list_release(scenes)
+        refresh_viewport_alignment(current_config, config_num)
         
         # Update the alignment status indicator in UI
-        alignment_text_prop = obs.obs_properties_get(props, f"{config_prefix}alignment_status")
+        alignment_text_prop = obs.obs_properties_get(props, keys["alignment_status"])
         if alignment_text_prop:
-            alignment_status = current_config.get("viewport_alignment_correct", True)
+            alignment_status = current_config.viewport_alignment_correct
             alignment_text = "✓ Viewport alignment correct (Top Left)" if alignment_status else "⚠ VIEWPORT ALIGNMENT INCORRECT! Set to Top Left in Edit Transform"
             alignment_style = "color: green; font-weight: bold;" if alignment_status else "color: red; font-weight: bold; background-color: #fff3cd; padding: 3px;"
             
@@ -3528,8 +3264,8 @@ def get_scene_dimensions(scene_source):
                 has_items = True
                 
                 # Get item transform
-                pos = obs.vec2()
-                scale = obs.vec2()
+                pos = g_scratch_pos
+                scale = g_scratch_scale
                 
                 obs.obs_sceneitem_get_pos(item, pos)
                 obs.obs_sceneitem_get_scale(item, scale)
@@ -3590,8 +3326,8 @@ def refresh_scenes_and_sources():
             return
             
         # Update scene lists
-        selected_scene_name = settings.get("target_scene_name", "")
-        selected_scene_uuid = settings.get("target_scene_uuid", "")
+        selected_scene_name = settings.target_scene_name
+        selected_scene_uuid = settings.target_scene_uuid
         
         # If we don't have a selected scene but OBS is running, try to get the current scene
         if not selected_scene_name:
@@ -3605,8 +3341,8 @@ def refresh_scenes_and_sources():
                     # Update settings with current scene
                     selected_scene_name = current_scene_name
                     selected_scene_uuid = current_scene_uuid
-                    settings["target_scene_name"] = selected_scene_name
-                    settings["target_scene_uuid"] = selected_scene_uuid
+                    settings.target_scene_name = selected_scene_name
+                    settings.target_scene_uuid = selected_scene_uuid
                     
                     # Debug logging removed
             except Exception as e:
@@ -3614,12 +3350,7 @@ def refresh_scenes_and_sources():
         
         # If a target scene is set, refresh sources for that scene
         if selected_scene_name:
-            scene_source = None
-            if selected_scene_uuid:
-                scene_source = find_source_by_uuid(selected_scene_uuid)
-            
-            if not scene_source:
-                scene_source = obs.obs_get_source_by_name(selected_scene_name)
+            scene_source = get_scene_source(selected_scene_name, selected_scene_uuid)
                 
             if scene_source:
                 # Update sources for this scene
@@ -3656,8 +3387,8 @@ def refresh_scenes_and_sources():
                         obs.sceneitem_list_release(items)
                     
                     # Store these caches in global settings for later use in UI
-                    settings["source_cache"] = source_cache
-                    settings["viewport_cache"] = viewport_cache
+                    settings.source_cache = source_cache
+                    settings.viewport_cache = viewport_cache
                     
                     # Debug logging removed
                 
@@ -3674,7 +3405,7 @@ def refresh_scenes_and_sources():
 # Get monitor information for a specific config
 def get_monitor_info_for_config(config):
     """Get monitor information for a specific config"""
-    monitor_id = config.get("monitor_id", 0)
+    monitor_id = config.monitor_id
     
     # Try to get from cache first
     if monitor_id in monitor_cache:
@@ -3687,72 +3418,169 @@ def get_monitor_info_for_config(config):
     for monitor in monitors:
         if monitor["id"] == monitor_id:
             # Cache it for future use
-            monitor_cache[monitor_id] = {
-                "screen_width": monitor["width"],
-                "screen_height": monitor["height"],
-                "screen_x_offset": monitor["x"],
-                "screen_y_offset": monitor["y"]
-            }
+            monitor_cache[monitor_id] = MonitorInfo(monitor["width"], monitor["height"], monitor["x"], monitor["y"])
             return monitor_cache[monitor_id]
     
     # If monitor not found, use default
     log_warning(f"Monitor ID {monitor_id} not found, using default")
-    return default_monitor_info.copy()
+    return default_monitor_info
 
 # Get mouse position adjusted for the monitor in a config
-def get_adjusted_mouse_pos(config):
-    """Get mouse position adjusted for the monitor in a config"""
+def get_adjusted_mouse_pos(config, _min=min, _max=max):
+    """Return (x_pct, y_pct, is_inside_monitor) for the monitor selected in a config"""
     # Get global mouse position
-    global_mouse = get_mouse_pos()
+    mouse_x, mouse_y = get_mouse_pos()
     
     # Get monitor info for this config
     monitor_info = get_monitor_info_for_config(config)
+    screen_width = monitor_info.screen_width
+    screen_height = monitor_info.screen_height
     
     # Calculate relative position
-    relative_mouse_x = global_mouse["x"] - monitor_info["screen_x_offset"]
-    relative_mouse_y = global_mouse["y"] - monitor_info["screen_y_offset"]
+    relative_mouse_x = mouse_x - monitor_info.screen_x_offset
+    relative_mouse_y = mouse_y - monitor_info.screen_y_offset
     
     # Calculate percentage position
-    mouse_x_pct = relative_mouse_x / monitor_info["screen_width"]
-    mouse_y_pct = relative_mouse_y / monitor_info["screen_height"]
+    mouse_x_pct = relative_mouse_x / screen_width
+    mouse_y_pct = relative_mouse_y / screen_height
     
     # Ensure mouse_pct is within 0-1
-    mouse_x_pct = max(0.0, min(1.0, mouse_x_pct))
-    mouse_y_pct = max(0.0, min(1.0, mouse_y_pct))
+    mouse_x_pct = _max(0.0, _min(1.0, mouse_x_pct))
+    mouse_y_pct = _max(0.0, _min(1.0, mouse_y_pct))
     
     # Check if inside monitor bounds for specific monitors
     is_inside_monitor = True
-    if config["monitor_id"] != 0:  # Only check if not using "All Monitors"
+    if config.monitor_id != 0:  # Only check if not using "All Monitors"
         is_inside_monitor = (
             relative_mouse_x >= 0 and 
-            relative_mouse_x < monitor_info["screen_width"] and
+            relative_mouse_x < screen_width and
             relative_mouse_y >= 0 and 
-            relative_mouse_y < monitor_info["screen_height"]
+            relative_mouse_y < screen_height
         )
     
-    return {
-        "x_pct": mouse_x_pct,
-        "y_pct": mouse_y_pct,
-        "is_inside_monitor": is_inside_monitor,
-        "monitor_info": monitor_info
-    }
+    return (mouse_x_pct, mouse_y_pct, is_inside_monitor)
+
+# Pure pan math: map a mouse percentage to the source position that puts it at viewport center
+def compute_pan_position(mouse_x_pct, mouse_y_pct, S_w_native, S_h_native,
+                         crop_left, crop_top, crop_right, crop_bottom,
+                         scale_x, scale_y, V_w, V_h,
+                         viewport_center_x, viewport_center_y, offset_x, offset_y):
+    """Return the clamped (pos_x, pos_y) for a source; plain float arithmetic, no OBS calls"""
+    # Calculate visible dimensions (after cropping)
+    S_w_visible = S_w_native - crop_left - crop_right
+    S_h_visible = S_h_native - crop_top - crop_bottom
+    
+    # STEP 1: Simple center-based calculation (without crop)
+    # First calculate the precise source point that should be at viewport center
+    
+    # STEP 1: Account for crop in mouse coordinate mapping
+    # When a source is cropped, we need to adjust how mouse coordinates map to the source
+    
+    # STEP 1: Map mouse position to the uncropped source coordinates
+    # First, we need to map the mouse percentage to the full source dimensions
+    # This gives us the position in the original, uncropped source
+    full_source_x = mouse_x_pct * S_w_native
+    full_source_y = mouse_y_pct * S_h_native
+    
+    # STEP 2: Adjust for cropping
+    # We need to account for the crop by adjusting the coordinates
+    # The crop effectively shifts the visible area within the source
+    # We need to adjust our coordinates to account for this shift
+    
+    # Calculate the center of the visible (cropped) area in the original source coordinates
+    visible_center_x_in_source = crop_left + (S_w_visible / 2)
+    visible_center_y_in_source = crop_top + (S_h_visible / 2)
+    
+    # Calculate the offset from the center of the visible area
+    # This is how far the mouse is from the center of the visible area
+    offset_from_visible_center_x = full_source_x - visible_center_x_in_source
+    offset_from_visible_center_y = full_source_y - visible_center_y_in_source
+    
+    # Scale the offset for scene coordinates
+    scene_offset_x = offset_from_visible_center_x * scale_x
+    scene_offset_y = offset_from_visible_center_y * scale_y
+    
+    # Calculate the position that would place this point at viewport center
+    adjusted_pos_x = viewport_center_x - scene_offset_x
+    adjusted_pos_y = viewport_center_y - scene_offset_y
+    
+    # Apply user-defined pixel offsets (not affected by zoom)
+    adjusted_pos_x += offset_x
+    adjusted_pos_y += offset_y
+    
+    # STEP 3: Calculate visible bounds for clamping
+    # Calculate scaled visible dimensions
+    visible_width_scene = S_w_visible * scale_x
+    visible_height_scene = S_h_visible * scale_y
+    
+    # Calculate visible area bounds
+    visible_center_x = adjusted_pos_x
+    visible_center_y = adjusted_pos_y
+    
+    # Calculate visible area edges
+    visible_left = visible_center_x - (visible_width_scene / 2)
+    visible_right = visible_left + visible_width_scene
+    visible_top = visible_center_y - (visible_height_scene / 2)
+    visible_bottom = visible_top + visible_height_scene
+    
+    # Calculate viewport edges
+    viewport_left = viewport_center_x - (V_w / 2)
+    viewport_right = viewport_center_x + (V_w / 2)
+    viewport_top = viewport_center_y - (V_h / 2)
+    viewport_bottom = viewport_center_y + (V_h / 2)
+    
+    # STEP 4: Apply clamping
+    # Only apply if visible area is larger than viewport
+    if visible_width_scene > V_w:
+        # Horizontal clamping
+        if visible_left > viewport_left:
+            # Left edge is inside viewport (too far right)
+            adjust = visible_left - viewport_left
+            adjusted_pos_x -= adjust
+        elif visible_right < viewport_right:
+            # Right edge is inside viewport (too far left)
+            adjust = viewport_right - visible_right
+            adjusted_pos_x += adjust
+    else:
+        # Center horizontally
+        center_adjust_x = ((viewport_left + viewport_right) / 2) - ((visible_left + visible_right) / 2)
+        adjusted_pos_x += center_adjust_x
+    
+    if visible_height_scene > V_h:
+        # Vertical clamping
+        if visible_top > viewport_top:
+            # Top edge is inside viewport (too far down)
+            adjust = visible_top - viewport_top
+            adjusted_pos_y -= adjust
+        elif visible_bottom < viewport_bottom:
+            # Bottom edge is inside viewport (too far up)
+            adjust = viewport_bottom - visible_bottom
+            adjusted_pos_y += adjust
+    else:
+        # Center vertically
+        center_adjust_y = ((viewport_top + viewport_bottom) / 2) - ((visible_top + visible_bottom) / 2)
+        adjusted_pos_y += center_adjust_y
+    
+    return (adjusted_pos_x, adjusted_pos_y)
 
 # Main update function for a single config
-def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
+def update_pan_and_zoom_for_config(config, src_settings, current_scene_item,
+                                   _abs=abs, _isfinite=math.isfinite):
     """Update panning and zooming for a single configuration"""
+    # Builtins/math helpers are bound as defaults so the per-frame math uses local lookups
     # Skip if this config is not enabled or panning is disabled
-    if not config.get("enabled", False) or not config.get("pan_enabled", False):
+    if not config.enabled or not config.pan_enabled:
         # If we were transitioning, stop the transition
-        if src_settings["is_transitioning"]:
-            src_settings["is_transitioning"] = False
+        if src_settings.is_transitioning:
+            src_settings.is_transitioning = False
         return
     
     # Skip if pause is enabled - freeze all panning and zooming
-    if config.get("pause_enabled", False):
+    if config.pause_enabled:
         return
     
     # Check if we have viewport dimensions and a valid cached scene item
-    if src_settings["viewport_width"] <= 0 or src_settings["viewport_height"] <= 0:
+    if src_settings.viewport_width <= 0 or src_settings.viewport_height <= 0:
         return
         
     if current_scene_item is None:
@@ -3762,8 +3590,8 @@ def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
     scene_item = current_scene_item
     
     # Get viewport's scene center (captured when panning was enabled)
-    actual_viewport_center_x = src_settings.get("viewport_scene_center_x")
-    actual_viewport_center_y = src_settings.get("viewport_scene_center_y")
+    actual_viewport_center_x = src_settings.viewport_scene_center_x
+    actual_viewport_center_y = src_settings.viewport_scene_center_y
 
     if actual_viewport_center_x is None or actual_viewport_center_y is None:
         # This should ideally not happen if toggle_panning ensures these are set
@@ -3771,36 +3599,40 @@ def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
         return
     
     # --- Transition handling ---
+    # Read the per-frame flags once; they are only written back when they change
+    zoom_enabled = config.zoom_enabled
+    is_transitioning = src_settings.is_transitioning
+    transition_type = src_settings.transition_type
     current_zoom_level = 1.0  # Default to 1.0 when no zoom
     
     # First, determine the zoom level
     # If zoom is enabled, use the configured zoom level
-    if config["zoom_enabled"]:
-        current_zoom_level = config["zoom_level"]
+    if zoom_enabled:
+        current_zoom_level = config.zoom_level
     
     # Check if we're in a transition
-    if src_settings["is_transitioning"]:
-        # Get the transition type
-        transition_type = src_settings.get("transition_type", "zoom")
+    if is_transitioning:
         
         # Calculate how far we are in the transition
-        elapsed_time = time.time() - src_settings["transition_start_time"]
-        transition_duration = src_settings["transition_duration"]
-        
-        # Calculate progress (0.0 to 1.0)
-        progress = min(1.0, elapsed_time / transition_duration)
+        elapsed_time = time.monotonic() - src_settings.transition_start_time
+        transition_duration = src_settings.transition_duration
         
-        # Apply easing for a smooth transition
-        eased_progress = ease_in_out_quad(progress)
+        # Calculate progress (0.0 to 1.0); a zero duration completes immediately
+        if elapsed_time >= transition_duration:
+            progress = eased_progress = 1.0
+        else:
+            progress = elapsed_time / transition_duration
+            # Apply easing for a smooth transition
+            eased_progress = ease_in_out_quad(progress)
         
         # Handle different types of transitions
         if transition_type == "deadzone_off":
             # For deadzone_off transitions, we're transitioning mouse position
             # Interpolate between start and target positions
-            start_x = src_settings.get("transition_start_x", 0.5)
-            start_y = src_settings.get("transition_start_y", 0.5)
-            target_x = src_settings.get("transition_target_x", 0.5)
-            target_y = src_settings.get("transition_target_y", 0.5)
+            start_x = src_settings.transition_start_x
+            start_y = src_settings.transition_start_y
+            target_x = src_settings.transition_target_x
+            target_y = src_settings.transition_target_y
             
             # Store the interpolated position for use in calculations
             mouse_x_pct = start_x + (target_x - start_x) * eased_progress
@@ -3810,48 +3642,46 @@ def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
             
             # If we're transitioning from deadzone, update the deadzone center
             if transition_type == "deadzone_off":
-                src_settings["deadzone_center_x"] = mouse_x_pct
-                src_settings["deadzone_center_y"] = mouse_y_pct
+                src_settings.deadzone_center_x = mouse_x_pct
+                src_settings.deadzone_center_y = mouse_y_pct
             
             # Check if transition is complete
             if progress >= 1.0:
-                src_settings["is_transitioning"] = False
+                is_transitioning = False
+                src_settings.is_transitioning = False
                 # Make sure deadzone is disabled
-                config["deadzone_enabled"] = False
+                config.deadzone_enabled = False
         elif transition_type == "zoom":
             # For zoom transitions
             # Interpolate between start and target zoom
-            start_zoom = src_settings.get("transition_start_zoom", 1.0)
-            target_zoom = src_settings.get("transition_target_zoom", 1.0)
+            start_zoom = src_settings.transition_start_zoom
+            target_zoom = src_settings.transition_target_zoom
             current_zoom_level = start_zoom + (target_zoom - start_zoom) * eased_progress
             
             # Check if transition is complete
             if progress >= 1.0:
-                src_settings["is_transitioning"] = False
+                is_transitioning = False
+                src_settings.is_transitioning = False
                 current_zoom_level = target_zoom  # Ensure we land exactly on target
     
     # --- Get mouse position and monitor bounds ---
     # Only get the mouse position if we're not already using interpolated positions from a deadzone_off transition
-    if not (src_settings["is_transitioning"] and src_settings.get("transition_type", "") == "deadzone_off"):
-        mouse_data = get_adjusted_mouse_pos(config)
+    if not (is_transitioning and transition_type == "deadzone_off"):
+        original_mouse_x_pct, original_mouse_y_pct, is_inside_monitor = get_adjusted_mouse_pos(config)
         
         # Skip if mouse is outside the selected monitor
-        if not mouse_data["is_inside_monitor"]:
+        if not is_inside_monitor:
             return
         
-        # Get the mouse position
-        original_mouse_x_pct = mouse_data["x_pct"]
-        original_mouse_y_pct = mouse_data["y_pct"]
-        
         # Store the original mouse position for use in calculations
         mouse_x_pct = original_mouse_x_pct
         mouse_y_pct = original_mouse_y_pct
     
     # If deadzone is enabled, we need to handle it specially
-    if config.get("deadzone_enabled", False):
+    if config.deadzone_enabled:
         # Calculate deadzone size as percentage of viewport
-        deadzone_h_pct = config.get("deadzone_h_pct", 10) / 100.0
-        deadzone_v_pct = config.get("deadzone_v_pct", 10) / 100.0
+        deadzone_h_pct = config.deadzone_h_pct / 100.0
+        deadzone_v_pct = config.deadzone_v_pct / 100.0
         
         # Adjust deadzone size based on zoom level to keep it proportional to the source size
         # This prevents the deadzone from appearing larger when zoomed in
@@ -3863,15 +3693,9 @@ def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
         deadzone_half_width = deadzone_h_pct / 2.0
         deadzone_half_height = deadzone_v_pct / 2.0
         
-        # We need to store the deadzone center in the source_settings
-        # If it doesn't exist yet, initialize it to the center (0.5, 0.5)
-        if "deadzone_center_x" not in src_settings:
-            src_settings["deadzone_center_x"] = 0.5
-            src_settings["deadzone_center_y"] = 0.5
-        
-        # Get the current deadzone center
-        deadzone_center_x = src_settings["deadzone_center_x"]
-        deadzone_center_y = src_settings["deadzone_center_y"]
+        # Get the current deadzone center (SourceState starts it at the center, 0.5, 0.5)
+        deadzone_center_x = src_settings.deadzone_center_x
+        deadzone_center_y = src_settings.deadzone_center_y
         
         # Calculate deadzone boundaries
         deadzone_left = deadzone_center_x - deadzone_half_width
@@ -3907,32 +3731,34 @@ def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
             mouse_y_pct = deadzone_center_y
         
         # Store the updated deadzone center
-        src_settings["deadzone_center_x"] = deadzone_center_x
-        src_settings["deadzone_center_y"] = deadzone_center_y
+        src_settings.deadzone_center_x = deadzone_center_x
+        src_settings.deadzone_center_y = deadzone_center_y
+    
+    # --- Idle frame check ---
+    # Nothing to write if the mouse, zoom and offsets are exactly what we applied last frame
+    frame_inputs = (mouse_x_pct, mouse_y_pct, current_zoom_level, config.offset_x, config.offset_y)
+    if not is_transitioning and frame_inputs == src_settings.last_frame_inputs:
+        return
     
     # --- Source information ---
     
     # Get dimensions
-    S_w_native = src_settings["source_base_width"]   # Native width of full source
-    S_h_native = src_settings["source_base_height"]  # Native height of full source
+    S_w_native = src_settings.source_base_width   # Native width of full source
+    S_h_native = src_settings.source_base_height  # Native height of full source
 
     # Get crop values
-    crop_left = src_settings["crop_left"]
-    crop_top = src_settings["crop_top"]
-    crop_right = src_settings["crop_right"]
-    crop_bottom = src_settings["crop_bottom"]
+    crop_left = src_settings.crop_left
+    crop_top = src_settings.crop_top
+    crop_right = src_settings.crop_right
+    crop_bottom = src_settings.crop_bottom
 
-    # Calculate visible dimensions (after cropping)
-    S_w_visible = S_w_native - crop_left - crop_right
-    S_h_visible = S_h_native - crop_top - crop_bottom
-    
     # Viewport dimensions
-    V_w = src_settings["viewport_width"]
-    V_h = src_settings["viewport_height"]
+    V_w = src_settings.viewport_width
+    V_h = src_settings.viewport_height
     
     # Scale factors
-    base_scale_x = src_settings["initial_scale_x"] 
-    base_scale_y = src_settings["initial_scale_y"]
+    base_scale_x = src_settings.initial_scale_x 
+    base_scale_y = src_settings.initial_scale_y
     zoom_scale = current_zoom_level
     scale_x = base_scale_x * zoom_scale
     scale_y = base_scale_y * zoom_scale
@@ -3943,142 +3769,49 @@ def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
     new_pos_x = 0.0 
     new_pos_y = 0.0
 
-    if config["pan_enabled"]:
-        # STEP 1: Simple center-based calculation (without crop)
-        # First calculate the precise source point that should be at viewport center
-        
-        # STEP 1: Account for crop in mouse coordinate mapping
-        # When a source is cropped, we need to adjust how mouse coordinates map to the source
-        
-        # STEP 1: Map mouse position to the uncropped source coordinates
-        # First, we need to map the mouse percentage to the full source dimensions
-        # This gives us the position in the original, uncropped source
-        full_source_x = mouse_x_pct * S_w_native
-        full_source_y = mouse_y_pct * S_h_native
-        
-        # STEP 2: Adjust for cropping
-        # We need to account for the crop by adjusting the coordinates
-        # The crop effectively shifts the visible area within the source
-        # We need to adjust our coordinates to account for this shift
-        
-        # Calculate the center of the visible (cropped) area in the original source coordinates
-        visible_center_x_in_source = crop_left + (S_w_visible / 2)
-        visible_center_y_in_source = crop_top + (S_h_visible / 2)
-        
-        # Calculate the offset from the center of the visible area
-        # This is how far the mouse is from the center of the visible area
-        offset_from_visible_center_x = full_source_x - visible_center_x_in_source
-        offset_from_visible_center_y = full_source_y - visible_center_y_in_source
-        
-        # Scale the offset for scene coordinates
-        scene_offset_x = offset_from_visible_center_x * scale_x
-        scene_offset_y = offset_from_visible_center_y * scale_y
-        
-        # Calculate the position that would place this point at viewport center
-        adjusted_pos_x = actual_viewport_center_x - scene_offset_x
-        adjusted_pos_y = actual_viewport_center_y - scene_offset_y
-        
-        # Apply user-defined pixel offsets (not affected by zoom)
-        adjusted_pos_x += config.get("offset_x", 0)
-        adjusted_pos_y += config.get("offset_y", 0)
-        
-        # STEP 3: Calculate visible bounds for clamping
-        # Calculate scaled visible dimensions
-        visible_width_scene = S_w_visible * scale_x
-        visible_height_scene = S_h_visible * scale_y
-        
-        # Calculate visible area bounds
-        visible_center_x = adjusted_pos_x
-        visible_center_y = adjusted_pos_y
-        
-        # Calculate visible area edges
-        visible_left = visible_center_x - (visible_width_scene / 2)
-        visible_right = visible_left + visible_width_scene
-        visible_top = visible_center_y - (visible_height_scene / 2)
-        visible_bottom = visible_top + visible_height_scene
-        
-        # Calculate viewport edges
-        viewport_left = actual_viewport_center_x - (V_w / 2)
-        viewport_right = actual_viewport_center_x + (V_w / 2)
-        viewport_top = actual_viewport_center_y - (V_h / 2)
-        viewport_bottom = actual_viewport_center_y + (V_h / 2)
-        
-        # STEP 4: Apply clamping
-        # Only apply if visible area is larger than viewport
-        if visible_width_scene > V_w:
-            # Horizontal clamping
-            if visible_left > viewport_left:
-                # Left edge is inside viewport (too far right)
-                adjust = visible_left - viewport_left
-                adjusted_pos_x -= adjust
-            elif visible_right < viewport_right:
-                # Right edge is inside viewport (too far left)
-                adjust = viewport_right - visible_right
-                adjusted_pos_x += adjust
-        else:
-            # Center horizontally
-            center_adjust_x = ((viewport_left + viewport_right) / 2) - ((visible_left + visible_right) / 2)
-            adjusted_pos_x += center_adjust_x
-        
-        if visible_height_scene > V_h:
-            # Vertical clamping
-            if visible_top > viewport_top:
-                # Top edge is inside viewport (too far down)
-                adjust = visible_top - viewport_top
-                adjusted_pos_y -= adjust
-            elif visible_bottom < viewport_bottom:
-                # Bottom edge is inside viewport (too far up)
-                adjust = viewport_bottom - visible_bottom
-                adjusted_pos_y += adjust
-        else:
-            # Center vertically
-            center_adjust_y = ((viewport_top + viewport_bottom) / 2) - ((visible_top + visible_bottom) / 2)
-            adjusted_pos_y += center_adjust_y
-        
-        # Apply final position
-        new_pos_x = adjusted_pos_x
-        new_pos_y = adjusted_pos_y
-        
+    if config.pan_enabled:
+        new_pos_x, new_pos_y = compute_pan_position(
+            mouse_x_pct, mouse_y_pct, S_w_native, S_h_native,
+            crop_left, crop_top, crop_right, crop_bottom,
+            scale_x, scale_y, V_w, V_h,
+            actual_viewport_center_x, actual_viewport_center_y,
+            config.offset_x, config.offset_y
+        )
     
     else: # Panning not enabled
-        if src_settings["is_initial_state_captured"]:
-            new_pos_x = src_settings["initial_pos_x"]
-            new_pos_y = src_settings["initial_pos_y"]
+        if src_settings.is_initial_state_captured:
+            new_pos_x = src_settings.initial_pos_x
+            new_pos_y = src_settings.initial_pos_y
         else: 
             pass # new_pos_x/y are already 0.0
             
     # Verify the positions are valid numbers        
-    if (math.isnan(new_pos_x) or math.isnan(new_pos_y) or
-        math.isinf(new_pos_x) or math.isinf(new_pos_y) or
-        abs(new_pos_x) > 30000 or abs(new_pos_y) > 30000): # Increased limit from 10000 to 30000
+    if (not (_isfinite(new_pos_x) and _isfinite(new_pos_y)) or
+        _abs(new_pos_x) > 30000 or _abs(new_pos_y) > 30000): # Increased limit from 10000 to 30000
         log_error(f"Invalid position calculated: ({new_pos_x},{new_pos_y})")
         return  # Skip this update
     
+    src_settings.last_frame_inputs = frame_inputs
+    
     # Apply the position and scale - use direct OBS calls for all sources
     try:
-        if isinstance(scene_item, dict) and scene_item.get("is_direct_source"):
+        if type(scene_item) is DirectSourceItem:
             # For direct plugin sources, handle differently but efficiently
-            source = config.get("direct_source_cache")
+            source = config.direct_source_cache
             if source:
                 # For direct source manipulation, try multiple approaches to find what works
                 success = False
                 
                 # First try: Use the cached property names if available
-                x_prop = config["direct_property_names"]["x"]
-                y_prop = config["direct_property_names"]["y"]
+                property_names = config.direct_property_names
+                x_prop = property_names.x
+                y_prop = property_names.y
                 
                 if x_prop and y_prop:
                     try:
-                        settings_obj = obs.obs_source_get_settings(source)
-                        if settings_obj:
-                            # Set both properties in one go
-                            obs.obs_data_set_double(settings_obj, x_prop, new_pos_x)
-                            obs.obs_data_set_double(settings_obj, y_prop, new_pos_y)
-                            # We would need to add scale properties here for direct sources
-                            # This would require discovering additional property names
-                            obs.obs_source_update(source, settings_obj)
-                            obs.obs_data_release(settings_obj)
-                            success = True
+                        # Set both properties in one settings update
+                        # (scale would need additional discovered property names)
+                        success = write_direct_position(source, x_prop, y_prop, new_pos_x, new_pos_y)
                     except Exception as e:
                         log_error(f"Error using cached property names: {e}")
                 
@@ -4090,7 +3823,7 @@ def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
                         transform.pos.x = new_pos_x
                         transform.pos.y = new_pos_y
                         # Set scale if zooming is enabled
-                        if config["zoom_enabled"]:
+                        if zoom_enabled:
                             transform.scale.x = scale_x
                             transform.scale.y = scale_y
                         obs.obs_source_set_transform_info(source, transform)
@@ -4113,7 +3846,7 @@ def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
                             obs.obs_data_set_double(settings_obj, y_name, new_pos_y)
                         
                         # Try common property names for scale if zooming is enabled
-                        if config["zoom_enabled"]:
+                        if zoom_enabled:
                             for scale_x_name in ["scale_x", "scaleX", "width_scale"]:
                                 obs.obs_data_set_double(settings_obj, scale_x_name, scale_x)
                                 
@@ -4125,7 +3858,7 @@ def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
                         obs.obs_data_release(settings_obj)
                         
                         # Check if we should update our property names for next time
-                        if not config["direct_property_names"]["x"] or not config["direct_property_names"]["y"]:
+                        if not property_names.x or not property_names.y:
                             discover_direct_properties(source, config)
                     except Exception as e:
                         log_error(f"Error with fallback property setting: {e}")
@@ -4133,23 +3866,28 @@ def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
                 # Update the dictionary with new values
                 scene_item["pos_x"] = new_pos_x
                 scene_item["pos_y"] = new_pos_y
-                if config["zoom_enabled"] or src_settings["is_transitioning"]:
+                if zoom_enabled or is_transitioning:
                     scene_item["scale_x"] = scale_x
                     scene_item["scale_y"] = scale_y
         else:
             # For normal OBS scene items
-            # Set position if we've calculated a new position
-            current_pos = obs.vec2()
-            current_pos.x = new_pos_x
-            current_pos.y = new_pos_y
-            obs.obs_sceneitem_set_pos(scene_item, current_pos)
-            
-            # Set scale if zooming is enabled
-            if config["zoom_enabled"] or src_settings["is_transitioning"]:
-                current_scale = obs.vec2()
-                current_scale.x = scale_x
-                current_scale.y = scale_y
-                obs.obs_sceneitem_set_scale(scene_item, current_scale)
+            # Batch position and scale into a single deferred transform update
+            obs.obs_sceneitem_defer_update_begin(scene_item)
+            try:
+                # Set position if we've calculated a new position
+                current_pos = g_scratch_pos
+                current_pos.x = new_pos_x
+                current_pos.y = new_pos_y
+                obs.obs_sceneitem_set_pos(scene_item, current_pos)
+                
+                # Set scale if zooming is enabled
+                if zoom_enabled or is_transitioning:
+                    current_scale = g_scratch_scale
+                    current_scale.x = scale_x
+                    current_scale.y = scale_y
+                    obs.obs_sceneitem_set_scale(scene_item, current_scale)
+            finally:
+                obs.obs_sceneitem_defer_update_end(scene_item)
     except Exception as e:
         log_error(f"Error applying new position/scale: {e}")
     
@@ -4159,11 +3897,13 @@ def update_pan_and_zoom_for_config(config, src_settings, current_scene_item):
 def toggle_panning1(pressed):
     """Toggle panning on or off for config 1"""
     toggle_panning_for_config(pressed, config1, source_settings1, g_current_scene_item1, 1)
+    update_timer_rate()
 
 # Toggle panning on/off for config 2
 def toggle_panning2(pressed):
     """Toggle panning on or off for config 2"""
     toggle_panning_for_config(pressed, config2, source_settings2, g_current_scene_item2, 2)
+    update_timer_rate()
 
 # Toggle zooming on/off for config 1
 def toggle_zooming1(pressed):
@@ -4195,6 +3935,18 @@ def toggle_pause2(pressed):
     """Toggle pause on or off for config 2"""
     toggle_pause_for_config(pressed, config2, 2)
 
+# Frontend hotkeys as (settings key, OBS hotkey name, description, callback), in registration order
+HOTKEY_DEFINITIONS = (
+    ("toggle_pan_hotkey1", "mouse_pan_zoom_toggle_pan1", "Toggle ToxMox Pan Zoomer - Config 1 - Panning", toggle_panning1),
+    ("toggle_zoom_hotkey1", "mouse_pan_zoom_toggle_zoom1", "Toggle ToxMox Pan Zoomer - Config 1 - Zooming", toggle_zooming1),
+    ("toggle_deadzone_hotkey1", "mouse_pan_zoom_toggle_deadzone1", "Toggle ToxMox Pan Zoomer - Config 1 - Deadzone", toggle_deadzone1),
+    ("toggle_pause_hotkey1", "mouse_pan_zoom_toggle_pause1", "Toggle ToxMox Pan Zoomer - Config 1 - Pause", toggle_pause1),
+    ("toggle_pan_hotkey2", "mouse_pan_zoom_toggle_pan2", "Toggle ToxMox Pan Zoomer - Config 2 - Panning", toggle_panning2),
+    ("toggle_zoom_hotkey2", "mouse_pan_zoom_toggle_zoom2", "Toggle ToxMox Pan Zoomer - Config 2 - Zooming", toggle_zooming2),
+    ("toggle_deadzone_hotkey2", "mouse_pan_zoom_toggle_deadzone2", "Toggle ToxMox Pan Zoomer - Config 2 - Deadzone", toggle_deadzone2),
+    ("toggle_pause_hotkey2", "mouse_pan_zoom_toggle_pause2", "Toggle ToxMox Pan Zoomer - Config 2 - Pause", toggle_pause2),
+)
+
 # Generic toggle_deadzone function that works with any config
 def toggle_deadzone_for_config(pressed, config, config_num):
     """Toggle deadzone on or off for a specific config"""
@@ -4203,12 +3955,12 @@ def toggle_deadzone_for_config(pressed, config, config_num):
         return
     
     # Check if this config is enabled
-    if not config.get("enabled", False):
+    if not config.enabled:
         log(f"Config {config_num}: Cannot toggle deadzone: Config is disabled")
         return
     
     # Check if panning is enabled (required for deadzone)
-    if not config.get("pan_enabled", False):
+    if not config.pan_enabled:
         log(f"Config {config_num}: Cannot toggle deadzone: Panning must be enabled first")
         return
     
@@ -4216,25 +3968,25 @@ def toggle_deadzone_for_config(pressed, config, config_num):
     src_settings = source_settings1 if config_num == 1 else source_settings2
     
     # Toggle deadzone state
-    was_enabled = config.get("deadzone_enabled", False)
-    config["deadzone_enabled"] = not was_enabled
+    was_enabled = config.deadzone_enabled
+    config.deadzone_enabled = not was_enabled
     
-    if config["deadzone_enabled"]:
+    if config.deadzone_enabled:
         # When enabling deadzone, initialize the deadzone center to the current mouse position
         # Get the current mouse position
-        mouse_data = get_adjusted_mouse_pos(config)
-        if mouse_data["is_inside_monitor"]:
-            src_settings["deadzone_center_x"] = mouse_data["x_pct"]
-            src_settings["deadzone_center_y"] = mouse_data["y_pct"]
+        mouse_x_pct, mouse_y_pct, is_inside_monitor = get_adjusted_mouse_pos(config)
+        if is_inside_monitor:
+            src_settings.deadzone_center_x = mouse_x_pct
+            src_settings.deadzone_center_y = mouse_y_pct
         else:
             # If mouse is outside monitor, use center
-            src_settings["deadzone_center_x"] = 0.5
-            src_settings["deadzone_center_y"] = 0.5
+            src_settings.deadzone_center_x = 0.5
+            src_settings.deadzone_center_y = 0.5
             
-        log(f"Config {config_num}: Deadzone ENABLED (H: {config['deadzone_h_pct']}%, V: {config['deadzone_v_pct']}%)")
+        log(f"Config {config_num}: Deadzone ENABLED (H: {config.deadzone_h_pct}%, V: {config.deadzone_v_pct}%)")
         log(f"Config {config_num}: Mouse pushes the deadzone rectangle to pan the source")
     else:
-        log(f"Config {config_num}: Deadzone DISABLED - Source will smoothly transition to mouse position over {config.get('deadzone_off_transition_duration', 0.3)}s")
+        log(f"Config {config_num}: Deadzone DISABLED - Source will smoothly transition to mouse position over {config.deadzone_off_transition_duration}s")
         
         # Get the current scene item
         current_scene_item = g_current_scene_item1 if config_num == 1 else g_current_scene_item2
@@ -4242,27 +3994,27 @@ def toggle_deadzone_for_config(pressed, config, config_num):
         # When disabling deadzone, start a transition to smoothly return to the mouse position
         if current_scene_item:
             # Get the current mouse position
-            mouse_data = get_adjusted_mouse_pos(config)
-            if mouse_data["is_inside_monitor"]:
+            mouse_x_pct, mouse_y_pct, is_inside_monitor = get_adjusted_mouse_pos(config)
+            if is_inside_monitor:
                 # Store the current deadzone center as the start position
-                src_settings["transition_start_x"] = src_settings.get("deadzone_center_x", 0.5)
-                src_settings["transition_start_y"] = src_settings.get("deadzone_center_y", 0.5)
+                src_settings.transition_start_x = src_settings.deadzone_center_x
+                src_settings.transition_start_y = src_settings.deadzone_center_y
                 
                 # Store the current mouse position as the target position
-                src_settings["transition_target_x"] = mouse_data["x_pct"]
-                src_settings["transition_target_y"] = mouse_data["y_pct"]
+                src_settings.transition_target_x = mouse_x_pct
+                src_settings.transition_target_y = mouse_y_pct
                 
                 # Set up a transition similar to zoom transitions
-                src_settings["is_transitioning"] = True
-                src_settings["transition_start_time"] = time.time()
-                src_settings["transition_duration"] = config.get("deadzone_off_transition_duration", 0.3)
-                src_settings["transition_type"] = "deadzone_off"
+                src_settings.is_transitioning = True
+                src_settings.transition_start_time = time.monotonic()
+                src_settings.transition_duration = config.deadzone_off_transition_duration
+                src_settings.transition_type = "deadzone_off"
                 
-                log(f"Config {config_num}: Starting transition from ({src_settings['transition_start_x']:.3f}, {src_settings['transition_start_y']:.3f}) to ({src_settings['transition_target_x']:.3f}, {src_settings['transition_target_y']:.3f})")
+                log(f"Config {config_num}: Starting transition from ({src_settings.transition_start_x:.3f}, {src_settings.transition_start_y:.3f}) to ({src_settings.transition_target_x:.3f}, {src_settings.transition_target_y:.3f})")
             else:
                 # If mouse is outside monitor, just disable deadzone without transition
                 log(f"Config {config_num}: Mouse outside monitor, disabling deadzone without transition")
-                src_settings["is_transitioning"] = False
+                src_settings.is_transitioning = False
 
 # Generic toggle_pause function that works with any config
 def toggle_pause_for_config(pressed, config, config_num):
@@ -4272,12 +4024,12 @@ def toggle_pause_for_config(pressed, config, config_num):
         return
     
     # Check if this config is enabled
-    if not config.get("enabled", False):
+    if not config.enabled:
         log(f"Config {config_num}: Cannot toggle pause: Config is disabled")
         return
     
     # Check if panning is enabled (required for pause)
-    if not config.get("pan_enabled", False):
+    if not config.pan_enabled:
         log(f"Config {config_num}: Cannot toggle pause: Panning must be enabled first")
         return
     
@@ -4286,16 +4038,19 @@ def toggle_pause_for_config(pressed, config, config_num):
     src_settings = source_settings1 if config_num == 1 else source_settings2
     
     # Toggle pause state
-    was_paused = config.get("pause_enabled", False)
-    config["pause_enabled"] = not was_paused
+    was_paused = config.pause_enabled
+    config.pause_enabled = not was_paused
     
-    if config["pause_enabled"]:
+    if config.pause_enabled:
         log(f"Config {config_num}: Pause ENABLED - Panning and zooming temporarily frozen")
     else:
         log(f"Config {config_num}: Pause DISABLED - Source will immediately follow mouse position")
         
         # Simply disable pause without any transition
-        config["pause_enabled"] = False
+        config.pause_enabled = False
+
+# Last misalignment reported per config as (source name, alignment), so repeated checks don't re-log it
+g_reported_misalignment = {}
 
 # Helper function to check viewport alignment (Top Left)
 def check_viewport_alignment(viewport_scene_item, source_name, config_num):
@@ -4307,15 +4062,13 @@ def check_viewport_alignment(viewport_scene_item, source_name, config_num):
         # Get alignment of the viewport scene item
         alignment = obs.obs_sceneitem_get_alignment(viewport_scene_item)
         
-        # Define alignment constants
-        OBS_ALIGN_LEFT = 0x0001
-        OBS_ALIGN_TOP = 0x0004
-        expected_alignment = OBS_ALIGN_LEFT | OBS_ALIGN_TOP  # Top Left = 0x0005
-        
         # Check if alignment matches expected Top Left (0x0005)
-        is_correct = (alignment == expected_alignment)
+        is_correct = (alignment == ALIGN_TOP_LEFT)
         
-        if not is_correct:
+        if is_correct:
+            g_reported_misalignment.pop(config_num, None)
+        elif g_reported_misalignment.get(config_num) != (source_name, alignment):
+            g_reported_misalignment[config_num] = (source_name, alignment)
             # Display a prominent warning message
             log_error(f"▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓")
             log_error(f"▓ VIEWPORT ALIGNMENT ERROR - Config {config_num}")
@@ -4330,6 +4083,41 @@ def check_viewport_alignment(viewport_scene_item, source_name, config_num):
         log_error(f"Error checking viewport alignment: {e}")
         return False
 
+# Capture a source's base size and initial position/scale when panning is enabled
+def capture_initial_transform(scene_item, source, src_settings, config_num):
+    """Store the source's base size and initial transform"""
+    # Always re-read: the user may have moved, rescaled or resized the source since the last enable
+    src_settings.source_base_width = obs.obs_source_get_width(source)
+    src_settings.source_base_height = obs.obs_source_get_height(source)
+    pos_x, pos_y, scale_x, scale_y = get_item_transform(scene_item)
+    
+    if pos_x is not None and scale_x is not None:
+        src_settings.initial_pos_x = pos_x
+        src_settings.initial_pos_y = pos_y
+        src_settings.initial_scale_x = scale_x
+        src_settings.initial_scale_y = scale_y
+        src_settings.is_initial_state_captured = True
+        log("Config %d: Initial state captured: Pos=(%.1f,%.1f), Scale=(%.2f,%.2f)", config_num, pos_x, pos_y, scale_x, scale_y)
+    else:
+        src_settings.initial_pos_x = 0
+        src_settings.initial_pos_y = 0
+        src_settings.initial_scale_x = 1.0
+        src_settings.initial_scale_y = 1.0
+        src_settings.is_initial_state_captured = True
+        log_warning(f"Config {config_num}: Could not get initial transform values. Using defaults.")
+
+# Capture a scene item's crop when panning is enabled
+def capture_initial_crop(scene_item, src_settings, config_num):
+    """Store the scene item's crop"""
+    # Always re-read: the crop may have been changed since the last enable
+    crop = g_scratch_crop
+    obs.obs_sceneitem_get_crop(scene_item, crop)
+    src_settings.crop_left = crop.left
+    src_settings.crop_top = crop.top
+    src_settings.crop_right = crop.right
+    src_settings.crop_bottom = crop.bottom
+    log("Config %d: Captured crop: L%s T%s R%s B%s", config_num, crop.left, crop.top, crop.right, crop.bottom)
+
 # Generic toggle_panning function that works with any config
 def toggle_panning_for_config(pressed, config, src_settings, current_scene_item, config_num):
     """Toggle panning on or off for a specific config"""
@@ -4348,124 +4136,104 @@ def toggle_panning_for_config(pressed, config, src_settings, current_scene_item,
     # This ensures we're always using the latest values
     
     # Check if this config is enabled
-    config_enabled = obs.obs_data_get_bool(script_settings, f"config{config_num}_enabled")
-    config["enabled"] = config_enabled  # Update in-memory config
+    keys = CONFIG_SETTING_KEYS[config_num]
+    config_enabled = obs.obs_data_get_bool(script_settings, keys["enabled"])
+    config.enabled = config_enabled  # Update in-memory config
     
     if not config_enabled:
         log(f"Cannot toggle: Config {config_num} is disabled")
         return
         
     # Refresh scene, source and viewport settings
-    scene_value = obs.obs_data_get_string(script_settings, f"config{config_num}_target_scene")
-    source_value = obs.obs_data_get_string(script_settings, f"config{config_num}_source_name")
-    viewport_value = obs.obs_data_get_string(script_settings, f"config{config_num}_viewport_color_source_name")
+    scene_value = obs.obs_data_get_string(script_settings, keys["target_scene"])
+    source_value = obs.obs_data_get_string(script_settings, keys["source_name"])
+    viewport_value = obs.obs_data_get_string(script_settings, keys["viewport_color_source_name"])
     
     # Update scene info
-    if ":" in scene_value:
-        scene_name, scene_uuid = scene_value.split(":", 1)
-        config["target_scene_name"] = scene_name
-        config["target_scene_uuid"] = scene_uuid
-    else:
-        config["target_scene_name"] = scene_value
-        config["target_scene_uuid"] = ""
+    config.target_scene_name, config.target_scene_uuid = split_composite_value(scene_value)
         
     # Update source info
-    if ":" in source_value:
-        source_name, source_uuid = source_value.split(":", 1)
-        config["source_name"] = source_name
-        config["source_uuid"] = source_uuid
-    else:
-        config["source_name"] = source_value
-        config["source_uuid"] = ""
+    config.source_name, config.source_uuid = split_composite_value(source_value)
         
     # Update viewport info
     if is_use_scene_dimensions(viewport_value):
-        config["viewport_color_source_name"] = USE_SCENE_DIMENSIONS
-        config["viewport_color_source_uuid"] = ""
-    elif ":" in viewport_value:
-        viewport_name, viewport_uuid = viewport_value.split(":", 1)
-        config["viewport_color_source_name"] = viewport_name
-        config["viewport_color_source_uuid"] = viewport_uuid
+        config.viewport_color_source_name = USE_SCENE_DIMENSIONS
+        config.viewport_color_source_uuid = ""
     else:
-        config["viewport_color_source_name"] = viewport_value
-        config["viewport_color_source_uuid"] = ""
+        config.viewport_color_source_name, config.viewport_color_source_uuid = split_composite_value(viewport_value)
         
     # Update zoom settings
-    zoom_level = obs.obs_data_get_double(script_settings, f"config{config_num}_zoom_level")
-    config["zoom_level"] = max(1.0, min(5.0, zoom_level))
+    zoom_level = obs.obs_data_get_double(script_settings, keys["zoom_level"])
+    config.zoom_level = max(1.0, min(5.0, zoom_level))
     
     # Update transition durations
-    zoom_in_duration = obs.obs_data_get_double(script_settings, f"config{config_num}_zoom_in_duration")
-    config["zoom_in_duration"] = max(0.0, min(1.0, zoom_in_duration))
+    zoom_in_duration = obs.obs_data_get_double(script_settings, keys["zoom_in_duration"])
+    config.zoom_in_duration = max(0.0, min(1.0, zoom_in_duration))
     
-    zoom_out_duration = obs.obs_data_get_double(script_settings, f"config{config_num}_zoom_out_duration")
-    config["zoom_out_duration"] = max(0.0, min(1.0, zoom_out_duration))
+    zoom_out_duration = obs.obs_data_get_double(script_settings, keys["zoom_out_duration"])
+    config.zoom_out_duration = max(0.0, min(1.0, zoom_out_duration))
     
     # Update offset values
-    config["offset_x"] = obs.obs_data_get_int(script_settings, f"config{config_num}_offset_x")
-    config["offset_y"] = obs.obs_data_get_int(script_settings, f"config{config_num}_offset_y")
+    config.offset_x = obs.obs_data_get_int(script_settings, keys["offset_x"])
+    config.offset_y = obs.obs_data_get_int(script_settings, keys["offset_y"])
     
     # Monitor settings
-    monitor_id_string = obs.obs_data_get_string(script_settings, f"config{config_num}_monitor_id_string")
-    if monitor_id_string:
-        try:
-            monitor_id = int(monitor_id_string.split(":")[0])
-            config["monitor_id"] = monitor_id
-        except Exception:
-            # Keep current value if parsing fails
-            pass
+    # Keep the current value if the string is missing or invalid
+    monitor_id_string = obs.obs_data_get_string(script_settings, keys["monitor_id_string"])
+    config.monitor_id = parse_monitor_id(monitor_id_string, config.monitor_id)
     
     # === ADD DETAILED LOGGING FOR CONFIG 2 ===
     if config_num == 2:
-        log(f"[CONFIG 2 HOTKEY DEBUG] Refreshed settings for Config 2:")
-        log(f"    Target Scene: '{config.get('target_scene_name', 'Not Set')}' (UUID: '{config.get('target_scene_uuid', 'Not Set')}')")
-        log(f"    Target Source: '{config.get('source_name', 'Not Set')}' (UUID: '{config.get('source_uuid', 'Not Set')}')")
-        log(f"    Viewport Source: '{config.get('viewport_color_source_name', 'Not Set')}' (UUID: '{config.get('viewport_color_source_uuid', 'Not Set')}')")
-        log(f"    Zoom Level: {config.get('zoom_level', 'Not Set')}")
-        log(f"    Monitor ID: {config.get('monitor_id', 'Not Set')}")
+        log("[CONFIG 2 HOTKEY DEBUG] Refreshed settings for Config 2:")
+        log("    Target Scene: '%s' (UUID: '%s')", config.target_scene_name, config.target_scene_uuid)
+        log("    Target Source: '%s' (UUID: '%s')", config.source_name, config.source_uuid)
+        log("    Viewport Source: '%s' (UUID: '%s')", config.viewport_color_source_name, config.viewport_color_source_uuid)
+        log("    Zoom Level: %s", config.zoom_level)
+        log("    Monitor ID: %s", config.monitor_id)
     # === END DETAILED LOGGING ===
 
     # Toggle state
-    config["pan_enabled"] = not config["pan_enabled"]
+    config.pan_enabled = not config.pan_enabled
     
-    if config["pan_enabled"]:
+    if config.pan_enabled:
         # Always clear cached values first to ensure fresh capture
-        src_settings["viewport_width"] = 0
-        src_settings["viewport_height"] = 0
-        src_settings["viewport_scene_center_x"] = 0
-        src_settings["viewport_scene_center_y"] = 0
-        src_settings["is_initial_state_captured"] = False
-        src_settings["crop_left"] = 0 # Reset crop
-        src_settings["crop_top"] = 0
-        src_settings["crop_right"] = 0
-        src_settings["crop_bottom"] = 0
+        src_settings.viewport_width = 0
+        src_settings.viewport_height = 0
+        src_settings.viewport_scene_center_x = 0
+        src_settings.viewport_scene_center_y = 0
+        src_settings.is_initial_state_captured = False
+        src_settings.crop_left = 0 # Reset crop
+        src_settings.crop_top = 0
+        src_settings.crop_right = 0
+        src_settings.crop_bottom = 0
+        src_settings.last_frame_inputs = None # Force the first frame to be applied
         
         # Enable panning - verify we have required sources first
-        target_source_name = config["source_name"]
-        target_source_uuid = config["source_uuid"]
-        viewport_source_name = config["viewport_color_source_name"]
-        viewport_source_uuid = config["viewport_color_source_uuid"]
+        target_source_name = config.source_name
+        target_source_uuid = config.source_uuid
+        viewport_source_name = config.viewport_color_source_name
+        viewport_source_uuid = config.viewport_color_source_uuid
         
         # First check: should we be using scene dimensions?
         is_using_scene_dims = is_use_scene_dimensions(viewport_source_name)
         
         # Second check: empty viewport but we have a scene - use scene dimensions as fallback
-        if not viewport_source_name and config["target_scene_name"]:
+        if not viewport_source_name and config.target_scene_name:
             log_warning(f"Config {config_num}: No viewport source selected, but scene exists - using scene dimensions as fallback")
             is_using_scene_dims = True
             # Update settings to reflect this change
-            config["viewport_color_source_name"] = USE_SCENE_DIMENSIONS
+            config.viewport_color_source_name = USE_SCENE_DIMENSIONS
             
         # Basic Checks
         if not target_source_name:
             log_error(f"Config {config_num}: Cannot enable panning: No Target Source selected.")
-            config["pan_enabled"] = False
+            config.pan_enabled = False
             return
         
         # Check for viewport source - empty is valid if we're using scene dimensions
         if not viewport_source_name and not is_using_scene_dims:
             log_error(f"Config {config_num}: Cannot enable panning: No Viewport Source selected. viewport_source_name='{viewport_source_name}', is_using_scene_dims={is_using_scene_dims}")
-            config["pan_enabled"] = False
+            config.pan_enabled = False
             return
             
         # Special handling for "Use Scene Dimensions" option
@@ -4473,133 +4241,49 @@ def toggle_panning_for_config(pressed, config, src_settings, current_scene_item,
             log(f"Config {config_num}: Using scene dimensions for viewport")
             
             # Get target scene
-            scene_source = None
-            if config["target_scene_uuid"]:
-                scene_source = find_source_by_uuid(config["target_scene_uuid"])
-            
-            if not scene_source:
-                scene_source = obs.obs_get_source_by_name(config["target_scene_name"])
+            scene_source = get_scene_source(config.target_scene_name, config.target_scene_uuid)
             
             if not scene_source:
-                log_error(f"Config {config_num}: Cannot enable panning: Target Scene '{config['target_scene_name']}' not found.")
-                config["pan_enabled"] = False
+                log_error(f"Config {config_num}: Cannot enable panning: Target Scene '{config.target_scene_name}' not found.")
+                config.pan_enabled = False
                 return
                 
             # Get scene dimensions
-            scene_width, scene_height = get_scene_dimensions(scene_source)
+            with obs_source_ref(scene_source):
+                scene_width, scene_height = get_scene_dimensions(scene_source)
             
             if scene_width <= 0 or scene_height <= 0:
                 log_error(f"Config {config_num}: Cannot enable panning: Could not determine scene dimensions.")
-                obs.obs_source_release(scene_source)
-                config["pan_enabled"] = False
+                config.pan_enabled = False
                 return
                 
             # Get scene center position (0, 0) is top-left
             scene_center_x = scene_width / 2
             scene_center_y = scene_height / 2
             
-            log(f"Config {config_num} using scene dimensions: {scene_width}x{scene_height}, Center: ({scene_center_x},{scene_center_y})")
+            log("Config %d using scene dimensions: %sx%s, Center: (%s,%s)", config_num, scene_width, scene_height, scene_center_x, scene_center_y)
             
             # Store viewport dimensions
-            src_settings["viewport_width"] = scene_width
-            src_settings["viewport_height"] = scene_height
-            src_settings["viewport_scene_center_x"] = scene_center_x
-            src_settings["viewport_scene_center_y"] = scene_center_y
-            
-            # Release scene source
-            obs.obs_source_release(scene_source)
+            src_settings.viewport_width = scene_width
+            src_settings.viewport_height = scene_height
+            src_settings.viewport_scene_center_x = scene_center_x
+            src_settings.viewport_scene_center_y = scene_center_y
         else:
             # Regular viewport source handling
             log(f"Config {config_num}: Capturing viewport dimensions for: {viewport_source_name}")
             
             # Find the viewport source in any scene to get its bounds
-            viewport_scene_item = None
-            viewport_found_in_scene = False
-            
-            # Try to find viewport source by UUID first if available
-            if viewport_source_uuid:
-                viewport_source = find_source_by_uuid(viewport_source_uuid)
-                if viewport_source:
-                    log(f"Config {config_num}: Found viewport source '{viewport_source_name}' by UUID")
-                    
-                    # Now look for this source's scene item in the target scene
-                    if config["target_scene_name"]:
-                        scene_source = None
-                        if config["target_scene_uuid"]:
-                            scene_source = find_source_by_uuid(config["target_scene_uuid"])
-                        if not scene_source:
-                            scene_source = obs.obs_get_source_by_name(config["target_scene_name"])
-                            
-                        if scene_source:
-                            scene = obs.obs_scene_from_source(scene_source)
-                            if scene:
-                                # Enumerate items to find the one with matching source
-                                items = obs.obs_scene_enum_items(scene)
-                                if items:
-                                    for item in items:
-                                        if not item:
-                                            continue
-                                            
-                                        item_source = obs.obs_sceneitem_get_source(item)
-                                        if not item_source:
-                                            continue
-                                            
-                                        item_uuid = get_source_uuid(item_source)
-                                        if item_uuid == viewport_source_uuid:
-                                            viewport_scene_item = item
-                                            viewport_found_in_scene = True
-                                            # Don't release this specific item
-                                            items[items.index(item)] = None
-                                            break
-                                            
-                                    obs.sceneitem_list_release(items)
-                            
-                            obs.obs_source_release(scene_source)
-                    
-                    obs.obs_source_release(viewport_source)
-            
-            # If not found by UUID, try traditional methods
-            if not viewport_found_in_scene:
-                # Check current scene first
-                current_scene = obs.obs_frontend_get_current_scene()
-                if current_scene:
-                    scene_obj = obs.obs_scene_from_source(current_scene)
-                    if scene_obj:
-                        viewport_scene_item = find_scene_item(current_scene, viewport_source_name)
-                        if viewport_scene_item:
-                            viewport_found_in_scene = True
-                    obs.obs_source_release(current_scene)
-                
-                # If not found in current scene, search target scene
-                if not viewport_found_in_scene and config["target_scene_name"]:
-                    scene_source = obs.obs_get_source_by_name(config["target_scene_name"])
-                    if scene_source:
-                        scene_obj = obs.obs_scene_from_source(scene_source)
-                        if scene_obj:
-                            viewport_scene_item = find_scene_item(scene_source, viewport_source_name)
-                            if viewport_scene_item:
-                                viewport_found_in_scene = True
-                        obs.obs_source_release(scene_source)
-                
-                # If still not found, search all scenes
-                if not viewport_found_in_scene:
-                    scenes = obs.obs_frontend_get_scenes()
-                    if scenes:
-                        for scene in scenes:
-                            scene_name = obs.obs_source_get_name(scene)
-                            viewport_scene_item = find_scene_item(scene, viewport_source_name)
-                            if viewport_scene_item:
-                                viewport_found_in_scene = True
-                                break
-                        obs.source_list_release(scenes)
+            viewport_scene_item = find_viewport_scene_item(
+                viewport_source_name, viewport_source_uuid,
+                config.target_scene_name, config.target_scene_uuid, f"Config {config_num}: ")
             
             # If found in a scene, get its bounds
-            if viewport_found_in_scene and viewport_scene_item:
+            if viewport_scene_item:
                 # Check the viewport alignment and store the result in the config
-                config["viewport_alignment_correct"] = check_viewport_alignment(viewport_scene_item, viewport_source_name, config_num)
+                config.viewport_alignment_correct = check_viewport_alignment(viewport_scene_item, viewport_source_name, config_num)
                 
                 # Get position
-                pos = obs.vec2()
+                pos = g_scratch_pos
                 obs.obs_sceneitem_get_pos(viewport_scene_item, pos)
                 
                 # Get the source info for base dimensions
@@ -4608,7 +4292,7 @@ def toggle_panning_for_config(pressed, config, src_settings, current_scene_item,
                 vp_base_height = obs.obs_source_get_height(viewport_source)
                 
                 # Get scale to calculate bounds
-                scale = obs.vec2()
+                scale = g_scratch_scale
                 obs.obs_sceneitem_get_scale(viewport_scene_item, scale)
                 
                 # Calculate actual viewport dimensions based on bounds
@@ -4625,31 +4309,30 @@ def toggle_panning_for_config(pressed, config, src_settings, current_scene_item,
                     # If the item has rotation or special alignment, use bounding box
                     # This ensures we get the true visible dimensions on screen
                     if rot != 0.0 or alignment != 0:
-                        # Create a bounding box struct
-                        bounds_type = obs.OBS_BOUNDS_STRETCH  # Default bounds type
-                        bounds = obs.vec2()
+                        # Reuse the scratch bounding box struct
+                        bounds = g_scratch_bounds
                         
                         # Get current bounds
                         obs.obs_sceneitem_get_bounds(viewport_scene_item, bounds)
                         bounds_type = obs.obs_sceneitem_get_bounds_type(viewport_scene_item)
                         
-                        if bounds_type != obs.OBS_BOUNDS_NONE:
+                        if bounds_type != BOUNDS_NONE:
                             viewport_width = bounds.x
                             viewport_height = bounds.y
-                            log(f"Config {config_num}: Using bounds values: {viewport_width}x{viewport_height}")
+                            log("Config %d: Using bounds values: %sx%s", config_num, viewport_width, viewport_height)
                 except Exception as e:
                     log_warning(f"Config {config_num}: Could not get precise bounds, using scaled dimensions: {e}")
                 
                 # Calculate viewport's center in the scene
-                src_settings["viewport_scene_center_x"] = pos.x + (viewport_width / 2.0)
-                src_settings["viewport_scene_center_y"] = pos.y + (viewport_height / 2.0)
+                src_settings.viewport_scene_center_x = pos.x + (viewport_width / 2.0)
+                src_settings.viewport_scene_center_y = pos.y + (viewport_height / 2.0)
                 
-                log(f"Config {config_num}: Found viewport source in scene with bounds: {viewport_width:.0f}x{viewport_height:.0f}, Pos: ({pos.x:.1f},{pos.y:.1f})")
-                log(f"Config {config_num}: Viewport scene center calculated: ({src_settings['viewport_scene_center_x']:.1f},{src_settings['viewport_scene_center_y']:.1f})")
+                log("Config %d: Found viewport source in scene with bounds: %.0fx%.0f, Pos: (%.1f,%.1f)", config_num, viewport_width, viewport_height, pos.x, pos.y)
+                log("Config %d: Viewport scene center calculated: (%.1f,%.1f)", config_num, src_settings.viewport_scene_center_x, src_settings.viewport_scene_center_y)
                 
                 # Store viewport dimensions
-                src_settings["viewport_width"] = viewport_width
-                src_settings["viewport_height"] = viewport_height
+                src_settings.viewport_width = viewport_width
+                src_settings.viewport_height = viewport_height
                 
                 # Release the viewport scene item
                 if viewport_scene_item:
@@ -4660,134 +4343,65 @@ def toggle_panning_for_config(pressed, config, src_settings, current_scene_item,
             else:
                 log_error(f"Config {config_num}: Viewport source '{viewport_source_name}' not found as an item in any scene. Panning cannot be enabled.")
                 log_error(f"Config {config_num}: Please add the viewport source to a scene and ensure it's spelled correctly.")
-                config["pan_enabled"] = False # Crucial: Prevent enabling panning
+                config.pan_enabled = False # Crucial: Prevent enabling panning
                 return
         
         # Now find and store the source item
         scene_item = get_source_scene_item(target_source_name, target_source_uuid, config)
         if not scene_item:
             log_error(f"Config {config_num}: Cannot enable panning: Target Source '{target_source_name}' not found in any scene.")
-            config["pan_enabled"] = False
+            config.pan_enabled = False
             return
         
         # IMPORTANT: Check and set alignment to CENTER
-        if isinstance(scene_item, dict) and scene_item.get("is_direct_source"):
+        if type(scene_item) is DirectSourceItem:
             # For direct sources, we may not be able to set alignment
             log_warning(f"Config {config_num}: Direct source mode does not support changing alignment. Please set Center alignment manually.")
         else:
             # For standard scene items, check and set alignment
             current_alignment = obs.obs_sceneitem_get_alignment(scene_item)
             
-            # Define OBS alignment constants
-            OBS_ALIGN_CENTER = 0  # This appears to be incorrect in our implementation
-            
-            # Try to get the constants from the obs module if available
-            try:
-                # These constants may be directly available in the obs module
-                if hasattr(obs, "OBS_ALIGN_CENTER"):
-                    OBS_ALIGN_CENTER = obs.OBS_ALIGN_CENTER
-                else:
-                    # If not directly available, these are the typical values
-                    # OBS_ALIGN_LEFT = 0x0001
-                    # OBS_ALIGN_RIGHT = 0x0002
-                    # OBS_ALIGN_TOP = 0x0004
-                    # OBS_ALIGN_BOTTOM = 0x0008
-                    # OBS_ALIGN_CENTER = 0x0010
-                    OBS_ALIGN_CENTER = 0x0010
-                log(f"Config {config_num}: Using OBS_ALIGN_CENTER value: {OBS_ALIGN_CENTER}")
-            except Exception as e:
-                log_error(f"Config {config_num}: Error getting alignment constants: {e}, using default value 0x0010")
-                OBS_ALIGN_CENTER = 0x0010  # Center alignment value
-            
             # Check if alignment needs to be changed to CENTER
-            if current_alignment != OBS_ALIGN_CENTER:
-                log(f"Config {config_num}: Setting alignment to CENTER (was {current_alignment}, using value {OBS_ALIGN_CENTER})")
-                obs.obs_sceneitem_set_alignment(scene_item, OBS_ALIGN_CENTER)
+            if current_alignment != ALIGN_CENTER:
+                log("Config %d: Setting alignment to CENTER (was %s)", config_num, current_alignment)
+                obs.obs_sceneitem_set_alignment(scene_item, ALIGN_CENTER)
         
         # IMPORTANT: Make a copy of the scene item properties instead of storing a reference
         # This avoids keeping references to OBS objects that might cause crashes on exit
-        if isinstance(scene_item, dict) and scene_item.get("is_direct_source"):
+        if type(scene_item) is DirectSourceItem:
             # For direct sources, store a copy of the properties
-            source = scene_item.get("source")
+            source = scene_item.source
             if source:
-                source_width = obs.obs_source_get_width(source)
-                source_height = obs.obs_source_get_height(source)
-                
-                # Store source dimensions
-                src_settings["source_base_width"] = source_width
-                src_settings["source_base_height"] = source_height
-                
-                # Get current position and scale
-                pos_x, pos_y, scale_x, scale_y = get_item_transform(scene_item)
-                if pos_x is not None and scale_x is not None:
-                    src_settings["initial_pos_x"] = pos_x
-                    src_settings["initial_pos_y"] = pos_y
-                    src_settings["initial_scale_x"] = scale_x
-                    src_settings["initial_scale_y"] = scale_y
-                    src_settings["is_initial_state_captured"] = True
-                    log(f"Config {config_num}: Initial state captured: Pos=({pos_x:.1f},{pos_y:.1f}), Scale=({scale_x:.2f},{scale_y:.2f})")
-                else:
-                    src_settings["initial_pos_x"] = 0
-                    src_settings["initial_pos_y"] = 0
-                    src_settings["initial_scale_x"] = 1.0
-                    src_settings["initial_scale_y"] = 1.0
-                    src_settings["is_initial_state_captured"] = True
-                    log_warning(f"Config {config_num}: Could not get initial transform values. Using defaults.")
+                # Store source dimensions and the current position and scale
+                capture_initial_transform(scene_item, source, src_settings, config_num)
                 
                 # For direct sources, crop is not applicable, so crop values remain 0
                 log(f"Config {config_num}: Direct source mode, crop values will be 0.")
             else:
-                src_settings["source_base_width"] = 1920  # Fallback
-                src_settings["source_base_height"] = 1080  # Fallback
-                src_settings["initial_pos_x"] = 0
-                src_settings["initial_pos_y"] = 0
-                src_settings["initial_scale_x"] = 1.0
-                src_settings["initial_scale_y"] = 1.0
-                src_settings["is_initial_state_captured"] = True
+                src_settings.source_base_width = 1920  # Fallback
+                src_settings.source_base_height = 1080  # Fallback
+                src_settings.initial_pos_x = 0
+                src_settings.initial_pos_y = 0
+                src_settings.initial_scale_x = 1.0
+                src_settings.initial_scale_y = 1.0
+                src_settings.is_initial_state_captured = True
         else:
             # For standard scene items
             source = obs.obs_sceneitem_get_source(scene_item)
             if source:
-                source_width = obs.obs_source_get_width(source)
-                source_height = obs.obs_source_get_height(source)
-                
-                # Store source dimensions
-                src_settings["source_base_width"] = source_width
-                src_settings["source_base_height"] = source_height
-                
-                # Get current position and scale
-                pos_x, pos_y, scale_x, scale_y = get_item_transform(scene_item)
-                if pos_x is not None and scale_x is not None:
-                    src_settings["initial_pos_x"] = pos_x
-                    src_settings["initial_pos_y"] = pos_y
-                    src_settings["initial_scale_x"] = scale_x
-                    src_settings["initial_scale_y"] = scale_y
-                    src_settings["is_initial_state_captured"] = True
-                    log(f"Config {config_num}: Initial state captured: Pos=({pos_x:.1f},{pos_y:.1f}), Scale=({scale_x:.2f},{scale_y:.2f})")
-                else:
-                    src_settings["initial_pos_x"] = 0
-                    src_settings["initial_pos_y"] = 0
-                    src_settings["initial_scale_x"] = 1.0
-                    src_settings["initial_scale_y"] = 1.0
-                    src_settings["is_initial_state_captured"] = True
-                    log_warning(f"Config {config_num}: Could not get initial transform values. Using defaults.")
+                # Store source dimensions and the current position and scale
+                capture_initial_transform(scene_item, source, src_settings, config_num)
                 
                 # Get crop values if it's a standard scene item
-                crop = obs.obs_sceneitem_crop()
-                obs.obs_sceneitem_get_crop(scene_item, crop)
-                src_settings["crop_left"] = crop.left
-                src_settings["crop_top"] = crop.top
-                src_settings["crop_right"] = crop.right
-                src_settings["crop_bottom"] = crop.bottom
-                log(f"Config {config_num}: Captured crop: L{crop.left} T{crop.top} R{crop.right} B{crop.bottom}")
+                capture_initial_crop(scene_item, src_settings, config_num)
             else:
-                src_settings["source_base_width"] = 1920  # Fallback
-                src_settings["source_base_height"] = 1080  # Fallback
-                src_settings["initial_pos_x"] = 0
-                src_settings["initial_pos_y"] = 0
-                src_settings["initial_scale_x"] = 1.0
-                src_settings["initial_scale_y"] = 1.0
-                src_settings["is_initial_state_captured"] = True
+                src_settings.source_base_width = 1920  # Fallback
+                src_settings.source_base_height = 1080  # Fallback
+                src_settings.initial_pos_x = 0
+                src_settings.initial_pos_y = 0
+                src_settings.initial_scale_x = 1.0
+                src_settings.initial_scale_y = 1.0
+                src_settings.is_initial_state_captured = True
             
             # Store the scene item reference based on config number
             if config_num == 1:
@@ -4795,66 +4409,54 @@ def toggle_panning_for_config(pressed, config, src_settings, current_scene_item,
             else:
                 g_current_scene_item2 = scene_item
         
-        log(f"Config {config_num}: Panning ENABLED for: {target_source_name}")
+        log("Config %d: Panning ENABLED for: %s", config_num, target_source_name)
     else:
         log(f"Config {config_num}: Disabling panning...")
         
         # Disable any ongoing zoom transition
-        src_settings["is_transitioning"] = False
-        config["zoom_enabled"] = False
+        src_settings.is_transitioning = False
+        config.zoom_enabled = False
         
         # Restore original position if we have the data and a valid scene item
         current_scene_item = g_current_scene_item1 if config_num == 1 else g_current_scene_item2
-        if src_settings["is_initial_state_captured"] and current_scene_item:
+        if src_settings.is_initial_state_captured and current_scene_item:
             try:
                 # Restore original position and scale
                 set_item_transform(
                     current_scene_item,
-                    src_settings["initial_pos_x"],
-                    src_settings["initial_pos_y"],
-                    src_settings["initial_scale_x"],
-                    src_settings["initial_scale_y"]
+                    src_settings.initial_pos_x,
+                    src_settings.initial_pos_y,
+                    src_settings.initial_scale_x,
+                    src_settings.initial_scale_y
                 )
                 log(f"Config {config_num}: Restored position and scale to initial values")
                 
                 # Ensure CENTER alignment is maintained when panning is turned off
-                if not isinstance(current_scene_item, dict):  # If it's a standard scene item
-                    # Define OBS alignment constants
-                    OBS_ALIGN_CENTER = 0  # This appears to be incorrect in our implementation
-                    
-                    # Try to get the constants from the obs module if available
-                    try:
-                        # These constants may be directly available in the obs module
-                        if hasattr(obs, "OBS_ALIGN_CENTER"):
-                            OBS_ALIGN_CENTER = obs.OBS_ALIGN_CENTER
-                        else:
-                            # If not directly available, these are the typical values
-                            OBS_ALIGN_CENTER = 0x0010
-                        log(f"Config {config_num}: Using OBS_ALIGN_CENTER value: {OBS_ALIGN_CENTER}")
-                    except Exception as e:
-                        log_error(f"Config {config_num}: Error getting alignment constants: {e}, using default value 0x0010")
-                        OBS_ALIGN_CENTER = 0x0010
-                    
+                if type(current_scene_item) is not DirectSourceItem:  # If it's a standard scene item
                     current_alignment = obs.obs_sceneitem_get_alignment(current_scene_item)
-                    if current_alignment != OBS_ALIGN_CENTER:
-                        log(f"Config {config_num}: Maintaining CENTER alignment (was {current_alignment}, using value {OBS_ALIGN_CENTER})")
-                        obs.obs_sceneitem_set_alignment(current_scene_item, OBS_ALIGN_CENTER)
+                    if current_alignment != ALIGN_CENTER:
+                        log(f"Config {config_num}: Maintaining CENTER alignment (was {current_alignment}, using value {ALIGN_CENTER})")
+                        obs.obs_sceneitem_set_alignment(current_scene_item, ALIGN_CENTER)
                     
                     # Center the source on screen (center to viewport)
-                    if src_settings["viewport_width"] > 0 and src_settings["viewport_height"] > 0:
-                        center_x = src_settings["viewport_scene_center_x"]
-                        center_y = src_settings["viewport_scene_center_y"]
-                        set_item_transform(current_scene_item, center_x, center_y)
-                        log(f"Config {config_num}: Centered source on screen at ({center_x:.1f}, {center_y:.1f})")
+                    if src_settings.viewport_width > 0 and src_settings.viewport_height > 0:
+                        center_x = src_settings.viewport_scene_center_x
+                        center_y = src_settings.viewport_scene_center_y
+                        # Skip the write (and the scene re-render it triggers) when already centered
+                        current_pos = g_scratch_pos
+                        obs.obs_sceneitem_get_pos(current_scene_item, current_pos)
+                        if abs(current_pos.x - center_x) > CENTER_POSITION_EPSILON or abs(current_pos.y - center_y) > CENTER_POSITION_EPSILON:
+                            set_item_transform(current_scene_item, center_x, center_y)
+                            log("Config %d: Centered source on screen at (%.1f, %.1f)", config_num, center_x, center_y)
             except Exception as e:
                 log_error(f"Config {config_num}: Error restoring position: {e}")
         
         # Make local copies of references before clearing them
         scene_item_to_release = None
-        if current_scene_item and not isinstance(current_scene_item, dict):
+        if current_scene_item and type(current_scene_item) is not DirectSourceItem:
             scene_item_to_release = current_scene_item
         
-        direct_source_to_release = config.get("direct_source_cache")
+        direct_source_to_release = config.direct_source_cache
         
         # Clear all references BEFORE releasing them
         if config_num == 1:
@@ -4862,47 +4464,14 @@ def toggle_panning_for_config(pressed, config, src_settings, current_scene_item,
         else:
             g_current_scene_item2 = None
             
-        config["direct_source_cache"] = None
-        config["direct_mode"] = False
+        config.direct_source_cache = None
+        config.direct_mode = False
         
         # Now release the resources from our local copies
-        if scene_item_to_release:
-            try:
-                obs.obs_sceneitem_release(scene_item_to_release)
-                log(f"Config {config_num}: Released scene item")
-            except Exception as e:
-                log_error(f"Config {config_num}: Error releasing scene item: {e}")
+        release_item_and_source(scene_item_to_release, direct_source_to_release, f"Config {config_num}: ")
         
-        if direct_source_to_release:
-            try:
-                obs.obs_source_release(direct_source_to_release)
-                log(f"Config {config_num}: Released direct source")
-            except Exception as e:
-                log_error(f"Config {config_num}: Error releasing direct source: {e}")
-        
-        # Reset all state variables to defaults
-        src_settings["viewport_width"] = 0
-        src_settings["viewport_height"] = 0
-        src_settings["viewport_scene_center_x"] = 0
-        src_settings["viewport_scene_center_y"] = 0
-        src_settings["source_base_width"] = 0
-        src_settings["source_base_height"] = 0
-        src_settings["initial_pos_x"] = 0
-        src_settings["initial_pos_y"] = 0
-        src_settings["initial_scale_x"] = 1.0
-        src_settings["initial_scale_y"] = 1.0
-        src_settings["is_initial_state_captured"] = False
-        src_settings["crop_left"] = 0 # Reset crop
-        src_settings["crop_top"] = 0
-        src_settings["crop_right"] = 0
-        src_settings["crop_bottom"] = 0
-        
-        # Force garbage collection
-        try:
-            import gc
-            gc.collect()
-        except Exception as e:
-            log_error(f"Config {config_num}: Error during garbage collection: {e}")
+        # Reset the captured viewport/initial-state values to defaults
+        src_settings.reset_captured_state()
         
         log(f"Config {config_num}: Panning DISABLED - All resources released")
 
@@ -4924,117 +4493,149 @@ def toggle_zooming_for_config(pressed, config, src_settings, current_scene_item,
     # This ensures we're always using the latest values
     
     # Check if this config is enabled
-    config_enabled = obs.obs_data_get_bool(script_settings, f"config{config_num}_enabled")
-    config["enabled"] = config_enabled  # Update in-memory config
+    keys = CONFIG_SETTING_KEYS[config_num]
+    config_enabled = obs.obs_data_get_bool(script_settings, keys["enabled"])
+    config.enabled = config_enabled  # Update in-memory config
     
     if not config_enabled:
         log(f"Config {config_num}: Cannot toggle zooming: Config is disabled")
         return
         
-    # Update zoom settings
-    zoom_level = obs.obs_data_get_double(script_settings, f"config{config_num}_zoom_level")
-    config["zoom_level"] = max(1.0, min(5.0, zoom_level))
+    # Update zoom settings (kept in locals for the transition set-up below)
+    zoom_level = config.zoom_level = max(1.0, min(5.0, obs.obs_data_get_double(script_settings, keys["zoom_level"])))
     
     # Update transition durations
-    zoom_in_duration = obs.obs_data_get_double(script_settings, f"config{config_num}_zoom_in_duration")
-    config["zoom_in_duration"] = max(0.0, min(1.0, zoom_in_duration))
-    
-    zoom_out_duration = obs.obs_data_get_double(script_settings, f"config{config_num}_zoom_out_duration")
-    config["zoom_out_duration"] = max(0.0, min(1.0, zoom_out_duration))
+    zoom_in_duration = config.zoom_in_duration = max(0.0, min(1.0, obs.obs_data_get_double(script_settings, keys["zoom_in_duration"])))
+    zoom_out_duration = config.zoom_out_duration = max(0.0, min(1.0, obs.obs_data_get_double(script_settings, keys["zoom_out_duration"])))
     
     # Update offset values
-    config["offset_x"] = obs.obs_data_get_int(script_settings, f"config{config_num}_offset_x")
-    config["offset_y"] = obs.obs_data_get_int(script_settings, f"config{config_num}_offset_y")
+    config.offset_x = obs.obs_data_get_int(script_settings, keys["offset_x"])
+    config.offset_y = obs.obs_data_get_int(script_settings, keys["offset_y"])
     
     # Check if panning is enabled (required for zooming)
-    if not config.get("pan_enabled", False):
+    if not config.pan_enabled:
         log(f"Config {config_num}: Cannot toggle zooming: Panning must be enabled first")
         return
     
-    if src_settings["viewport_width"] <= 0 or src_settings["viewport_height"] <= 0:
+    if src_settings.viewport_width <= 0 or src_settings.viewport_height <= 0:
         log(f"Config {config_num}: Cannot toggle zooming: Viewport not set properly.")
         return
     
     # Toggle zoom state
-    new_zoom_enabled = not config.get("zoom_enabled", False)
-    config["zoom_enabled"] = new_zoom_enabled
-    
-    # Get current scene item based on config number
-    scene_item = current_scene_item
+    new_zoom_enabled = not config.zoom_enabled
+    config.zoom_enabled = new_zoom_enabled
     
     # Only start a transition if we have a valid scene item
-    if scene_item:
+    if current_scene_item:
+        # One clock read serves both the mid-transition zoom and the new start time
+        now = time.monotonic()
+        
         # Determine current actual zoom level (might be mid-transition)
-        current_zoom = config["zoom_level"]
+        current_zoom = zoom_level
         
         # If we're in the middle of a transition, calculate the actual current zoom level
-        if src_settings["is_transitioning"]:
-            elapsed_time = time.time() - src_settings["transition_start_time"]
-            progress = min(1.0, elapsed_time / src_settings["transition_duration"])
-            eased_progress = ease_in_out_quad(progress)
+        if src_settings.is_transitioning:
+            start_zoom = src_settings.transition_start_zoom
+            target_zoom = src_settings.transition_target_zoom
+            elapsed_time = now - src_settings.transition_start_time
+            transition_duration = src_settings.transition_duration
             
             # Get the actual current interpolated zoom level
-            start_zoom = src_settings["transition_start_zoom"]
-            target_zoom = src_settings["transition_target_zoom"]
-            current_zoom = start_zoom + (target_zoom - start_zoom) * eased_progress
+            if elapsed_time >= transition_duration:
+                current_zoom = target_zoom
+            else:
+                eased_progress = ease_in_out_quad(elapsed_time / transition_duration)
+                current_zoom = start_zoom + (target_zoom - start_zoom) * eased_progress
             
         # Set up the transition
-        src_settings["is_transitioning"] = True
-        src_settings["transition_start_time"] = time.time()
-        src_settings["transition_type"] = "zoom"
-        src_settings["transition_type"] = "zoom"
+        src_settings.is_transitioning = True
+        src_settings.transition_start_time = now
+        src_settings.transition_type = "zoom"
         
         if new_zoom_enabled:
             # Transitioning from 1.0 to zoom_level (zoom IN)
-            src_settings["transition_start_zoom"] = 1.0
-            src_settings["transition_target_zoom"] = config["zoom_level"]
-            src_settings["transition_duration"] = config["zoom_in_duration"]
-            src_settings["is_zooming_in"] = True
-            log(f"Config {config_num}: Zooming IN to {config['zoom_level']}x over {config['zoom_in_duration']}s")
+            src_settings.transition_start_zoom = 1.0
+            src_settings.transition_target_zoom = zoom_level
+            src_settings.transition_duration = zoom_in_duration
+            src_settings.is_zooming_in = True
+            log("Config %d: Zooming IN to %sx over %ss", config_num, zoom_level, zoom_in_duration)
         else:
             # Transitioning from current zoom level to 1.0 (zoom OUT)
-            src_settings["transition_start_zoom"] = current_zoom
-            src_settings["transition_target_zoom"] = 1.0
-            src_settings["transition_duration"] = config["zoom_out_duration"] 
-            src_settings["is_zooming_in"] = False
-            log(f"Config {config_num}: Zooming OUT to 1.0x over {config['zoom_out_duration']}s from current zoom {current_zoom:.2f}")
+            src_settings.transition_start_zoom = current_zoom
+            src_settings.transition_target_zoom = 1.0
+            src_settings.transition_duration = zoom_out_duration
+            src_settings.is_zooming_in = False
+            log("Config %d: Zooming OUT to 1.0x over %ss from current zoom %.2f", config_num, zoom_out_duration, current_zoom)
     else:
         log_warning(f"Config {config_num}: Cannot perform zoom transition: No valid scene item")
 
+# Update timer rate while no config is actively panning
+IDLE_UPDATE_INTERVAL_MS = 100
+g_timer_interval_ms = 0  # Interval the update timer is registered with (0 = not registered)
+
+# (Re)register the update timer at the rate the current activity needs
+def update_timer_rate():
+    """Run the update timer at the configured FPS while any config is panning, otherwise at the idle rate"""
+    global g_timer_interval_ms
+    if g_script_unloading or g_obs_shutting_down:
+        return
+    
+    if (config1.enabled and config1.pan_enabled) or (config2.enabled and config2.pan_enabled):
+        interval_ms = global_settings["update_interval_ms"]
+    else:
+        interval_ms = IDLE_UPDATE_INTERVAL_MS
+    
+    if interval_ms == g_timer_interval_ms:
+        return
+    try:
+        if g_timer_interval_ms:
+            obs.timer_remove(update_pan_and_zoom)
+        obs.timer_add(update_pan_and_zoom, interval_ms)
+        g_timer_interval_ms = interval_ms
+        log("Update timer interval set to %dms.", interval_ms)
+    except Exception as e:
+        log_error(f"Error updating timer interval: {e}")
+
 # Main update function called by OBS timer
 def update_pan_and_zoom():
     """Master update function that updates both configs"""
     global g_current_scene_item1, g_current_scene_item2
     
     # Update config 1 if enabled
-    if config1.get("enabled", False):
+    if config1.enabled:
         update_pan_and_zoom_for_config(config1, source_settings1, g_current_scene_item1)
     
     # Update config 2 if enabled
-    if config2.get("enabled", False):
+    if config2.enabled:
         update_pan_and_zoom_for_config(config2, source_settings2, g_current_scene_item2)
 
 
+# Refresh both configs' caches, enumerating a shared target scene only once
+def refresh_caches_for_both_configs():
+    """Refresh source and viewport caches for config 1 and config 2"""
+    refresh_caches_for_config(config1)
+    if config1.target_scene_name and (config2.target_scene_name, config2.target_scene_uuid) == (
+            config1.target_scene_name, config1.target_scene_uuid):
+        config2.source_cache = list(config1.source_cache)
+        config2.viewport_cache = list(config1.viewport_cache)
+    else:
+        refresh_caches_for_config(config2)
+
 # Helper function to refresh source/viewport caches for a specific config
 def refresh_caches_for_config(target_config):
     """Refresh source and viewport caches for a given configuration object"""
     try:
-        target_config["source_cache"] = [] # Initialize/clear caches
-        target_config["viewport_cache"] = []
+        target_config.source_cache = [] # Initialize/clear caches
+        target_config.viewport_cache = []
 
-        selected_scene_name = target_config.get("target_scene_name", "")
-        selected_scene_uuid = target_config.get("target_scene_uuid", "")
+        selected_scene_name = target_config.target_scene_name
+        selected_scene_uuid = target_config.target_scene_uuid
         config_id_for_log = "Config1" if target_config is config1 else "Config2"
 
         if not selected_scene_name:
             return # Nothing to cache if no scene is selected
 
-        scene_source = None
-        if selected_scene_uuid:
-            scene_source = find_source_by_uuid(selected_scene_uuid)
-        
-        if not scene_source and selected_scene_name: # Fallback to name if UUID fails or not present
-            scene_source = obs.obs_get_source_by_name(selected_scene_name)
+        scene_source = get_scene_source(selected_scene_name, selected_scene_uuid) # Falls back to the name if the UUID fails
             
         if not scene_source:
             log_warning(f"Scene '{selected_scene_name}' not found for {config_id_for_log}. Caches will be empty.")
@@ -5072,8 +4673,8 @@ def refresh_caches_for_config(target_config):
                         viewport_cache.append({"name": source_name, "value": composite_value})
                 obs.sceneitem_list_release(items)
             
-            target_config["source_cache"] = source_cache
-            target_config["viewport_cache"] = viewport_cache
+            target_config.source_cache = source_cache
+            target_config.viewport_cache = viewport_cache
         else:
             log_warning(f"Could not get scene object from source '{selected_scene_name}' for {config_id_for_log}.")
         
@@ -5083,5 +4684,5 @@ def refresh_caches_for_config(target_config):
         config_id_for_log_exc = "Config1" if target_config is config1 else "Config2"
         log_error(f"Error in refresh_caches_for_config for {config_id_for_log_exc}: {e}\n{traceback.format_exc()}")
         # Ensure caches are at least empty lists on error
-        target_config["source_cache"] = [] 
-        target_config["viewport_cache"] = []
\ No newline at end of file
+        target_config.source_cache = [] 
+        target_config.viewport_cache = []
\ No newline at end of file